@@ -73,6 +73,9 @@ class GAFFERIMAGE_API DeepState : public ImageProcessor
 		Gaffer::FloatPlug *occludedThresholdPlug();
 		const Gaffer::FloatPlug *occludedThresholdPlug() const;
 
+		Gaffer::FloatPlug *mergeTolerancePlug();
+		const Gaffer::FloatPlug *mergeTolerancePlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 	protected :
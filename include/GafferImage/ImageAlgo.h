@@ -39,9 +39,11 @@
 #include "IECoreImage/ImagePrimitive.h"
 
 #include "GafferImage/Export.h"
+#include "GafferImage/Sampler.h"
 
 #include "Gaffer/Context.h"
 
+#include "IECore/CompoundData.h"
 #include "IECore/CompoundObject.h"
 #include "IECore/Export.h"
 
@@ -200,6 +202,27 @@ GAFFERIMAGE_API IECore::MurmurHash imageHash( const ImagePlug *imagePlug, const
 /// image() method above, it works on deep images.
 GAFFERIMAGE_API IECore::ConstCompoundObjectPtr tiles( const ImagePlug *imagePlug, const std::string *viewName = nullptr );
 
+/// Copies the pixels for `channelNames` within `window` into `buffer`,
+/// which must have room for `window.size().x * window.size().y * channelNames.size()`
+/// floats. Channels are interleaved, and rows are ordered from the top of
+/// the window to the bottom, matching the convention used by `image()`.
+/// Tiles are copied in parallel, directly from the cached channel data.
+/// Pixels outside the data window and missing channels are filled with zeroes.
+/// If the view is not specified, it must be set in the current Context.
+GAFFERIMAGE_API void copyPixels( const ImagePlug *imagePlug, const std::vector<std::string> &channelNames, const Imath::Box2i &window, float *buffer, const std::string *viewName = nullptr );
+
+/// Sampling Utils
+/// ==============================
+
+/// Samples the specified channels at each of `positions`, returning a
+/// CompoundData containing a FloatVectorData per channel. Positions are
+/// grouped by tile and the groups are sampled in parallel, so this is much
+/// more efficient than using a Sampler or ImageSampler per position. Results
+/// are identical to `Sampler::sample( float, float )`, or when `interpolate`
+/// is false, to `Sampler::sample( int, int )` with the positions rounded down.
+/// Missing channels are returned as zeroes.
+GAFFERIMAGE_API IECore::CompoundDataPtr samplePixels( const ImagePlug *imagePlug, const std::vector<std::string> &channelNames, const std::vector<Imath::V2f> &positions, bool interpolate = true, Sampler::BoundingMode boundingMode = Sampler::Black );
+
 /// Deep Utils
 /// ==============================
 
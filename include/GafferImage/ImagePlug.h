@@ -255,6 +255,12 @@ class GAFFERIMAGE_API ImagePlug : public Gaffer::ValuePlug
 		static const IECore::FloatVectorData *emptyTile();
 		static const IECore::FloatVectorData *blackTile();
 		static const IECore::FloatVectorData *whiteTile();
+		/// Returns a tile with every pixel set to `value`. Returns `blackTile()`
+		/// for 0 and `whiteTile()` for 1, so that processors which recognise those
+		/// tiles can optimise accordingly. Other values are shared between all
+		/// callers, so that constant tiles need only be stored once, no matter how
+		/// many nodes or contexts generate them.
+		static IECore::ConstFloatVectorDataPtr constantTile( float value );
 
 		static constexpr int tileSize() { return 1 << tileSizeLog2(); };
 		static constexpr int tilePixels() { return tileSize() * tileSize(); };
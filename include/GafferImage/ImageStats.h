@@ -106,6 +106,12 @@ class GAFFERIMAGE_API ImageStats : public Gaffer::ComputeNode
 		Gaffer::ObjectPlug *tileStatsPlug();
 		const Gaffer::ObjectPlug *tileStatsPlug() const;
 
+		// Combined stats for the tiles in a single row, so that
+		// a localised change only requires a single row to be
+		// recombined.
+		Gaffer::ObjectPlug *rowStatsPlug();
+		const Gaffer::ObjectPlug *rowStatsPlug() const;
+
 		// Combined stats, before they get broken out into 3 seperate plugs
 		Gaffer::ObjectPlug *allStatsPlug();
 		const Gaffer::ObjectPlug *allStatsPlug() const;
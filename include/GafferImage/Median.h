@@ -51,6 +51,23 @@ class GAFFERIMAGE_API Median : public RankFilter
 
 		GAFFER_NODE_DECLARE_TYPE( GafferImage::Median, MedianTypeId, RankFilter );
 
+		enum Algorithm
+		{
+			Sort = 0,
+			Histogram = 1
+		};
+
+		Gaffer::IntPlug *algorithmPlug();
+		const Gaffer::IntPlug *algorithmPlug() const;
+
+	protected :
+
+		bool useHistogramMedian() const override;
+
+	private :
+
+		static size_t g_firstPlugIndex;
+
 };
 
 IE_CORE_DECLAREPTR( Median );
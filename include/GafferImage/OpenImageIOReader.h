@@ -125,6 +125,9 @@ class GAFFERIMAGE_API OpenImageIOReader : public ImageNode
 		Gaffer::ObjectVectorPlug *tileBatchPlug();
 		const Gaffer::ObjectVectorPlug *tileBatchPlug() const;
 
+		Gaffer::FloatVectorDataPlug *tilePlug();
+		const Gaffer::FloatVectorDataPlug *tilePlug() const;
+
 		void hashFileName( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 
 		void plugSet( Gaffer::Plug *plug );
@@ -88,6 +88,12 @@ class GAFFERIMAGE_API RankFilter : public FlatImageProcessor
 		void hashChannelData( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		IECore::ConstFloatVectorDataPtr computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const override;
 
+		/// May be overridden by derived classes to compute the median using
+		/// sliding histograms rather than sorted rows. This must give identical
+		/// results, so the return value is not included in any hashes. Called
+		/// from within compute, with the appropriate context current.
+		virtual bool useHistogramMedian() const;
+
 	private:
 
 		// This private plug stores an offset for each pixel to where the rank is located
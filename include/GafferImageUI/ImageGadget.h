@@ -135,6 +135,18 @@ class GAFFERIMAGEUI_API ImageGadget : public GafferUI::Gadget
 		void setPaused( bool paused );
 		bool getPaused() const;
 
+		/// Computes the displayed channels for the specified frames on a
+		/// background thread, so that they are already in the compute cache
+		/// by the time they are displayed. This is intended to be driven by
+		/// playback, with the frames listed in the order they will be shown.
+		/// If the new list continues on from the previous one, as it does when
+		/// advancing through playback, prefetching continues uninterrupted.
+		/// Otherwise the previous prefetch is cancelled, and an empty list cancels
+		/// prefetching entirely. No prefetching is performed while paused or
+		/// hidden.
+		void setPrefetchFrames( const std::vector<float> &frames );
+		const std::vector<float> &getPrefetchFrames() const;
+
 		static uint64_t tileUpdateCount();
 		static void resetTileUpdateCount();
 
@@ -333,6 +345,21 @@ class GAFFERIMAGEUI_API ImageGadget : public GafferUI::Gadget
 		std::unique_ptr<Gaffer::BackgroundTask> m_tilesTask;
 		std::atomic_bool m_renderRequestPending;
 
+		// Prefetching. We compute upcoming frames on a separate
+		// background task, so that they don't hold up the display
+		// of the current frame.
+
+		// Restarts prefetching from scratch, cancelling any previous task.
+		void updatePrefetch();
+		void startPrefetchTask();
+
+		// Frames remaining to be prefetched, shared with the background task
+		// so that the list can be extended without cancelling the task.
+		struct PrefetchQueue;
+		std::vector<float> m_prefetchFrames;
+		std::shared_ptr<PrefetchQueue> m_prefetchQueue;
+		std::unique_ptr<Gaffer::BackgroundTask> m_prefetchTask;
+
 		// Rendering.
 
 		void visibilityChanged();
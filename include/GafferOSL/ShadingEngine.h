@@ -89,11 +89,31 @@ class GAFFEROSL_API ShadingEngine : public IECore::RefCounted
 		/// Append a unique hash representing this shading engine to `h`.
 		void hash( IECore::MurmurHash &h ) const;
 		IECore::CompoundDataPtr shade( const IECore::CompoundData *points, const Transforms &transforms = Transforms() ) const;
-		IECore::CompoundDataPtr shade( const IECore::CompoundData *points, const Transforms &transforms, const PointClouds &pointClouds ) const;
+		/// If `outputCi` is false, the "Ci" result is neither accumulated nor
+		/// returned. This saves memory for clients which only use the results
+		/// of `debug()` closures.
+		IECore::CompoundDataPtr shade( const IECore::CompoundData *points, const Transforms &transforms, const PointClouds &pointClouds, bool outputCi = true ) const;
 
 		bool needsAttribute( const std::string &name ) const;
 		bool hasDeformation() const;
 
+		/// @name Shader group cache
+		/// The OSL shader groups used for shading are shared between all
+		/// ShadingEngines with identical networks, so that each group is only
+		/// optimised once. These functions allow for management of the cache.
+		////////////////////////////////////////////////////////////////////
+		//@{
+		/// Returns the maximum number of shader groups to keep in the cache.
+		static size_t getShaderGroupCacheSizeLimit();
+		/// Sets the maximum number of shader groups to keep in the cache.
+		static void setShaderGroupCacheSizeLimit( size_t maxEntries );
+		/// Returns the number of shader groups currently in the cache.
+		static size_t shaderGroupCacheUsage();
+		/// Clears the cache. Groups in use by existing ShadingEngines
+		/// remain valid.
+		static void clearShaderGroupCache();
+		//@}
+
 	private :
 
 		void queryShaderGroup();
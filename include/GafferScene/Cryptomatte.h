@@ -40,6 +40,7 @@
 
 #include "GafferImage/FlatImageProcessor.h"
 
+#include "Gaffer/CompoundDataPlug.h"
 #include "Gaffer/StringPlug.h"
 #include "Gaffer/TypedObjectPlug.h"
 
@@ -83,6 +84,9 @@ class GAFFERSCENE_API Cryptomatte : public GafferImage::FlatImageProcessor
 
 		Gaffer::StringPlug *outputChannelPlug();
 		const Gaffer::StringPlug *outputChannelPlug() const;
+
+		Gaffer::CompoundDataPlug *mattesPlug();
+		const Gaffer::CompoundDataPlug *mattesPlug() const;
 		//@}
 
 		void affects(const Gaffer::Plug *input, AffectedPlugsContainer &outputs) const override;
@@ -117,6 +121,15 @@ class GAFFERSCENE_API Cryptomatte : public GafferImage::FlatImageProcessor
 		Gaffer::FloatVectorDataPlug *matteChannelDataPlug();
 		const Gaffer::FloatVectorDataPlug *matteChannelDataPlug() const;
 
+		Gaffer::StringVectorDataPlug *matteChannelsPlug();
+		const Gaffer::StringVectorDataPlug *matteChannelsPlug() const;
+
+		Gaffer::CompoundObjectPlug *matteIndexPlug();
+		const Gaffer::CompoundObjectPlug *matteIndexPlug() const;
+
+		Gaffer::ObjectVectorPlug *mattesChannelDataPlug();
+		const Gaffer::ObjectVectorPlug *mattesChannelDataPlug() const;
+
 		static size_t g_firstPlugIndex;
 };
 
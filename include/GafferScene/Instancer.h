@@ -150,6 +150,9 @@ class GAFFERSCENE_API Instancer : public BranchCreator
 		Gaffer::BoolPlug *encapsulatePlug();
 		const Gaffer::BoolPlug *encapsulatePlug() const;
 
+		Gaffer::FloatPlug *chunkSizePlug();
+		const Gaffer::FloatPlug *chunkSizePlug() const;
+
 		Gaffer::BoolPlug *seedEnabledPlug();
 		const Gaffer::BoolPlug *seedEnabledPlug() const;
 
@@ -257,6 +260,11 @@ class GAFFERSCENE_API Instancer : public BranchCreator
 		ConstEngineSplitPrototypesDataPtr engineSplitPrototypes( const ScenePath &sourcePath, const Gaffer::Context *context ) const;
 		void engineSplitPrototypesHash( const ScenePath &sourcePath, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 
+		// Returns the size of the branch paths to the instance locations, which
+		// is increased when instances are grouped into chunks. Callers which have
+		// already fetched the engine should use `EngineData::instanceDepth()` instead.
+		size_t instanceDepth( const ScenePath &sourcePath, const Gaffer::Context *context ) const;
+
 		struct PrototypeScope : public Gaffer::Context::EditableScope
 		{
 			PrototypeScope( const Gaffer::ObjectPlug *enginePlug, const Gaffer::Context *context, const ScenePath *parentPath, const ScenePath *branchPath );
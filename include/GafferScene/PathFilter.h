@@ -60,6 +60,12 @@ class GAFFERSCENE_API PathFilter : public Filter
 		FilterPlug *rootsPlug();
 		const FilterPlug *rootsPlug() const;
 
+		/// Returns the PathMatcher used for matching, provided that it is
+		/// constant, and that `rootsPlug()` is not in use. Otherwise returns
+		/// `nullptr`, and the filter must be evaluated at each location via
+		/// `outPlug()`. Note that this does not account for `enabledPlug()`.
+		IECore::ConstPathMatcherDataPtr constantPathMatcher() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 	protected :
@@ -71,10 +71,16 @@ class GAFFERSCENE_API PrimitiveSampler : public Deformer
 		Gaffer::StringPlug *statusPlug();
 		const Gaffer::StringPlug *statusPlug() const;
 
+		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
+
 	protected :
 
 		explicit PrimitiveSampler( const std::string &name = defaultName<PrimitiveSampler>() );
 
+		void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
+		void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const override;
+		Gaffer::ValuePlug::CachePolicy computeCachePolicy( const Gaffer::ValuePlug *output ) const override;
+
 		/// SamplingFunction
 		/// ================
 		///
@@ -115,6 +121,13 @@ class GAFFERSCENE_API PrimitiveSampler : public Deformer
 
 	private :
 
+		// Used to compute a PrimitiveEvaluator for the source object, evaluated
+		// with `scene:path` set to the source location. The hash depends only on
+		// the source object, so the evaluator is shared via the compute cache
+		// by all locations and all samplers using the same source.
+		Gaffer::ObjectPlug *sourceEvaluatorPlug();
+		const Gaffer::ObjectPlug *sourceEvaluatorPlug() const;
+
 		bool affectsProcessedObject( const Gaffer::Plug *input ) const final;
 		void hashProcessedObject( const ScenePath &path, const Gaffer::Context *context, IECore::MurmurHash &h ) const final;
 		IECore::ConstObjectPtr computeProcessedObject( const ScenePath &path, const Gaffer::Context *context, const IECore::Object *inputObject ) const final;
@@ -187,6 +187,46 @@ IECore::PathMatcher findAll( const ScenePlug *scene, Predicate &&predicate, cons
 /// returns locations where the attribute has that value.
 GAFFERSCENE_API IECore::PathMatcher findAllWithAttribute( const ScenePlug *scene, IECore::InternedString name, const IECore::Object *value = nullptr, const ScenePlug::ScenePath &root = ScenePlug::ScenePath() );
 
+/// Hierarchy
+/// =========
+
+/// A compact snapshot of the hierarchy below a location, storing only the
+/// names of locations and the relationships between them. Locations are
+/// stored in breadth-first order, so that every parent precedes its children,
+/// and the children of each parent are stored contiguously in `childNames`
+/// order. The first location is always the root of the snapshot.
+struct GAFFERSCENE_API Hierarchy : public IECore::RefCounted
+{
+	IE_CORE_DECLAREMEMBERPTR( Hierarchy )
+
+	/// The full path to the root of the snapshot.
+	ScenePlug::ScenePath root;
+	/// The name of each location. For the root, this is the last
+	/// element of `root`, or empty if `root` is `/`.
+	std::vector<IECore::InternedString> names;
+	/// The index of the parent of each location, or -1 for the root.
+	std::vector<int64_t> parents;
+	/// The children of location `i` are the locations in the range
+	/// `[ childOffsets[i], childOffsets[i+1] )`.
+	std::vector<size_t> childOffsets;
+
+	size_t size() const { return names.size(); }
+	/// Returns the full path to the location with the specified index.
+	ScenePlug::ScenePath path( size_t index ) const;
+	/// Returns the index of the location at `path`, or -1 if it is
+	/// not in the snapshot. Children are stored in `childNames` order
+	/// rather than sorted, so this performs a linear search of the children
+	/// at each level of `path`. The cost is therefore proportional to the
+	/// total number of siblings along the path. Clients performing many
+	/// lookups in a wide hierarchy should build their own index.
+	int64_t find( const ScenePlug::ScenePath &path ) const;
+};
+
+/// Returns a snapshot of the hierarchy below `root`, computing only `childNames`.
+/// This is considerably cheaper than using `parallelTraverse()` when only
+/// the structure of the scene is needed.
+GAFFERSCENE_API Hierarchy::Ptr hierarchy( const ScenePlug *scene, const ScenePlug::ScenePath &root = ScenePlug::ScenePath() );
+
 /// Globals
 /// =======
 
@@ -50,6 +50,11 @@ namespace GafferScene
 namespace Detail
 {
 
+/// Returns a PathMatcher that is equivalent to evaluating `filterPlug` at every
+/// location, if one is available without needing to do so. Returns `nullptr`
+/// otherwise.
+GAFFERSCENE_API IECore::ConstPathMatcherDataPtr constantPathMatcher( const FilterPlug *filterPlug );
+
 template<typename ThreadableFunctor>
 void parallelProcessLocationsWalk( const GafferScene::ScenePlug *scene, const Gaffer::ThreadState &threadState, const ScenePlug::ScenePath &path, ThreadableFunctor &f, tbb::task_group_context &taskGroupContext )
 {
@@ -174,6 +179,14 @@ void parallelTraverse( const ScenePlug *scene, ThreadableFunctor &f, const Scene
 template <class ThreadableFunctor>
 void filteredParallelTraverse( const ScenePlug *scene, const GafferScene::FilterPlug *filterPlug, ThreadableFunctor &f, const ScenePlug::ScenePath &root )
 {
+	if( IECore::ConstPathMatcherDataPtr pathMatcher = Detail::constantPathMatcher( filterPlug ) )
+	{
+		// Fast path, matching directly against the PathMatcher rather
+		// than evaluating the filter at every location.
+		filteredParallelTraverse( scene, pathMatcher->readable(), f, root );
+		return;
+	}
+
 	Detail::ThreadableFilteredFunctor<ThreadableFunctor> ff( f, filterPlug );
 	parallelTraverse( scene, ff, root );
 }
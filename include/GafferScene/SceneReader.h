@@ -63,6 +63,21 @@ class GAFFERSCENE_API SceneReader : public SceneNode
 
 		GAFFER_NODE_DECLARE_TYPE( GafferScene::SceneReader, SceneReaderTypeId, SceneNode )
 
+		enum ObjectMode
+		{
+			/// Objects are loaded in full.
+			Full,
+			/// Objects are replaced by box meshes matching the bounds stored
+			/// in the file, so the objects themselves are never loaded. This
+			/// only applies to leaf locations, because the stored bounds of
+			/// other locations include their descendants, and never applies
+			/// to members of the `__cameras` and `__lights` sets.
+			Bound,
+			/// As for `Bound` when the `scene:renderer` context variable is
+			/// "OpenGL" (as it is for the Viewer), and `Full` otherwise.
+			BoundInViewer
+		};
+
 		/// Holds the name of the file to be loaded.
 		Gaffer::StringPlug *fileNamePlug();
 		const Gaffer::StringPlug *fileNamePlug() const;
@@ -77,6 +92,9 @@ class GAFFERSCENE_API SceneReader : public SceneNode
 		Gaffer::TransformPlug *transformPlug();
 		const Gaffer::TransformPlug *transformPlug() const;
 
+		Gaffer::IntPlug *objectModePlug();
+		const Gaffer::IntPlug *objectModePlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 		static size_t supportedExtensions( std::vector<std::string> &extensions );
@@ -112,6 +130,10 @@ class GAFFERSCENE_API SceneReader : public SceneNode
 
 		void plugSet( Gaffer::Plug *plug );
 
+		// Returns true if the object at `path` should be replaced by a
+		// bounding box placeholder in the current context.
+		bool boundPlaceholder( const ScenePath &path, const IECoreScene::SceneInterface *s, const Gaffer::Context *context, const ScenePlug *parent ) const;
+
 		// The typical access patterns for the SceneReader include accessing
 		// the same file repeatedly, and also the same path within the file
 		// repeatedly (to hash a value then compute it for instance, or to get
@@ -141,6 +163,9 @@ class GAFFERSCENE_API SceneReader : public SceneNode
 		// fall back to the tags API for legacy SceneInterfaces.
 		friend class SceneWriter;
 		static bool useSetsAPI( const IECoreScene::SceneInterface *scene );
+		// Root attribute used by SceneWriter to store a hash of the scene
+		// it wrote. This is internal, so we don't load it.
+		static const IECore::InternedString g_sceneWriterHashAttributeName;
 
 };
 
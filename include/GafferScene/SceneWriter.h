@@ -68,6 +68,15 @@ class GAFFERSCENE_API SceneWriter : public GafferDispatch::TaskNode
 		ScenePlug *outPlug();
 		const ScenePlug *outPlug() const;
 
+		/// When on, a hash of the scene is stored in each file written, and
+		/// files whose stored hash matches the current scene are not rewritten.
+		/// Note that scene hashes don't include the contents of external files
+		/// read by the scene, so changes to those files are not detected unless
+		/// they are also reflected in the node graph (for instance by incrementing
+		/// `SceneReader::refreshCountPlug()`).
+		Gaffer::BoolPlug *skipUnchangedPlug();
+		const Gaffer::BoolPlug *skipUnchangedPlug() const;
+
 		IECore::MurmurHash hash( const Gaffer::Context *context ) const override;
 
 	protected :
@@ -84,6 +93,7 @@ class GAFFERSCENE_API SceneWriter : public GafferDispatch::TaskNode
 	private :
 
 		void createDirectories( const std::string &fileName ) const;
+		void writeFile( const ScenePlug *scene, const std::string &fileName, const std::vector<float> &frames, const IECore::MurmurHash &fileHash ) const;
 
 		static size_t g_firstPlugIndex;
 
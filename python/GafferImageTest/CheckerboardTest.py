@@ -75,6 +75,31 @@ class CheckerboardTest( GafferImageTest.ImageTestCase ) :
 		h2 = c["out"].channelData( "R", imath.V2i( 0 ) ).hash()
 		self.assertEqual( h1, h2 )
 
+	def testConstantChannels( self ) :
+
+		c = GafferImage.Checkerboard()
+		c["colorA"].setValue( imath.Color4f( 0.1, 0.2, 0.3, 1 ) )
+		c["colorB"].setValue( imath.Color4f( 0.5, 0.2, 0.3, 1 ) )
+
+		# Channels where both colours match are constant, so every tile
+		# is identical and needn't be stored separately.
+
+		for channelName in [ "G", "B", "A" ] :
+			self.assertEqual(
+				c["out"].channelDataHash( channelName, imath.V2i( 0 ) ),
+				c["out"].channelDataHash( channelName, imath.V2i( GafferImage.ImagePlug.tileSize() ) )
+			)
+			self.assertTrue(
+				c["out"].channelData( channelName, imath.V2i( 0 ), _copy = False ).isSame(
+					GafferImage.ImagePlug.constantTile( c["colorA"][channelName[0].lower()].getValue(), _copy = False )
+				)
+			)
+
+		self.assertNotEqual(
+			c["out"].channelDataHash( "R", imath.V2i( 0 ) ),
+			c["out"].channelDataHash( "R", imath.V2i( GafferImage.ImagePlug.tileSize() ) )
+		)
+
 	def testEnableBehaviour( self ) :
 
 		c = GafferImage.Checkerboard()
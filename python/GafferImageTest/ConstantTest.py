@@ -82,6 +82,25 @@ class ConstantTest( GafferImageTest.ImageTestCase ) :
 				else :
 					self.assertEqual( h1[j], h2[j] )
 
+	def testTilesShareMemory( self ) :
+
+		constant1 = GafferImage.Constant()
+		constant1["color"].setValue( imath.Color4f( 0.25, 0.5, 0, 1 ) )
+
+		constant2 = GafferImage.Constant()
+		constant2["color"].setValue( imath.Color4f( 0.25, 0.75, 0, 1 ) )
+
+		def tile( constant, channelName ) :
+			return constant["out"].channelData( channelName, imath.V2i( 0 ), _copy = False )
+
+		# Tiles with the same value are shared, even between nodes.
+		self.assertTrue( tile( constant1, "R" ).isSame( tile( constant2, "R" ) ) )
+		self.assertFalse( tile( constant1, "G" ).isSame( tile( constant2, "G" ) ) )
+		# And black and white tiles are the standard ones, so downstream
+		# nodes can optimise for them.
+		self.assertTrue( tile( constant1, "B" ).isSame( GafferImage.ImagePlug.blackTile( _copy = False ) ) )
+		self.assertTrue( tile( constant1, "A" ).isSame( GafferImage.ImagePlug.whiteTile( _copy = False ) ) )
+
 	def testFormatHash( self ) :
 
 		# Check that the data hash doesn't change when the format does.
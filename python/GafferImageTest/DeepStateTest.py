@@ -699,6 +699,45 @@ class DeepStateTest( GafferImageTest.ImageTestCase ) :
 			for i in range( len( actualChannelData ) ):
 				self.assertAlmostEqual( actualChannelData[i], expectedChannelData[channelName][i], places = 6 )
 
+	def testMergeTolerance( self ) :
+
+		np = GafferImage.ImagePlug.tilePixels()
+
+		messy = self.__getMessy( [
+			{ "R":1.0, "G":0.0, "B":0.0, "A":0.5, "Z":10, "ZBack":12 },
+			{ "R":0.0, "G":1.0, "B":0.0, "A":0.5, "Z":10.001, "ZBack":12.001 },
+			{ "R":0.0, "G":0.0, "B":1.0, "A":0.5, "Z":20, "ZBack":20 },
+		], 0 )
+
+		deepState = GafferImage.DeepState()
+		deepState["in"].setInput( messy["merge"]["out"] )
+
+		flatten = GafferImage.DeepState()
+		flatten["in"].setInput( deepState["out"] )
+		flatten["deepState"].setValue( GafferImage.DeepState.TargetState.Flat )
+
+		# Without a tolerance, the overlapping samples are split into slivers
+
+		self.assertEqual( deepState["out"].sampleOffsets( imath.V2i( 0 ) ), IECore.IntVectorData( range( 4, np * 4 + 1, 4 ) ) )
+		referenceFlat = { c : flatten["out"].channelData( c, imath.V2i( 0 ) ) for c in [ "R", "G", "B", "A" ] }
+
+		# With a tolerance, they are merged into a single sample
+
+		deepState["mergeTolerance"].setValue( 0.01 )
+		self.assertEqual( deepState["out"].sampleOffsets( imath.V2i( 0 ) ), IECore.IntVectorData( range( 2, np * 2 + 1, 2 ) ) )
+		self.assertEqual( deepState["out"].channelData( "Z", imath.V2i( 0 ) ), IECore.FloatVectorData( [ 10.0, 20.0 ] * np ) )
+		self.assertEqual( deepState["out"].channelData( "ZBack", imath.V2i( 0 ) ), IECore.FloatVectorData( [ 12.0, 20.0 ] * np ) )
+
+		# Which doesn't significantly change the flattened result
+
+		for channelName in [ "R", "G", "B", "A" ] :
+			self.assertSimilarList( flatten["out"].channelData( channelName, imath.V2i( 0 ) ), referenceFlat[channelName], 0.001 )
+
+		# Tolerance is ignored when not tidying
+
+		deepState["deepState"].setValue( GafferImage.DeepState.TargetState.Sorted )
+		self.assertEqual( deepState["out"].sampleOffsets( imath.V2i( 0 ) ), IECore.IntVectorData( range( 3, np * 3 + 1, 3 ) ) )
+
 	def testOccludeAll( self ) :
 		representativeImage = GafferImage.ImageReader()
 		representativeImage["fileName"].setValue( self.representativeImagePath )
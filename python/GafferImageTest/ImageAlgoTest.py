@@ -34,6 +34,9 @@
 #
 ##########################################################################
 
+import array
+import math
+import random
 import unittest
 import imath
 import itertools
@@ -340,5 +343,99 @@ class ImageAlgoTest( GafferImageTest.ImageTestCase ) :
 		self.assertEqual( permutationsGaffer, permutationsPython )
 
 
+	def testCopyPixels( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.imagesPath() / "checker.exr" )
+
+		dataWindow = reader["out"].dataWindow()
+		for window in [
+			dataWindow,
+			imath.Box2i( dataWindow.min() - imath.V2i( 10 ), dataWindow.min() + imath.V2i( 150, 70 ) ),
+			imath.Box2i( dataWindow.max() + imath.V2i( 10 ), dataWindow.max() + imath.V2i( 20 ) ),
+		] :
+
+			channelNames = [ "R", "A", "doesNotExist" ]
+			width = window.size().x
+			buffer = array.array( "f", [ -1 ] * ( width * window.size().y * len( channelNames ) ) )
+			GafferImage.ImageAlgo.copyPixels( reader["out"], channelNames, window, buffer )
+
+			for c, channelName in enumerate( channelNames ) :
+				sampler = GafferImage.Sampler( reader["out"], channelName, window ) if channelName != "doesNotExist" else None
+				for y in range( window.min().y, window.max().y ) :
+					for x in range( window.min().x, window.max().x ) :
+						value = buffer[ ( ( window.max().y - 1 - y ) * width + x - window.min().x ) * len( channelNames ) + c ]
+						self.assertEqual( value, sampler.sample( x, y ) if sampler else 0.0 )
+
+		with self.assertRaisesRegex( Exception, "Buffer too small" ) :
+			GafferImage.ImageAlgo.copyPixels( reader["out"], [ "R" ], dataWindow, array.array( "f", [ 0 ] ) )
+
+		with self.assertRaisesRegex( Exception, "32 bit floats" ) :
+			GafferImage.ImageAlgo.copyPixels( reader["out"], [ "R" ], dataWindow, array.array( "d", [ 0 ] * ( dataWindow.size().x * dataWindow.size().y ) ) )
+
+		with self.assertRaises( Exception ) :
+			# Read-only buffer
+			GafferImage.ImageAlgo.copyPixels( reader["out"], [ "R" ], dataWindow, bytes( 4 * dataWindow.size().x * dataWindow.size().y ) )
+
+	def testSamplePixels( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.imagesPath() / "checker.exr" )
+
+		dataWindow = reader["out"].dataWindow()
+		sampleWindow = imath.Box2i( dataWindow.min() - imath.V2i( 20 ), dataWindow.max() + imath.V2i( 20 ) )
+
+		randomGenerator = random.Random( 10 )
+		positions = IECore.V2fVectorData( [
+			imath.V2f(
+				randomGenerator.uniform( sampleWindow.min().x, sampleWindow.max().x ),
+				randomGenerator.uniform( sampleWindow.min().y, sampleWindow.max().y )
+			)
+			for i in range( 0, 1000 )
+		] )
+		# Include positions exactly on pixel centres and tile boundaries.
+		positions.extend( [ imath.V2f( 0.5 ), imath.V2f( 63.5, 64.5 ), imath.V2f( 64 ), imath.V2f( 127.5, 128 ) ] )
+
+		for interpolate in ( True, False ) :
+			for boundingMode in ( GafferImage.Sampler.BoundingMode.Black, GafferImage.Sampler.BoundingMode.Clamp ) :
+
+				samples = GafferImage.ImageAlgo.samplePixels( reader["out"], [ "R", "A", "doesNotExist" ], positions, interpolate, boundingMode )
+				self.assertEqual( set( samples.keys() ), { "R", "A", "doesNotExist" } )
+
+				for channelName in ( "R", "A" ) :
+					sampler = GafferImage.Sampler( reader["out"], channelName, sampleWindow, boundingMode )
+					for i, p in enumerate( positions ) :
+						if interpolate :
+							expected = sampler.sample( p.x, p.y )
+						else :
+							expected = sampler.sample( int( math.floor( p.x ) ), int( math.floor( p.y ) ) )
+						self.assertEqual( samples[channelName][i], expected )
+
+				self.assertEqual( samples["doesNotExist"], IECore.FloatVectorData( [ 0 ] * len( positions ) ) )
+
+		self.assertEqual( GafferImage.ImageAlgo.samplePixels( reader["out"], [ "R" ], IECore.V2fVectorData() ), IECore.CompoundData( { "R" : IECore.FloatVectorData() } ) )
+
+	def testSamplePixelsWithDuplicateChannelNames( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.imagesPath() / "checker.exr" )
+
+		positions = IECore.V2fVectorData( [ imath.V2f( x + 0.5, 10.5 ) for x in range( 0, 200 ) ] )
+
+		samples = GafferImage.ImageAlgo.samplePixels( reader["out"], [ "R", "G", "R", "doesNotExist", "doesNotExist" ], positions )
+		self.assertEqual( set( samples.keys() ), { "R", "G", "doesNotExist" } )
+		self.assertEqual( samples["R"], GafferImage.ImageAlgo.samplePixels( reader["out"], [ "R" ], positions )["R"] )
+		self.assertEqual( samples["G"], GafferImage.ImageAlgo.samplePixels( reader["out"], [ "G" ], positions )["G"] )
+		self.assertEqual( samples["doesNotExist"], IECore.FloatVectorData( [ 0 ] * len( positions ) ) )
+
+	def testSamplePixelsDeep( self ) :
+
+		constant = GafferImage.Constant()
+		flatToDeep = GafferImage.FlatToDeep()
+		flatToDeep["in"].setInput( constant["out"] )
+
+		with self.assertRaisesRegex( RuntimeError, "does not support deep" ) :
+			GafferImage.ImageAlgo.samplePixels( flatToDeep["out"], [ "R" ], IECore.V2fVectorData( [ imath.V2f( 0 ) ] ) )
+
 if __name__ == "__main__":
 	unittest.main()
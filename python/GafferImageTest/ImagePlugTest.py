@@ -248,6 +248,26 @@ class ImagePlugTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertTrue( tileDataNoCopyA.isSame( tileDataNoCopyB ) )
 
+	def testConstantTile( self ) :
+
+		ts = GafferImage.ImagePlug.tileSize()
+
+		self.assertTrue( GafferImage.ImagePlug.constantTile( 0, _copy = False ).isSame( GafferImage.ImagePlug.blackTile( _copy = False ) ) )
+		self.assertTrue( GafferImage.ImagePlug.constantTile( 1, _copy = False ).isSame( GafferImage.ImagePlug.whiteTile( _copy = False ) ) )
+
+		tileDataCopiedA = GafferImage.ImagePlug.constantTile( 0.5 )
+		tileDataCopiedB = GafferImage.ImagePlug.constantTile( 0.5 )
+		self.__testTileData( tileDataCopiedA, ts*ts, value = 0.5 )
+
+		self.assertFalse( tileDataCopiedA.isSame( tileDataCopiedB ) )
+
+		tileDataNoCopyA = GafferImage.ImagePlug.constantTile( 0.5, _copy = False )
+		tileDataNoCopyB = GafferImage.ImagePlug.constantTile( 0.5, _copy = False )
+		self.__testTileData( tileDataNoCopyA, ts*ts, value = 0.5 )
+
+		self.assertTrue( tileDataNoCopyA.isSame( tileDataNoCopyB ) )
+		self.assertFalse( tileDataNoCopyA.isSame( GafferImage.ImagePlug.constantTile( 0.25, _copy = False ) ) )
+
 	def testEmptyTile( self ) :
 
 		tileDataCopiedA = GafferImage.ImagePlug.emptyTile()
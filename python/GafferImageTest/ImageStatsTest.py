@@ -361,6 +361,28 @@ class ImageStatsTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertEqual( pm.plugStatistics( stats["__allStats" ] ).computeCount, 1 )
 
+	def testLocalisedChangesOnlyRecomputeAffectedTiles( self ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 1920, 1080 ) )
+
+		stats = GafferImage.ImageStats()
+		stats["in"].setInput( checker["out"] )
+		stats["area"].setValue( imath.Box2i( imath.V2i( 0 ), imath.V2i( 1920, 1000 ) ) )
+		stats["average"]["r"].getValue()
+
+		# Moving the top edge of the area within a single row of tiles
+		# should only require that row to be recomputed.
+
+		stats["area"]["max"]["y"].setValue( 1010 )
+		with Gaffer.PerformanceMonitor() as pm :
+			stats["average"]["r"].getValue()
+
+		tileSize = GafferImage.ImagePlug.tileSize()
+		self.assertEqual( pm.plugStatistics( stats["__tileStats"] ).computeCount, math.ceil( 1920 / tileSize ) )
+		self.assertEqual( pm.plugStatistics( stats["__rowStats"] ).computeCount, 1 )
+		self.assertEqual( pm.plugStatistics( stats["__allStats"] ).computeCount, 1 )
+
 	def testInf( self ) :
 
 		# Make an image with all `inf` values. We can't do this directly
@@ -1996,5 +1996,41 @@ class ImageWriterTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertImagesEqual( r["out"], reRead["out"], ignoreMetadata = True )
 
+	def testManyRowsWithDataWindowOffset( self ) :
+
+		# Writes are queued and performed on a separate thread, so make sure
+		# we write an image with many more rows of tiles than can be queued at
+		# once, and with a data window that doesn't align with the tile grid.
+
+		checkerboard = GafferImage.Checkerboard()
+		checkerboard["format"].setValue( GafferImage.Format( 300, 3000 ) )
+		checkerboard["size"].setValue( imath.V2f( 37 ) )
+
+		crop = GafferImage.Crop()
+		crop["in"].setInput( checkerboard["out"] )
+		crop["area"].setValue( imath.Box2i( imath.V2i( 13, 27 ), imath.V2i( 290, 2950 ) ) )
+		crop["affectDisplayWindow"].setValue( False )
+
+		writer = GafferImage.ImageWriter()
+		writer["in"].setInput( crop["out"] )
+		writer["openexr"]["dataType"].setValue( "float" )
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setInput( writer["fileName"] )
+
+		for mode in ( GafferImage.ImageWriter.Mode.Scanline, GafferImage.ImageWriter.Mode.Tile ) :
+			for compression in ( "zips", "dwaa" ) :
+				with self.subTest( mode = mode, compression = compression ) :
+
+					writer["fileName"].setValue( self.temporaryDirectory() / "manyRows{}{}.exr".format( int( mode ), compression ) )
+					writer["openexr"]["mode"].setValue( mode )
+					writer["openexr"]["compression"].setValue( compression )
+					writer["task"].execute()
+
+					self.assertImagesEqual(
+						reader["out"], crop["out"], ignoreMetadata = True,
+						maxDifference = 0.0 if compression == "zips" else 0.01
+					)
+
 if __name__ == "__main__":
 	unittest.main()
@@ -362,6 +362,66 @@ class MedianTest( GafferImageTest.ImageTestCase ) :
 		reverseOffset["offset"].setValue( imath.V2i( 1070, -1360 ) )
 		self.assertImagesEqual( reverseOffset["out"], refReader["out"], ignoreMetadata = True )
 
+	def testHistogramAlgorithm( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.imagesPath() / "circles.exr" )
+
+		sortMedian = GafferImage.Median()
+		sortMedian["in"].setInput( reader["out"] )
+		self.assertEqual( sortMedian["algorithm"].getValue(), GafferImage.Median.Algorithm.Sort )
+
+		histogramMedian = GafferImage.Median()
+		histogramMedian["in"].setInput( reader["out"] )
+		histogramMedian["algorithm"].setValue( GafferImage.Median.Algorithm.Histogram )
+
+		for radius in [ imath.V2i( 1 ), imath.V2i( 3, 7 ), imath.V2i( 20 ) ] :
+			for masterChannel in [ "", "G" ] :
+				for median in [ sortMedian, histogramMedian ] :
+					median["radius"].setValue( radius )
+					median["masterChannel"].setValue( masterChannel )
+
+				self.assertImagesEqual( histogramMedian["out"], sortMedian["out"] )
+
+	def testHistogramAlgorithmWithNoise( self ) :
+
+		# Noisy HDR input moves the median between many histogram bins,
+		# exercising the rebuilding and reuse of the refinement histograms.
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.__writeNoise( 128 ) )
+
+		sortMedian = GafferImage.Median()
+		sortMedian["in"].setInput( reader["out"] )
+
+		histogramMedian = GafferImage.Median()
+		histogramMedian["in"].setInput( reader["out"] )
+		histogramMedian["algorithm"].setValue( GafferImage.Median.Algorithm.Histogram )
+
+		for radius in [ imath.V2i( 2 ), imath.V2i( 9, 4 ) ] :
+			for median in [ sortMedian, histogramMedian ] :
+				median["radius"].setValue( radius )
+			self.assertImagesEqual( histogramMedian["out"], sortMedian["out"] )
+
+	def testAlgorithmDoesNotAffectOutput( self ) :
+
+		# Both algorithms give identical results, so there is no need to
+		# recompute anything when switching between them.
+
+		constant = GafferImage.Constant()
+
+		median = GafferImage.Median()
+		median["in"].setInput( constant["out"] )
+		median["radius"].setValue( imath.V2i( 2 ) )
+		median["masterChannel"].setValue( "G" )
+
+		cs = GafferTest.CapturingSlot( median.plugDirtiedSignal() )
+		hash = median["out"].channelDataHash( "R", imath.V2i( 0 ) )
+
+		median["algorithm"].setValue( GafferImage.Median.Algorithm.Histogram )
+		self.assertEqual( { x[0] for x in cs }, { median["algorithm"] } )
+		self.assertEqual( median["out"].channelDataHash( "R", imath.V2i( 0 ) ), hash )
+
 	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
 	def testPerf( self ) :
 
@@ -377,5 +437,74 @@ class MedianTest( GafferImageTest.ImageTestCase ) :
 		with GafferTest.TestRunner.PerformanceScope() :
 			GafferImageTest.processTiles( median["out"] )
 
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testHistogramPerf( self ) :
+
+		imageReader = GafferImage.ImageReader()
+		imageReader["fileName"].setValue( self.imagesPath() / 'deepMergeReference.exr' )
+
+		GafferImageTest.processTiles( imageReader["out"] )
+
+		median = GafferImage.Median()
+		median["in"].setInput( imageReader["out"] )
+		median["radius"].setValue( imath.V2i( 128 ) )
+		median["algorithm"].setValue( GafferImage.Median.Algorithm.Histogram )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( median["out"] )
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testLargeRadiusPerf( self ) :
+
+		self.__perf( self.imagesPath() / "deepMergeReference.exr", 512, GafferImage.Median.Algorithm.Sort )
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testHistogramLargeRadiusPerf( self ) :
+
+		self.__perf( self.imagesPath() / "deepMergeReference.exr", 512, GafferImage.Median.Algorithm.Histogram )
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testNoisePerf( self ) :
+
+		self.__perf( self.__writeNoise( 512 ), 128, GafferImage.Median.Algorithm.Sort )
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testHistogramNoisePerf( self ) :
+
+		self.__perf( self.__writeNoise( 512 ), 128, GafferImage.Median.Algorithm.Histogram )
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testLargeRadiusNoisePerf( self ) :
+
+		self.__perf( self.__writeNoise( 512 ), 512, GafferImage.Median.Algorithm.Sort )
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testHistogramLargeRadiusNoisePerf( self ) :
+
+		self.__perf( self.__writeNoise( 512 ), 512, GafferImage.Median.Algorithm.Histogram )
+
+	def __writeNoise( self, size ) :
+
+		# Uniform noise over a large range, so that values span many exponents.
+		noise = OpenImageIO.ImageBufAlgo.noise( "uniform", 0, 1000, roi = OpenImageIO.ROI( 0, size, 0, size, 0, 1, 0, 3 ) )
+		fileName = self.temporaryDirectory() / "noise.exr"
+		noise.write( str( fileName ) )
+		return fileName
+
+	def __perf( self, fileName, radius, algorithm ) :
+
+		imageReader = GafferImage.ImageReader()
+		imageReader["fileName"].setValue( fileName )
+
+		GafferImageTest.processTiles( imageReader["out"] )
+
+		median = GafferImage.Median()
+		median["in"].setInput( imageReader["out"] )
+		median["radius"].setValue( imath.V2i( radius ) )
+		median["algorithm"].setValue( algorithm )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( median["out"] )
+
 if __name__ == "__main__":
 	unittest.main()
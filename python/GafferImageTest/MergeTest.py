@@ -919,6 +919,46 @@ class MergeTest( GafferImageTest.ImageTestCase ) :
 		merge["in"][0].setInput( c1["out"] )
 		self.assertImagesEqual( merge["out"], c1["out"] )
 
+	def testOpaqueLayerSkipsHiddenLayers( self ) :
+
+		background = GafferImage.Checkerboard()
+		background["format"].setValue( GafferImage.Format( 200, 150 ) )
+
+		foreground = GafferImage.Constant()
+		foreground["format"].setValue( GafferImage.Format( 200, 150 ) )
+		foreground["color"].setValue( imath.Color4f( 0.1, 0.2, 0.3, 1 ) )
+
+		for operation in ( GafferImage.Merge.Operation.Over, GafferImage.Merge.Operation.Matte, GafferImage.Merge.Operation.Under ) :
+
+			merge = GafferImage.Merge()
+			merge["operation"].setValue( operation )
+			if operation == GafferImage.Merge.Operation.Under :
+				merge["in"][0].setInput( foreground["out"] )
+				merge["in"][1].setInput( background["out"] )
+			else :
+				merge["in"][0].setInput( background["out"] )
+				merge["in"][1].setInput( foreground["out"] )
+
+			# The opaque foreground hides the background completely,
+			# so the background should not need to be computed at all.
+
+			Gaffer.ValuePlug.clearCache()
+			with Gaffer.PerformanceMonitor() as monitor :
+				self.assertImagesEqual( merge["out"], foreground["out"], ignoreMetadata = True )
+
+			self.assertEqual( monitor.plugStatistics( background["out"]["channelData"] ).computeCount, 0 )
+
+			# But if the foreground is at all transparent, we must
+			# compute the background as before.
+
+			foreground["color"]["a"].setValue( 0.5 )
+			Gaffer.ValuePlug.clearCache()
+			with Gaffer.PerformanceMonitor() as monitor :
+				GafferImage.ImageAlgo.image( merge["out"] )
+
+			self.assertGreater( monitor.plugStatistics( background["out"]["channelData"] ).computeCount, 0 )
+			foreground["color"]["a"].setValue( 1 )
+
 	def mergePerf( self, operation, mismatch ):
 		r = GafferImage.Checkerboard( "Checkerboard" )
 		r["format"].setValue( GafferImage.Format( 4096, 3112, 1.000 ) )
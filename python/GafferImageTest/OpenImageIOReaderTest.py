@@ -579,6 +579,53 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 
 				self.assertImagesEqual( r["out"], offsetIn["out"], ignoreMetadata = True )
 
+	def testUncompressedTileReads( self ) :
+
+		# Uncompressed tiled EXRs whose tiles line up with Gaffer's are read one tile
+		# and channel at a time, bypassing the tile batches. Test a mixture of aligned
+		# and unaligned data windows to exercise both code paths.
+
+		checkerboard = GafferImage.Checkerboard()
+		checkerboard["format"].setValue( GafferImage.Format( 512, 384 ) )
+		checkerboard["size"].setValue( imath.V2f( 29 ) )
+
+		shuffle = GafferImage.Shuffle()
+		shuffle["in"].setInput( checkerboard["out"] )
+		shuffle["shuffles"].addChild( Gaffer.ShufflePlug( "R", "extra.Z" ) )
+
+		offset = GafferImage.Offset()
+		offset["in"].setInput( shuffle["out"] )
+
+		writer = GafferImage.ImageWriter()
+		writer["in"].setInput( offset["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "uncompressedTiles.exr" )
+		writer["openexr"]["mode"].setValue( GafferImage.ImageWriter.Mode.Tile )
+		writer["openexr"]["compression"].setValue( "none" )
+		writer["openexr"]["dataType"].setValue( "float" )
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setInput( writer["fileName"] )
+
+		for offsetValue, direct in [
+			( imath.V2i( 0 ), True ),
+			( imath.V2i( 128, -256 ), True ),
+			( imath.V2i( 1, 0 ), False ),
+			( imath.V2i( 0, -17 ), False ),
+			( imath.V2i( 33, 61 ), False ),
+		] :
+
+			with self.subTest( offset = offsetValue ) :
+
+				offset["offset"].setValue( offsetValue )
+				writer["task"].execute()
+				reader["refreshCount"].setValue( reader["refreshCount"].getValue() + 1 )
+
+				with Gaffer.PerformanceMonitor() as monitor :
+					self.assertImagesEqual( reader["out"], offset["out"], ignoreMetadata = True )
+
+				self.assertEqual( monitor.plugStatistics( reader["__tile"] ).computeCount > 0, direct )
+				self.assertEqual( monitor.plugStatistics( reader["__tileBatch"] ).computeCount == 0, direct )
+
 	def testFileNameContext( self ) :
 
 		s = Gaffer.ScriptNode()
@@ -783,7 +830,7 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 				reader["fileName"].setValue( f )
 				self.assertEqual( len( reader["out"].viewNames() ), r )
 
-	def runPerfTest( self, tiled, blockZip, offset ):
+	def runPerfTest( self, tiled, blockZip, offset, compression = None ):
 		origSource = GafferImage.ImageReader()
 		origSource["fileName"].setValue( self.dotGridWarpedFileName )
 
@@ -801,7 +848,7 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 		testWriter["in"].setInput( offsetNode["out"] )
 		testWriter["fileName"].setValue( tempFile )
 		testWriter["openexr"]["mode"].setValue( GafferImage.ImageWriter.Mode.Tile if tiled else GafferImage.ImageWriter.Mode.Scanline )
-		testWriter["openexr"]["compression"].setValue( "zip" if blockZip else "zips" )
+		testWriter["openexr"]["compression"].setValue( compression or ( "zip" if blockZip else "zips" ) )
 		testWriter["task"].execute()
 
 		perfReader = GafferImage.ImageReader()
@@ -820,6 +867,11 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 	def testTilePerformance( self ):
 		self.runPerfTest( True, False, imath.V2i( 0 ) )
 
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testUncompressedTilePerformance( self ):
+		self.runPerfTest( True, False, imath.V2i( 0 ), compression = "none" )
+
 	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
 	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
 	def testScanlineBlockPerformance( self ):
@@ -120,6 +120,20 @@ Gaffer.Metadata.registerNode(
 
 		},
 
+		"mergeTolerance" : {
+
+			"description" :
+			"""
+			When tidying, samples whose front and back depths are both within this distance of
+			another sample in the same pixel are merged with it, rather than being split into
+			many thin slivers. This can greatly reduce the number of samples in images with many
+			coincident surfaces, at the expense of a small change in depth. The default of 0
+			only merges samples with exactly matching depths.
+			""",
+			"layout:activator" : "prune",
+
+		},
+
 	}
 
 )
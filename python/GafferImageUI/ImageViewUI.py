@@ -81,6 +81,8 @@ Gaffer.Metadata.registerNode(
 	"toolbarLayout:customWidget:BottomRightSpacer:section", "Bottom",
 	"toolbarLayout:customWidget:BottomRightSpacer:index", -1,
 
+	"imageView:prefetchFrames", 4,
+
 	plugs = {
 
 		"view" : {
@@ -422,12 +424,36 @@ class _StateWidget( GafferUI.Widget ) :
 		# We use the paused state of the primary ImageGadget to drive our UI
 		self.__imageGadgets[0].stateChangedSignal().connect( Gaffer.WeakMethod( self.__stateChanged ) )
 
+		# We prefetch upcoming frames during playback, so that the ImageGadgets
+		# don't have to wait for them to be computed.
+		self.__imageView = imageView
+		self.__playback = GafferUI.Playback.acquire( imageView.getContext() )
+		self.__playback.stateChangedSignal().connect( Gaffer.WeakMethod( self.__playbackStateChanged ) )
+		imageView.getContext().changedSignal().connect( Gaffer.WeakMethod( self.__contextChanged ) )
+
 		self.__update()
+		self.__updatePrefetch()
 
 	def __stateChanged( self, imageGadget ) :
 
 		self.__update()
 
+	def __playbackStateChanged( self, playback ) :
+
+		self.__updatePrefetch()
+
+	def __contextChanged( self, context, name ) :
+
+		if name == "frame" :
+			self.__updatePrefetch()
+
+	def __updatePrefetch( self ) :
+
+		numFrames = Gaffer.Metadata.value( self.__imageView, "imageView:prefetchFrames" ) or 0
+		frames = self.__playback.upcomingFrames( numFrames )
+		for imageGadget in self.__imageGadgets :
+			imageGadget.setPrefetchFrames( frames )
+
 	def __buttonClick( self, button ) :
 
 		newPaused = not self.__imageGadgets[0].getPaused()
@@ -54,4 +54,26 @@ Gaffer.Metadata.registerNode(
 	removing noise.
 	""",
 
+	plugs = {
+
+		"algorithm" : {
+
+			"description" :
+			"""
+			The method used to compute the median. Both methods give
+			identical results. "Sort" is fastest for small radii, while
+			"Histogram" updates a sliding histogram rather than sorting.
+			Its cost per pixel still grows in proportion to the radius,
+			but much more slowly, making it much faster for large radii.
+			""",
+
+			"preset:Sort" : GafferImage.Median.Algorithm.Sort,
+			"preset:Histogram" : GafferImage.Median.Algorithm.Histogram,
+
+			"plugValueWidget:type" : "GafferUI.PresetsPlugValueWidget",
+
+		},
+
+	}
+
 )
@@ -145,5 +145,91 @@ class ImageGadgetTest( GafferUITest.TestCase ) :
 			self.waitForIdle()
 			self.assertEqual( GafferImageUI.ImageGadget.tileUpdateCount(), 4 )
 
+	def testPrefetchFrames( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["image"] = GafferImage.Checkerboard()
+
+		gadget = GafferImageUI.ImageGadget()
+		gadget.setImage( script["image"]["out"] )
+		gadget.setContext( script.context() )
+		self.assertEqual( gadget.getPrefetchFrames(), [] )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			gadget.setPrefetchFrames( [ 2, 3 ] )
+		self.assertEqual( gadget.getPrefetchFrames(), [ 2, 3 ] )
+
+		# Prefetching happens in the background, so we must wait for it.
+		startTime = time.time()
+		while monitor.plugStatistics( script["image"]["out"]["channelData"] ).computeCount == 0 :
+			self.assertLess( time.time() - startTime, 10 )
+			time.sleep( 0.1 )
+
+		gadget.setPrefetchFrames( [] )
+		self.assertEqual( gadget.getPrefetchFrames(), [] )
+
+	def testPrefetchFollowsPlayback( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["image"] = GafferImage.Checkerboard()
+		script["image2"] = GafferImage.Checkerboard()
+
+		gadget = GafferImageUI.ImageGadget()
+		gadget.setImage( script["image"]["out"] )
+		gadget.setContext( script.context() )
+
+		def waitForFrames( monitor, node, numFrames ) :
+
+			# Prefetching happens in the background, so we must wait for it.
+			startTime = time.time()
+			while True :
+				statistics = monitor.allStatistics().get( node["out"]["channelData"] )
+				if statistics is not None and statistics.numUniqueValues( "frame" ) == numFrames :
+					return
+				self.assertLess( time.time() - startTime, 10 )
+				time.sleep( 0.1 )
+
+		# Advancing through playback continues the existing prefetch,
+		# adding the new frame.
+
+		with Gaffer.ContextMonitor( script["image"] ) as monitor :
+			gadget.setPrefetchFrames( [ 2, 3 ] )
+			gadget.setPrefetchFrames( [ 3, 4 ] )
+			waitForFrames( monitor, script["image"], 3 )
+
+		# Nothing is prefetched while hidden.
+
+		gadget.setVisible( False )
+		with Gaffer.ContextMonitor( script["image"] ) as monitor :
+			gadget.setPrefetchFrames( [ 10, 11 ] )
+			time.sleep( 0.5 )
+		self.assertNotIn( script["image"]["out"]["channelData"], monitor.allStatistics() )
+
+		# But prefetching resumes when shown again.
+
+		with Gaffer.ContextMonitor( script["image"] ) as monitor :
+			gadget.setVisible( True )
+			waitForFrames( monitor, script["image"], 2 )
+
+		# Changing image prefetches the new image.
+
+		with Gaffer.ContextMonitor( script["image2"] ) as monitor :
+			gadget.setImage( script["image2"]["out"] )
+			waitForFrames( monitor, script["image2"], 2 )
+
+		# Editing the graph during prefetch invalidates the prefetched
+		# frames, so they are fetched again.
+
+		with Gaffer.ContextMonitor( script["image2"] ) as monitor :
+			script["image2"]["size"]["x"].setValue( 10 )
+			waitForFrames( monitor, script["image2"], 2 )
+
+		# And prefetching continues to follow playback afterwards.
+
+		with Gaffer.ContextMonitor( script["image2"] ) as monitor :
+			gadget.setPrefetchFrames( [ 11, 12 ] )
+			waitForFrames( monitor, script["image2"], 1 )
+		self.assertEqual( monitor.allStatistics()[script["image2"]["out"]["channelData"]].numUniqueValues( "frame" ), 1 )
+
 if __name__ == "__main__":
 	unittest.main()
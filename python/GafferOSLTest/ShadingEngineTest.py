@@ -355,6 +355,74 @@ class ShadingEngineTest( GafferOSLTest.OSLTestCase ) :
 		for a in shading["a"] :
 			self.assertEqual( a, imath.Color3f( 1, 0, 0 ) )
 
+	def testOutputCi( self ) :
+
+		shader = self.compileShader( pathlib.Path( __file__ ).parent / "shaders" / "debugClosure.osl" )
+
+		e = GafferOSL.ShadingEngine( IECoreScene.ShaderNetwork(
+			shaders = {
+				"output" : IECoreScene.Shader( shader, "osl:surface", { "name" : "a", "weight" : imath.Color3f( 1, 0, 0 ) } ),
+			},
+			output = "output"
+		) )
+
+		points = self.rectanglePoints()
+		withCi = e.shade( points )
+		withoutCi = e.shade( points, outputCi = False )
+
+		self.assertIn( "Ci", withCi )
+		self.assertNotIn( "Ci", withoutCi )
+		self.assertEqual( withoutCi["a"], withCi["a"] )
+
+	def testShaderGroupCache( self ) :
+
+		shader = self.compileShader( pathlib.Path( __file__ ).parent / "shaders" / "debugClosure.osl" )
+
+		def network( name ) :
+
+			return IECoreScene.ShaderNetwork(
+				shaders = {
+					"output" : IECoreScene.Shader( shader, "osl:surface", { "name" : name, "weight" : imath.Color3f( 1, 0, 0 ) } ),
+				},
+				output = "output"
+			)
+
+		GafferOSL.ShadingEngine.clearShaderGroupCache()
+		self.assertEqual( GafferOSL.ShadingEngine.shaderGroupCacheUsage(), 0 )
+
+		# Identical networks share a single shader group.
+
+		e1 = GafferOSL.ShadingEngine( network( "a" ) )
+		e2 = GafferOSL.ShadingEngine( network( "a" ) )
+		self.assertEqual( GafferOSL.ShadingEngine.shaderGroupCacheUsage(), 1 )
+
+		e3 = GafferOSL.ShadingEngine( network( "b" ) )
+		self.assertEqual( GafferOSL.ShadingEngine.shaderGroupCacheUsage(), 2 )
+
+		# Clearing the cache doesn't invalidate existing engines.
+
+		GafferOSL.ShadingEngine.clearShaderGroupCache()
+		self.assertEqual( GafferOSL.ShadingEngine.shaderGroupCacheUsage(), 0 )
+
+		points = self.rectanglePoints()
+		for e, name in ( ( e1, "a" ), ( e2, "a" ), ( e3, "b" ) ) :
+			shading = e.shade( points )
+			self.assertIn( name, shading )
+			for v in shading[name] :
+				self.assertEqual( v, imath.Color3f( 1, 0, 0 ) )
+
+		# Size limit is respected.
+
+		originalLimit = GafferOSL.ShadingEngine.getShaderGroupCacheSizeLimit()
+		try :
+			GafferOSL.ShadingEngine.setShaderGroupCacheSizeLimit( 1 )
+			self.assertEqual( GafferOSL.ShadingEngine.getShaderGroupCacheSizeLimit(), 1 )
+			GafferOSL.ShadingEngine( network( "c" ) )
+			GafferOSL.ShadingEngine( network( "d" ) )
+			self.assertEqual( GafferOSL.ShadingEngine.shaderGroupCacheUsage(), 1 )
+		finally :
+			GafferOSL.ShadingEngine.setShaderGroupCacheSizeLimit( originalLimit )
+
 	def testMultipleDebugClosures( self ) :
 
 		shader = self.compileShader( pathlib.Path( __file__ ).parent / "shaders" / "multipleDebugClosures.osl" )
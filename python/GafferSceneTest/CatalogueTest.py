@@ -583,6 +583,89 @@ class CatalogueTest( GafferImageTest.ImageTestCase ) :
 			self.sendImage( r["out"], c, waitForSave = False )
 			del c
 
+	def testManyConcurrentSaves( self ) :
+
+		c = GafferScene.Catalogue()
+		c["directory"].setValue( self.temporaryDirectory() / "catalogue" )
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 100, 100 ) )
+
+		# Send more images than there are threads to save them,
+		# all without waiting for the saves to complete.
+		numImages = 10
+		with GafferTest.ParallelAlgoTest.UIThreadCallHandler() as h :
+
+			for i in range( 0, numImages ) :
+				constant["color"].setValue( imath.Color4f( i / numImages, 0, 0, 1 ) )
+				self.sendImage( constant["out"], c, waitForSave = False )
+
+			# Expect one call to make each save visible.
+			for i in range( 0, numImages ) :
+				h.assertCalled()
+			h.assertDone()
+
+		self.assertEqual( len( c["images"] ), numImages )
+
+		reader = GafferImage.ImageReader()
+		for i, image in enumerate( c["images"] ) :
+			self.assertTrue( pathlib.Path( image["fileName"].getValue() ).is_file() )
+			reader["fileName"].setValue( image["fileName"].getValue() )
+			constant["color"].setValue( imath.Color4f( i / numImages, 0, 0, 1 ) )
+			self.assertImagesEqual( reader["out"], constant["out"], maxDifference = 0.001, ignoreMetadata = True, ignoreDataWindow = True )
+
+	def testQueuedSavesReleaseDrivers( self ) :
+
+		# The display drivers hold the pixel data for unsaved images,
+		# so they must all be released once the queue has drained, no
+		# matter how long the queue was.
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 100, 100 ) )
+
+		for numImages in [ 1, 4, 20 ] :
+
+			with self.subTest( numImages = numImages ) :
+
+				c = GafferScene.Catalogue()
+				c["directory"].setValue( self.temporaryDirectory() / f"catalogue{numImages}" )
+
+				drivers = GafferTest.CapturingSlot( GafferScene.Display.driverCreatedSignal() )
+				with GafferTest.ParallelAlgoTest.UIThreadCallHandler() as h :
+					for i in range( 0, numImages ) :
+						constant["color"].setValue( imath.Color4f( i / numImages, 0, 0, 1 ) )
+						self.sendImage( constant["out"], c, waitForSave = False )
+					for i in range( 0, numImages ) :
+						h.assertCalled()
+					h.assertDone()
+
+				self.assertEqual( len( drivers ), numImages )
+				for driver in drivers :
+					self.assertEqual( driver[0].refCount(), 1 )
+
+	def testDeleteBeforeSavesStart( self ) :
+
+		directory = self.temporaryDirectory() / "catalogue"
+
+		c = GafferScene.Catalogue()
+		c["directory"].setValue( directory )
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 100, 100 ) )
+
+		# Send more images than there are threads to save them, so
+		# that some saves are still queued when we delete the Catalogue.
+		numImages = 10
+		with GafferTest.ParallelAlgoTest.UIThreadCallHandler() as h :
+			for i in range( 0, numImages ) :
+				constant["color"].setValue( imath.Color4f( i / numImages, 0, 0, 1 ) )
+				self.sendImage( constant["out"], c, waitForSave = False )
+			del c
+
+		# Every image should still have been saved, rather than being
+		# dropped from the queue.
+		self.assertEqual( len( list( directory.glob( "*.exr" ) ) ), numImages )
+
 	def testDeleteBeforeSaveCompletesWithScriptVariables( self ) :
 
 		s = Gaffer.ScriptNode()
@@ -39,6 +39,7 @@ import imath
 import IECore
 import IECoreScene
 
+import Gaffer
 import GafferTest
 import GafferScene
 import GafferSceneTest
@@ -289,5 +290,57 @@ class ClosestPointSamplerTest( GafferSceneTest.SceneTestCase ) :
 		prune["filter"].setInput( sphereFilter["out"] )
 		self.assertNotIn( "sampled:P", sampler["out"].object( "/plane" ) )
 
+	def testSharedEvaluator( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		plane = GafferScene.Plane()
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( plane["out"] )
+		group["in"][1].setInput( plane["out"] )
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/group/*" ] ) )
+
+		sampler1 = GafferScene.ClosestPointSampler()
+		sampler1["in"].setInput( group["out"] )
+		sampler1["source"].setInput( sphere["out"] )
+		sampler1["filter"].setInput( planeFilter["out"] )
+		sampler1["sourceLocation"].setValue( "/sphere" )
+		sampler1["primitiveVariables"].setValue( "P" )
+		sampler1["prefix"].setValue( "sampled1:" )
+
+		sampler2 = GafferScene.ClosestPointSampler()
+		sampler2["in"].setInput( sampler1["out"] )
+		sampler2["source"].setInput( sphere["out"] )
+		sampler2["filter"].setInput( planeFilter["out"] )
+		sampler2["sourceLocation"].setValue( "/sphere" )
+		sampler2["primitiveVariables"].setValue( "P" )
+		sampler2["prefix"].setValue( "sampled2:" )
+
+		# The evaluator for the source should only be built once, and then
+		# shared by both locations and both samplers.
+
+		Gaffer.ValuePlug.clearCache()
+		with Gaffer.PerformanceMonitor() as monitor :
+			for path in [ "/group/plane", "/group/plane1" ] :
+				mesh = sampler2["out"].object( path )
+				self.assertIn( "sampled1:P", mesh )
+				self.assertEqual( mesh["sampled1:P"], mesh["sampled2:P"] )
+
+		self.assertEqual(
+			monitor.plugStatistics( sampler1["__sourceEvaluator"] ).computeCount +
+			monitor.plugStatistics( sampler2["__sourceEvaluator"] ).computeCount,
+			1
+		)
+
+		# Changing the source must result in a new evaluator.
+
+		sphere["radius"].setValue( 2 )
+		mesh = sampler2["out"].object( "/group/plane" )
+		self.assertEqual( mesh["sampled1:P"], mesh["sampled2:P"] )
+		self.assertAlmostEqual( mesh["sampled1:P"].data[0].length(), 2, delta = 0.1 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -420,6 +420,72 @@ class CryptomatteTest( GafferSceneTest.SceneTestCase ) :
 		self.assertIn( "A2", c["out"]["channelNames"].getValue() )
 		self.assertNotIn( "A", c["out"]["channelNames"].getValue() )
 
+	def testMattes( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.testImage )
+
+		cryptomatte = GafferScene.Cryptomatte()
+		cryptomatte["in"].setInput( reader["out"] )
+		cryptomatte["layer"].setValue( "crypto_object" )
+
+		matteNames = {
+			"cow" : [ "/cow" ],
+			"cows" : [ "/cow*" ],
+			"robot" : [ "/GAFFERBOT" ],
+			"head" : [ "/.../C_head_GRP" ],
+			"mixed" : [ "/cow1", "/GAFFERBOT/C_torso_GRP" ],
+			"none" : [ "/doesNotExist" ],
+		}
+		for channel, names in matteNames.items() :
+			cryptomatte["mattes"].addChild( Gaffer.NameValuePlug( channel, IECore.StringVectorData( names ), True, flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic ) )
+
+		self.assertTrue( set( matteNames.keys() ).issubset( set( cryptomatte["out"].channelNames() ) ) )
+
+		single = GafferScene.Cryptomatte()
+		single["in"].setInput( reader["out"] )
+		single["layer"].setValue( "crypto_object" )
+
+		tileSize = GafferImage.ImagePlug.tileSize()
+		dataWindow = cryptomatte["out"].dataWindow()
+		tileOrigins = [
+			imath.V2i( x, y )
+			for x in range( GafferImage.ImagePlug.tileOrigin( dataWindow.min() ).x, dataWindow.max().x, tileSize )
+			for y in range( GafferImage.ImagePlug.tileOrigin( dataWindow.min() ).y, dataWindow.max().y, tileSize )
+		]
+
+		for channel, names in matteNames.items() :
+			single["matteNames"].setValue( IECore.StringVectorData( names ) )
+			for tileOrigin in tileOrigins :
+				self.assertEqual(
+					cryptomatte["out"].channelData( channel, tileOrigin ),
+					single["out"].channelData( "A", tileOrigin )
+				)
+
+		# Disabled mattes are not output.
+
+		cryptomatte["mattes"][0]["enabled"].setValue( False )
+		self.assertNotIn( "cow", cryptomatte["out"].channelNames() )
+		self.assertEqual( cryptomatte["out"].channelNames().count( "cows" ), 1 )
+
+	def testMattesComputeSharedPerTile( self ) :
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( self.testImage )
+
+		cryptomatte = GafferScene.Cryptomatte()
+		cryptomatte["in"].setInput( reader["out"] )
+		cryptomatte["layer"].setValue( "crypto_object" )
+		for i in range( 0, 10 ) :
+			cryptomatte["mattes"].addChild( Gaffer.NameValuePlug( "matte{}".format( i ), IECore.StringVectorData( [ "/cow" ] ), True, flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic ) )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			for i in range( 0, 10 ) :
+				cryptomatte["out"].channelData( "matte{}".format( i ), imath.V2i( 0 ) )
+
+		self.assertEqual( monitor.plugStatistics( cryptomatte["__matteIndex"] ).computeCount, 1 )
+		self.assertEqual( monitor.plugStatistics( cryptomatte["__mattesChannelData"] ).computeCount, 1 )
+
 	@GafferTest.TestRunner.PerformanceTestMethod()
 	def testPerformance( self ) :
 
@@ -441,6 +507,25 @@ class CryptomatteTest( GafferSceneTest.SceneTestCase ) :
 		with GafferTest.TestRunner.PerformanceScope() :
 			GafferImageTest.processTiles( c["out"] )
 
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testMattesPerformance( self ) :
+
+		r = GafferImage.ImageReader()
+		r["fileName"].setValue( self.testImage )
+
+		c = GafferScene.Cryptomatte()
+		c["in"].setInput( r["out"] )
+		c["layer"].setValue( "crypto_object" )
+
+		for i, name in enumerate( c["manifestScene"].childNames( "/GAFFERBOT/C_torso_GRP" ) ) :
+			c["mattes"].addChild( Gaffer.NameValuePlug( "matte{}".format( i ), IECore.StringVectorData( [ "/GAFFERBOT/C_torso_GRP/" + name ] ), True, flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic ) )
+
+		# Pre-compute input to remove cost of file loading from performance test
+		GafferImageTest.processTiles( c["in"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( c["out"] )
+
 	def testSceneValid( self ) :
 
 		r = GafferImage.ImageReader()
@@ -215,6 +215,10 @@ class DisplayTest( GafferImageTest.ImageTestCase ) :
 
 		self.__testTransferImage( self.imagesPath() / "checkerWithNegativeDataWindow.200x150.exr" )
 
+	def testTransferSingleChannel( self ) :
+
+		self.__testTransferImage( self.imagesPath() / "checkerWithNegativeDataWindow.200x150.exr", channels = "G" )
+
 	def testAccessOutsideDataWindow( self ) :
 
 		node = self.__testTransferImage( self.imagesPath() / "checker.exr" )
@@ -332,11 +336,19 @@ class DisplayTest( GafferImageTest.ImageTestCase ) :
 			"""import GafferScene; GafferScene.Display.imageReceivedSignal().connect( lambda p : None )"""
 		] )
 
-	def __testTransferImage( self, fileName ) :
+	def __testTransferImage( self, fileName, channels = None ) :
 
 		imageReader = GafferImage.ImageReader()
 		imageReader["fileName"].setValue( fileName )
 
+		image = imageReader["out"]
+		if channels is not None :
+			deleteChannels = GafferImage.DeleteChannels()
+			deleteChannels["in"].setInput( image )
+			deleteChannels["mode"].setValue( GafferImage.DeleteChannels.Mode.Keep )
+			deleteChannels["channels"].setValue( channels )
+			image = deleteChannels["out"]
+
 		imagesReceived = GafferTest.CapturingSlot( GafferScene.Display.imageReceivedSignal() )
 
 		node = GafferScene.Display()
@@ -347,9 +359,9 @@ class DisplayTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertEqual( len( imagesReceived ), 0 )
 
-		self.Driver.sendImage( imageReader["out"], port = server.portNumber() )
+		self.Driver.sendImage( image, port = server.portNumber() )
 
-		self.assertImagesEqual( imageReader["out"], node["out"] )
+		self.assertImagesEqual( image, node["out"] )
 
 		self.assertEqual( len( imagesReceived ), 1 )
 		self.assertEqual( imagesReceived[0][0], node["out"] )
@@ -1577,6 +1577,255 @@ parent["radius"] = ( 2 + context.getFrame() ) * 15
 			}
 		)
 
+	def testChunkSize( self ) :
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in [ -1.5, -0.5, 0.5, 1.5, 2.5 ] ] ) )
+		points["index"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.IntVectorData( [ 0, 1, 0, 1, 0 ] ),
+		)
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( points )
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "sphereSet" )
+
+		cube = GafferScene.Cube()
+		cube["sets"].setValue( "cubeSet" )
+		cubeGroup = GafferScene.Group()
+		cubeGroup["name"].setValue( "cubeGroup" )
+		cubeGroup["in"][0].setInput( cube["out"] )
+
+		prototypes = GafferScene.Parent()
+		prototypes["in"].setInput( sphere["out"] )
+		prototypes["children"][0].setInput( cubeGroup["out"] )
+		prototypes["parent"].setValue( "/" )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( objectToScene["out"] )
+		instancer["prototypes"].setInput( prototypes["out"] )
+		instancer["parent"].setValue( "/object" )
+		instancer["prototypeIndex"].setValue( "index" )
+
+		unchunkedBound = instancer["out"].bound( "/object/instances/sphere" )
+
+		instancer["chunkSize"].setValue( 2 )
+
+		# Instances are grouped by the grid cell containing their position.
+
+		self.assertEqual(
+			instancer["out"].childNames( "/object/instances/sphere" ),
+			IECore.InternedStringVectorData( [ "chunk_n1_0_0", "chunk_0_0_0", "chunk_1_0_0" ] )
+		)
+		self.assertEqual(
+			instancer["out"].childNames( "/object/instances/cubeGroup" ),
+			IECore.InternedStringVectorData( [ "chunk_n1_0_0", "chunk_0_0_0" ] )
+		)
+		self.assertEqual( instancer["out"].childNames( "/object/instances/sphere/chunk_n1_0_0" ), IECore.InternedStringVectorData( [ "0" ] ) )
+		self.assertEqual( instancer["out"].childNames( "/object/instances/sphere/chunk_0_0_0" ), IECore.InternedStringVectorData( [ "2" ] ) )
+		self.assertEqual( instancer["out"].childNames( "/object/instances/sphere/chunk_1_0_0" ), IECore.InternedStringVectorData( [ "4" ] ) )
+		self.assertEqual( instancer["out"].childNames( "/object/instances/cubeGroup/chunk_0_0_0" ), IECore.InternedStringVectorData( [ "3" ] ) )
+		self.assertEqual( instancer["out"].childNames( "/object/instances/cubeGroup/chunk_0_0_0/3" ), IECore.InternedStringVectorData( [ "cube" ] ) )
+
+		# Chunks have identity transforms and tight bounds, and the instances
+		# within them are unchanged.
+
+		self.assertEqual( instancer["out"].transform( "/object/instances/sphere/chunk_n1_0_0" ), imath.M44f() )
+		self.assertEqual(
+			instancer["out"].bound( "/object/instances/sphere/chunk_n1_0_0" ),
+			imath.Box3f( imath.V3f( -2.5, -1, -1 ), imath.V3f( -0.5, 1, 1 ) )
+		)
+		self.assertEqual( instancer["out"].bound( "/object/instances/sphere" ), unchunkedBound )
+		self.assertEqual( instancer["out"].transform( "/object/instances/sphere/chunk_0_0_0/2" ), imath.M44f().translate( imath.V3f( 0.5, 0, 0 ) ) )
+		self.assertEqual( instancer["out"].object( "/object/instances/sphere/chunk_0_0_0" ), IECore.NullObject.defaultNullObject() )
+		self.assertEqual( instancer["out"].object( "/object/instances/sphere/chunk_0_0_0/2" ), sphere["out"].object( "/sphere" ) )
+
+		# Sets include the chunks in their paths.
+
+		expectedSets = {
+			"sphereSet" : {
+				"/object/instances/sphere/chunk_n1_0_0/0",
+				"/object/instances/sphere/chunk_0_0_0/2",
+				"/object/instances/sphere/chunk_1_0_0/4",
+			},
+			"cubeSet" : {
+				"/object/instances/cubeGroup/chunk_n1_0_0/1/cube",
+				"/object/instances/cubeGroup/chunk_0_0_0/3/cube",
+			},
+		}
+
+		for setName, paths in expectedSets.items() :
+			self.assertEqual( set( instancer["out"].set( setName ).value.paths() ), paths )
+
+		self.assertSceneValid( instancer["out"] )
+
+		# Including when context variables are used.
+
+		instancer["seedEnabled"].setValue( True )
+		for setName, paths in expectedSets.items() :
+			self.assertEqual( set( instancer["out"].set( setName ).value.paths() ), paths )
+		instancer["seedEnabled"].setValue( False )
+
+		# Unencapsulating gives the same chunked hierarchy.
+
+		encapInstancer = GafferScene.Instancer()
+		encapInstancer["in"].setInput( objectToScene["out"] )
+		encapInstancer["prototypes"].setInput( prototypes["out"] )
+		encapInstancer["parent"].setValue( "/object" )
+		encapInstancer["prototypeIndex"].setValue( "index" )
+		encapInstancer["chunkSize"].setValue( 2 )
+		encapInstancer["encapsulate"].setValue( True )
+
+		unencapFilter = GafferScene.PathFilter()
+		unencapFilter["paths"].setValue( IECore.StringVectorData( [ "/..." ] ) )
+
+		unencap = GafferScene.Unencapsulate()
+		unencap["in"].setInput( encapInstancer["out"] )
+		unencap["filter"].setInput( unencapFilter["out"] )
+
+		self.assertScenesEqual( unencap["out"], instancer["out"] )
+
+		# Turning off chunking restores the flat hierarchy.
+
+		instancer["chunkSize"].setValue( 0 )
+		self.assertEqual(
+			instancer["out"].childNames( "/object/instances/sphere" ),
+			IECore.InternedStringVectorData( [ "0", "2", "4" ] )
+		)
+
+	def testChunkSizeVaryingPerLocation( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["plane"] = GafferScene.Plane()
+		script["plane"]["divisions"].setValue( imath.V2i( 1 ) )
+
+		script["group"] = GafferScene.Group()
+		script["group"]["in"][0].setInput( script["plane"]["out"] )
+		script["group"]["in"][1].setInput( script["plane"]["out"] )
+
+		script["sphere"] = GafferScene.Sphere()
+
+		script["filter"] = GafferScene.PathFilter()
+		script["filter"]["paths"].setValue( IECore.StringVectorData( [ "/group/*" ] ) )
+
+		script["instancer"] = GafferScene.Instancer()
+		script["instancer"]["in"].setInput( script["group"]["out"] )
+		script["instancer"]["prototypes"].setInput( script["sphere"]["out"] )
+		script["instancer"]["filter"].setInput( script["filter"]["out"] )
+
+		# Chunk only the instances of the second plane.
+
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression(
+			'parent["instancer"]["chunkSize"] = 10.0 if context.get( "scene:path", [] )[-1:] == [ "plane1" ] else 0.0'
+		)
+
+		self.assertEqual(
+			script["instancer"]["out"].childNames( "/group/plane/instances/sphere" ),
+			IECore.InternedStringVectorData( [ "0", "1", "2", "3" ] )
+		)
+		chunkNames = script["instancer"]["out"].childNames( "/group/plane1/instances/sphere" )
+		self.assertEqual(
+			{ str( n ) for n in chunkNames },
+			{ "chunk_n1_n1_0", "chunk_0_n1_0", "chunk_n1_0_0", "chunk_0_0_0" }
+		)
+
+		chunkPath = "/group/plane1/instances/sphere/" + str( chunkNames[0] )
+		self.assertEqual( script["instancer"]["out"].object( chunkPath ), IECore.NullObject.defaultNullObject() )
+		self.assertEqual( script["instancer"]["out"].transform( chunkPath ), imath.M44f() )
+
+		instanceNames = script["instancer"]["out"].childNames( chunkPath )
+		self.assertEqual( len( instanceNames ), 1 )
+		self.assertEqual(
+			script["instancer"]["out"].object( chunkPath + "/" + str( instanceNames[0] ) ),
+			script["sphere"]["out"].object( "/sphere" )
+		)
+		self.assertSceneValid( script["instancer"]["out"] )
+
+	def testSetsOnSomePrototypes( self ) :
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 6 ) ] ) )
+		points["index"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.IntVectorData( [ 0, 1, 2, 0, 1, 2 ] ),
+		)
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( points )
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "sphereSet sharedSet" )
+
+		cube = GafferScene.Cube()
+		cube["sets"].setValue( "sharedSet" )
+
+		plane = GafferScene.Plane()
+
+		prototypes = GafferScene.Parent()
+		prototypes["in"].setInput( sphere["out"] )
+		prototypes["children"][0].setInput( cube["out"] )
+		prototypes["children"][1].setInput( plane["out"] )
+		prototypes["parent"].setValue( "/" )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( objectToScene["out"] )
+		instancer["prototypes"].setInput( prototypes["out"] )
+		instancer["parent"].setValue( "/object" )
+		instancer["prototypeIndex"].setValue( "index" )
+
+		expectedSets = {
+			"sphereSet" : {
+				"/object/instances/sphere/0",
+				"/object/instances/sphere/3",
+			},
+			"sharedSet" : {
+				"/object/instances/sphere/0",
+				"/object/instances/sphere/3",
+				"/object/instances/cube/1",
+				"/object/instances/cube/4",
+			},
+		}
+
+		# Check both the regular path, and the path used when the prototypes
+		# are evaluated in a different context for each instance.
+
+		for seedEnabled in [ False, True ] :
+			with self.subTest( seedEnabled = seedEnabled ) :
+				instancer["seedEnabled"].setValue( seedEnabled )
+				for setName, paths in expectedSets.items() :
+					self.assertEqual( set( instancer["out"].set( setName ).value.paths() ), paths )
+				self.assertSceneValid( instancer["out"] )
+
+	def testChunkSizeWithInvalidConstantPrototype( self ) :
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 4 ) ] ) )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( points )
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "sphereSet" )
+
+		# Without a `prototypeIndex`, every point uses the first root,
+		# which is empty and therefore invalid. So no instances are output,
+		# but the location for the valid prototype still exists.
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( objectToScene["out"] )
+		instancer["prototypes"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/object" )
+		instancer["prototypeMode"].setValue( GafferScene.Instancer.PrototypeMode.IndexedRootsList )
+		instancer["prototypeRootsList"].setValue( IECore.StringVectorData( [ "", "/sphere" ] ) )
+
+		for chunkSize in [ 0, 2 ] :
+			with self.subTest( chunkSize = chunkSize ) :
+				instancer["chunkSize"].setValue( chunkSize )
+				self.assertEqual( instancer["out"].childNames( "/object/instances/sphere" ), IECore.InternedStringVectorData() )
+				self.assertTrue( instancer["out"].set( "sphereSet" ).value.isEmpty() )
+				self.assertSceneValid( instancer["out"] )
+
 	def testIds( self ) :
 		with self.subTest( useInt64 = False ):
 			self.runTestIds( False )
@@ -3473,6 +3722,14 @@ parent["radius"] = ( 2 + context.getFrame() ) * 15
 			nodes["instancer"]["out"].childNames( "/plane/instances/sphere" )
 			nodes["instancer"]["out"].childNames( "/plane/instances/cube" )
 
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testSetPerfWithSetOnOnePrototype( self ):
+		nodes = self.initSimpleInstancer( withPrototypes = True )
+		nodes["cube"]["sets"].setValue( "cubeSet" )
+		nodes["instancer"]["out"].setNames()
+		with GafferTest.TestRunner.PerformanceScope() :
+			nodes["instancer"]["out"].set( "cubeSet" )
+
 	@GafferTest.TestRunner.PerformanceTestMethod()
 	def testEncapsulatedRenderPerf( self ):
 		nodes = self.initSimpleInstancer( withPrototypes = True, withIds = False )
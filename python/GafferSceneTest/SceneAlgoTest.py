@@ -719,8 +719,38 @@ class SceneAlgoTest( GafferSceneTest.SceneTestCase ) :
 
 	def testMonitorMatchingPaths( self ) :
 
+		script = Gaffer.ScriptNode()
+
+		script["plane"] = GafferScene.Plane()
+		script["plane"]["divisions"].setValue( imath.V2i( 1000, 100 ) )
+
+		script["sphere"] = GafferScene.Sphere()
+
+		script["instancer"] = GafferScene.Instancer()
+		script["instancer"]["in"].setInput( script["plane"]["out"] )
+		script["instancer"]["prototypes"].setInput( script["sphere"]["out"] )
+		script["instancer"]["parent"].setValue( "/plane" )
+
+		# Paths are computed by an expression, so that `matchingPaths()`
+		# can't match against them directly, and must evaluate the filter
+		# at every location.
+		script["filter"] = GafferScene.PathFilter()
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( 'parent["filter"]["paths"] = IECore.StringVectorData( [ "/plane/instances/sphere/*" ] )' )
+
+		paths = IECore.PathMatcher()
+		with Gaffer.PerformanceMonitor() as m :
+			GafferScene.SceneAlgo.matchingPaths( script["filter"]["out"], script["instancer"]["out"], paths )
+
+		self.assertEqual(
+			m.plugStatistics( script["filter"]["out"] ).computeCount,
+			len( script["instancer"]["out"].childNames( "/plane/instances/sphere" ) ) + 4,
+		)
+
+	def testMatchingPathsWithConstantPathFilter( self ) :
+
 		plane = GafferScene.Plane()
-		plane["divisions"].setValue( imath.V2i( 1000, 100 ) )
+		plane["divisions"].setValue( imath.V2i( 100, 10 ) )
 
 		sphere = GafferScene.Sphere()
 
@@ -730,16 +760,39 @@ class SceneAlgoTest( GafferSceneTest.SceneTestCase ) :
 		instancer["parent"].setValue( "/plane" )
 
 		filter = GafferScene.PathFilter()
-		filter["paths"].setValue( IECore.StringVectorData( [ "/plane/instances/sphere/*" ] ) )
+		filter["paths"].setValue( IECore.StringVectorData( [ "/plane/instances/sphere/1*", "/plane/.../sphere" ] ) )
+		self.assertIsNotNone( filter.constantPathMatcher() )
+
+		expectedPaths = { "/plane/instances/sphere" }
+		expectedPaths.update( "/plane/instances/sphere/" + n.value() for n in instancer["out"].childNames( "/plane/instances/sphere" ) if n.value().startswith( "1" ) )
+
+		# The constant PathMatcher should be used directly, without
+		# evaluating the filter at each location.
 
 		paths = IECore.PathMatcher()
 		with Gaffer.PerformanceMonitor() as m :
 			GafferScene.SceneAlgo.matchingPaths( filter["out"], instancer["out"], paths )
 
-		self.assertEqual(
-			m.plugStatistics( filter["out"] ).computeCount,
-			len( instancer["out"].childNames( "/plane/instances/sphere" ) ) + 4,
-		)
+		self.assertEqual( set( paths.paths() ), expectedPaths )
+		self.assertEqual( m.plugStatistics( filter["out"] ).computeCount, 0 )
+
+		# Disabling the filter should match nothing.
+
+		filter["enabled"].setValue( False )
+		GafferScene.SceneAlgo.matchingPaths( filter["out"], instancer["out"], paths )
+		self.assertTrue( paths.isEmpty() )
+
+		# And using `roots` should fall back to evaluating per location.
+
+		filter["enabled"].setValue( True )
+		rootsFilter = GafferScene.PathFilter()
+		rootsFilter["paths"].setValue( IECore.StringVectorData( [ "/plane/instances" ] ) )
+		filter["roots"].setInput( rootsFilter["out"] )
+		self.assertIsNone( filter.constantPathMatcher() )
+
+		filter["paths"].setValue( IECore.StringVectorData( [ "/sphere" ] ) )
+		GafferScene.SceneAlgo.matchingPaths( filter["out"], instancer["out"], paths )
+		self.assertEqual( paths.paths(), [ "/plane/instances/sphere" ] )
 
 	def testObjectTweaksWithSetFilter( self ) :
 
@@ -2197,6 +2250,114 @@ class SceneAlgoTest( GafferSceneTest.SceneTestCase ) :
 			result = IECore.PathMatcher()
 			GafferScene.SceneAlgo.matchingPaths( pathMatcher, scene, result )
 
+	def testHierarchy( self ) :
+
+		# /group
+		#    /sphere
+		#    /group
+		#       /cube
+		# /plane
+
+		sphere = GafferScene.Sphere()
+		cube = GafferScene.Cube()
+		plane = GafferScene.Plane()
+
+		innerGroup = GafferScene.Group()
+		innerGroup["in"][0].setInput( cube["out"] )
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( sphere["out"] )
+		group["in"][1].setInput( innerGroup["out"] )
+
+		parent = GafferScene.Parent()
+		parent["in"].setInput( group["out"] )
+		parent["parent"].setValue( "/" )
+		parent["children"][0].setInput( plane["out"] )
+
+		hierarchy = GafferScene.SceneAlgo.hierarchy( parent["out"] )
+		self.assertEqual(
+			[ hierarchy.path( i ) for i in range( 0, len( hierarchy ) ) ],
+			[ "/", "/group", "/plane", "/group/sphere", "/group/group", "/group/group/cube" ]
+		)
+
+		self.assertEqual( hierarchy.name( 0 ), "" )
+		self.assertEqual( hierarchy.parent( 0 ), -1 )
+		self.assertEqual( hierarchy.children( 0 ), [ 1, 2 ] )
+		self.assertEqual( hierarchy.children( 1 ), [ 3, 4 ] )
+		self.assertEqual( hierarchy.children( 2 ), [] )
+		self.assertEqual( hierarchy.children( 5 ), [] )
+
+		for i in range( 0, len( hierarchy ) ) :
+			path = hierarchy.path( i )
+			self.assertEqual( hierarchy.find( path ), i )
+			self.assertEqual( [ hierarchy.name( c ) for c in hierarchy.children( i ) ], [ str( n ) for n in parent["out"].childNames( path ) ] )
+			for c in hierarchy.children( i ) :
+				self.assertEqual( hierarchy.parent( c ), i )
+
+		self.assertEqual( hierarchy.find( "/group/cube" ), -1 )
+		self.assertEqual( hierarchy.find( "/group/sphere/child" ), -1 )
+
+		with self.assertRaises( IndexError ) :
+			hierarchy.path( len( hierarchy ) )
+
+		# Snapshot below a specific root.
+
+		hierarchy = GafferScene.SceneAlgo.hierarchy( parent["out"], "/group/group" )
+		self.assertEqual( len( hierarchy ), 2 )
+		self.assertEqual( hierarchy.name( 0 ), "group" )
+		self.assertEqual( hierarchy.path( 1 ), "/group/group/cube" )
+		self.assertEqual( hierarchy.find( "/group/group/cube" ), 1 )
+		self.assertEqual( hierarchy.find( "/plane" ), -1 )
+
+	def testHierarchySpanningManyBatches( self ) :
+
+		# Enough instances that the levels below them are visited
+		# in several batches.
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 200, 100 ) )
+
+		cube = GafferScene.Cube()
+		prototype = GafferScene.Group()
+		prototype["in"][0].setInput( cube["out"] )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( prototype["out"] )
+		instancer["parent"].setValue( "/plane" )
+
+		numInstances = 201 * 101
+		hierarchy = GafferScene.SceneAlgo.hierarchy( instancer["out"] )
+		# "/", "/plane", "/plane/instances", "/plane/instances/group", then
+		# an instance and a cube per point.
+		self.assertEqual( len( hierarchy ), 4 + numInstances * 2 )
+
+		for i in list( range( 0, 10 ) ) + list( range( 16380, 16390 ) ) + list( range( len( hierarchy ) - 10, len( hierarchy ) ) ) :
+			path = hierarchy.path( i )
+			self.assertEqual( hierarchy.find( path ), i )
+			self.assertEqual( [ hierarchy.name( c ) for c in hierarchy.children( i ) ], [ str( n ) for n in instancer["out"].childNames( path ) ] )
+
+		self.assertEqual( hierarchy.path( len( hierarchy ) - 1 ), "/plane/instances/group/{}/cube".format( numInstances - 1 ) )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testHierarchyPerformance( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 1000, 500 ) )
+
+		sphere = GafferScene.Sphere()
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/plane" )
+
+		# Compute the instancer engine up front, so we measure only traversal.
+		instancer["out"].childNames( "/plane/instances/sphere" )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferScene.SceneAlgo.hierarchy( instancer["out"] )
+
 	def testHierarchyHash( self ) :
 
 		# We need to check that changing basically anything about a scene will result in a unique hash
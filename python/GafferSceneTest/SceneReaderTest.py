@@ -826,5 +826,69 @@ class SceneReaderTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( len( mh.messages ), 1 )
 		self.assertEqual( mh.messages[0].message, 'No file found for "/volume"' )
 
+	def testObjectMode( self ) :
+
+		sc = IECoreScene.SceneCache( str( self.__testFile ), IECore.IndexedIO.OpenMode.Write )
+		s = sc.createChild( "shape" )
+		s.writeObject( IECoreScene.SpherePrimitive( 10 ), 0.0 )
+		del sc, s
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setValue( self.__testFile )
+		reader["refreshCount"].setValue( self.uniqueInt( self.__testFile ) )
+		self.assertEqual( reader["objectMode"].getValue(), reader.ObjectMode.Full )
+
+		sphere = IECoreScene.SpherePrimitive( 10 )
+		self.assertEqual( reader["out"].object( "/shape" ), sphere )
+
+		reader["objectMode"].setValue( reader.ObjectMode.Bound )
+		placeholder = reader["out"].object( "/shape" )
+		self.assertIsInstance( placeholder, IECoreScene.MeshPrimitive )
+		self.assertEqual( placeholder.bound(), reader["out"].bound( "/shape" ) )
+		self.assertEqual( reader["out"].object( "/" ), IECore.NullObject() )
+		self.assertSceneValid( reader["out"] )
+
+		reader["objectMode"].setValue( reader.ObjectMode.BoundInViewer )
+		self.assertEqual( reader["out"].object( "/shape" ), sphere )
+
+		with Gaffer.Context() as context :
+			context["scene:renderer"] = "OpenGL"
+			self.assertEqual( reader["out"].object( "/shape" ), placeholder )
+			context["scene:renderer"] = "Arnold"
+			self.assertEqual( reader["out"].object( "/shape" ), sphere )
+
+	def testObjectModeOnlyAffectsLeafGeometry( self ) :
+
+		sc = IECoreScene.SceneCache( str( self.__testFile ), IECore.IndexedIO.OpenMode.Write )
+		parent = sc.createChild( "parent" )
+		parent.writeObject( IECoreScene.SpherePrimitive( 1 ), 0.0 )
+		child = parent.createChild( "child" )
+		child.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( 10, 0, 0 ) ) ), 0.0 )
+		child.writeObject( IECoreScene.SpherePrimitive( 1 ), 0.0 )
+		camera = sc.createChild( "camera" )
+		camera.writeObject( IECoreScene.Camera(), 0.0 )
+		camera.writeTags( [ "__cameras" ] )
+		del sc, parent, child, camera
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setValue( self.__testFile )
+		reader["refreshCount"].setValue( self.uniqueInt( self.__testFile ) )
+		reader["objectMode"].setValue( reader.ObjectMode.Bound )
+
+		# The stored bound for `/parent` includes `/parent/child`, so
+		# a placeholder would be the wrong size. Load it in full instead.
+		self.assertGreater( reader["out"].bound( "/parent" ).size().x, 2 )
+		self.assertEqual( reader["out"].object( "/parent" ), IECoreScene.SpherePrimitive( 1 ) )
+
+		placeholder = reader["out"].object( "/parent/child" )
+		self.assertIsInstance( placeholder, IECoreScene.MeshPrimitive )
+		self.assertEqual( placeholder.bound(), reader["out"].bound( "/parent/child" ) )
+
+		# Cameras are always loaded in full.
+		self.assertIn( "/camera", reader["out"].set( "__cameras" ).value.paths() )
+		self.assertIsInstance( reader["out"].object( "/camera" ), IECoreScene.Camera )
+
+		self.assertSceneValid( reader["out"] )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -34,6 +34,8 @@
 #
 ##########################################################################
 
+import time
+import pathlib
 import unittest
 import inspect
 import imath
@@ -42,6 +44,7 @@ import IECore
 import IECoreScene
 
 import Gaffer
+import GafferTest
 import GafferDispatch
 import GafferScene
 import GafferSceneTest
@@ -411,6 +414,72 @@ class SceneWriterTest( GafferSceneTest.SceneTestCase ) :
 
 				self.assertScenesEqual( reader["out"], writer["in"], checks = { "childNames" } )
 
+	def testDeepHierarchy( self ) :
+
+		cube = GafferScene.Cube()
+
+		cubeFilter = GafferScene.PathFilter()
+		cubeFilter["paths"].setValue( IECore.StringVectorData( [ "/cube" ] ) )
+
+		duplicate = GafferScene.Duplicate()
+		duplicate["in"].setInput( cube["out"] )
+		duplicate["filter"].setInput( cubeFilter["out"] )
+		duplicate["copies"].setValue( 10 )
+
+		scene = duplicate["out"]
+		groups = []
+		for i in range( 0, 10 ) :
+			group = GafferScene.Group()
+			group["in"][0].setInput( scene )
+			group["in"][1].setInput( cube["out"] )
+			group["transform"]["translate"]["x"].setValue( i )
+			groups.append( group )
+			scene = group["out"]
+
+		writer = GafferScene.SceneWriter()
+		writer["in"].setInput( scene )
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setInput( writer["fileName"] )
+
+		for extension in self.__extensions :
+			with self.subTest( extension = extension ) :
+
+				writer["fileName"].setValue( self.temporaryDirectory() / ( "deep" + extension ) )
+				writer["task"].execute()
+
+				self.assertScenesEqual( reader["out"], writer["in"], checks = { "transform", "object", "childNames" } )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testWritePerformance( self ) :
+
+		cube = GafferScene.Cube()
+
+		cubeFilter = GafferScene.PathFilter()
+		cubeFilter["paths"].setValue( IECore.StringVectorData( [ "/cube" ] ) )
+
+		duplicate = GafferScene.Duplicate()
+		duplicate["in"].setInput( cube["out"] )
+		duplicate["filter"].setInput( cubeFilter["out"] )
+		duplicate["copies"].setValue( 20000 )
+
+		scene = duplicate["out"]
+		groups = []
+		for i in range( 0, 8 ) :
+			group = GafferScene.Group()
+			group["in"][0].setInput( scene )
+			groups.append( group )
+			scene = group["out"]
+
+		writer = GafferScene.SceneWriter()
+		writer["in"].setInput( scene )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.scc" )
+
+		GafferSceneTest.traverseScene( writer["in"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			writer["task"].execute()
+
 	def testAnimatedSets( self ) :
 
 		# `IECoreScene::SceneInterface` doesn't support animated sets, so we
@@ -516,5 +585,35 @@ class SceneWriterTest( GafferSceneTest.SceneTestCase ) :
 		scene = IECoreScene.SceneCache( writer["fileName"].getValue(), IECore.IndexedIO.Read )
 		self.assertEqual( scene.readAttribute( "gaffer:globals", 1 ), writer["in"].globals() )
 
+	def testSkipUnchanged( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		writer = GafferScene.SceneWriter()
+		writer["in"].setInput( sphere["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.scc" )
+		writer["skipUnchanged"].setValue( True )
+
+		writer["task"].execute()
+		fileName = pathlib.Path( writer["fileName"].getValue() )
+		modificationTime = fileName.stat().st_mtime_ns
+
+		# Reexecuting with an unchanged scene shouldn't touch the file.
+
+		writer["task"].execute()
+		self.assertEqual( fileName.stat().st_mtime_ns, modificationTime )
+
+		# But changing the scene should.
+
+		time.sleep( 0.1 )
+		sphere["radius"].setValue( 2 )
+		writer["task"].execute()
+		self.assertNotEqual( fileName.stat().st_mtime_ns, modificationTime )
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setInput( writer["fileName"] )
+		self.assertScenesEqual( reader["out"], writer["in"], checks = { "transform", "object", "attributes", "childNames" } )
+		self.assertNotIn( "gaffer:sceneWriter:hash", reader["out"].attributes( "/" ) )
+
 if __name__ == "__main__":
 	unittest.main()
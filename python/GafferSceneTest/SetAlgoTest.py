@@ -331,6 +331,42 @@ class SetAlgoTest( GafferSceneTest.SceneTestCase ) :
 
 		self.assertFalse( GafferScene.SetAlgo.affectsSetExpression( Gaffer.IntPlug() ) )
 
+	def testRepeatedEvaluation( self ) :
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "A" )
+
+		cube = GafferScene.Cube()
+		cube["sets"].setValue( "B" )
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( sphere["out"] )
+		group["in"][1].setInput( cube["out"] )
+
+		# Parsed expressions are reused between calls, so we need to check
+		# that results and hashes still track changes to the scene.
+
+		self.assertCorrectEvaluation( group["out"], "A | B", [ "/group/sphere", "/group/cube" ] )
+		self.assertCorrectEvaluation( group["out"], "A - B", [ "/group/sphere" ] )
+		h = GafferScene.SetAlgo.setExpressionHash( "A | B", group["out"] )
+
+		cube["sets"].setValue( "A B" )
+		self.assertCorrectEvaluation( group["out"], "A | B", [ "/group/sphere", "/group/cube" ] )
+		self.assertCorrectEvaluation( group["out"], "A - B", [ "/group/sphere" ] )
+		self.assertNotEqual( GafferScene.SetAlgo.setExpressionHash( "A | B", group["out"] ), h )
+
+		sphere["sets"].setValue( "" )
+		self.assertCorrectEvaluation( group["out"], "A | B", [ "/group/cube" ] )
+		self.assertCorrectEvaluation( group["out"], "A - B", [] )
+
+		# Syntax errors must be reported every time, not just the first.
+
+		for i in range( 0, 2 ) :
+			with self.assertRaisesRegex( RuntimeError, "Syntax error" ) :
+				GafferScene.SetAlgo.evaluateSetExpression( "A - (B", group["out"] )
+			with self.assertRaisesRegex( RuntimeError, "Syntax error" ) :
+				GafferScene.SetAlgo.setExpressionHash( "A - (B", group["out"] )
+
 	def assertCorrectEvaluation( self, scenePlug, expression, expectedContents ) :
 
 		result = set( GafferScene.SetAlgo.evaluateSetExpression( expression, scenePlug ).paths() )
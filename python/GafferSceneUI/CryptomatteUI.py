@@ -57,7 +57,7 @@ def _findCryptomatteNode( sourcePlug ) :
 
 	return Gaffer.PlugAlgo.findDestination(
 		sourcePlug,
-		lambda plug : plug.parent() if isinstance( plug.parent(), GafferScene.Cryptomatte ) else None
+		lambda plug : plug.node() if isinstance( plug.node(), GafferScene.Cryptomatte ) else None
 	)
 
 class _CryptomatteNamesPlugValueWidget( GafferUI.VectorDataPlugValueWidget ) :
@@ -286,6 +286,30 @@ Gaffer.Metadata.registerNode(
 
 		},
 
+		"mattes" : {
+
+			"description" :
+			"""
+			Additional mattes to be extracted, each into its own output
+			channel. The name of each entry specifies the output channel
+			and the value specifies the matte names, using the same syntax
+			as the `matteNames` plug. All mattes are extracted together
+			in a single pass over the Cryptomatte layer, so this is much
+			more efficient than using a separate Cryptomatte node for each
+			matte.
+			""",
+
+			"plugCreationWidget:includedTypes" : "Gaffer.StringVectorDataPlug",
+			"plugCreationWidget:action" : "addNameValuePlug",
+
+		},
+
+		"mattes.*.value" : {
+
+			"plugValueWidget:type" : "GafferSceneUI.CryptomatteUI._CryptomatteNamesPlugValueWidget",
+
+		},
+
 		"manifestScene" : {
 
 			"description" :
@@ -616,6 +616,27 @@ Gaffer.Metadata.registerNode(
 
 		},
 
+		"chunkSize" : {
+
+			"description" :
+			"""
+			When non-zero, instances are grouped into chunks according to
+			their position, with each chunk being a cube of this size.
+			The chunks are output as additional locations between the
+			prototype and the instances, so instances are found at
+			`<name>/<prototype>/<chunk>/<id>`. Each chunk has a tight bounding
+			box, allowing the Viewer and renderers to cull and process large
+			numbers of instances in smaller units.
+
+			> Tip : Chunk names are derived from integer grid coordinates, for
+			> example `chunk_0_n1_2` for the cell at (0, -1, 2), so they remain
+			> stable while the instances move within their chunk.
+			""",
+
+			"layout:section" : "Settings.Chunking",
+
+		},
+
 		"seedEnabled" : {
 			"description" :
 			"""
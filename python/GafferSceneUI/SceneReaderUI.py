@@ -114,6 +114,31 @@ Gaffer.Metadata.registerNode(
 
 		},
 
+		"objectMode" : {
+
+			"description" :
+			"""
+			Controls how objects are loaded. "Full" loads objects as normal.
+			"Bound" replaces each object with a box matching the bound stored
+			in the file, without loading the object at all. This can make
+			heavy scenes much quicker to view and lay out. "Bound In Viewer"
+			uses bounds only in the Viewer (when the `scene:renderer` context
+			variable is "OpenGL"), and loads objects in full for rendering.
+
+			> Note : Placeholders are only used for objects at leaf locations,
+			> because the bounds stored for other locations also include their
+			> descendants. Objects at non-leaf locations, and the members of the
+			> `__cameras` and `__lights` sets, are always loaded in full.
+			""",
+
+			"preset:Full" : GafferScene.SceneReader.ObjectMode.Full,
+			"preset:Bound" : GafferScene.SceneReader.ObjectMode.Bound,
+			"preset:Bound In Viewer" : GafferScene.SceneReader.ObjectMode.BoundInViewer,
+
+			"plugValueWidget:type" : "GafferUI.PresetsPlugValueWidget",
+
+		},
+
 	}
 
 )
@@ -72,6 +72,33 @@ Gaffer.Metadata.registerNode(
 
 		},
 
+		"skipUnchanged" : {
+
+			"description" :
+			"""
+			Avoids rewriting files whose contents would be unchanged. A hash
+			of the scene is stored in each file written, and on subsequent
+			executions the file is only rewritten if the hash of the
+			current scene differs. This can greatly speed up republishing
+			when only some files have changed.
+
+			> Caution : The hash only reflects the node graph, not the contents
+			> of any files read by it. If a file loaded by a SceneReader (or a
+			> texture or other external file) is modified in place, the hash is
+			> unchanged and the output will _not_ be rewritten, leaving it out
+			> of date. In this case, increment the SceneReader's `refreshCount`
+			> or turn this option off. Conversely, some hashes, such as those
+			> of Encapsulate nodes, are specific to the process they were
+			> computed in, so scenes containing them will always be rewritten.
+
+			> Note : This requires a file format that supports attributes at the
+			> root of the scene, such as SceneCache (.scc). Files written with
+			> this option on contain an additional `gaffer:sceneWriter:hash`
+			> attribute, which is ignored by the SceneReader.
+			""",
+
+		},
+
 		"in" : {
 
 			"description" :
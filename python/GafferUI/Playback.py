@@ -140,14 +140,36 @@ class Playback( object ) :
 		self.setState( self.State.Stopped )
 		self.__incrementFrame( increment )
 
-	def __timerCallback( self ) :
+	## Returns the next `count` frames that will be visited if playback
+	# continues in its current direction, wrapping around the frame range
+	# in the same way as playback itself. Returns an empty list if playback
+	# is not in progress. This is useful for prefetching data ahead of time.
+	def upcomingFrames( self, count ) :
+
+		increment = self.__increment()
+		if increment is None :
+			return []
+
+		result = []
+		frame = self.context().getFrame()
+		for i in range( 0, count ) :
+			frame = self.__wrapFrame( frame + increment )
+			result.append( frame )
+
+		return result
+
+	def __increment( self ) :
 
-		increment = None
 		if self.__state == self.State.PlayingForwards :
-			increment = 1
+			return 1
 		elif self.__state == self.State.PlayingBackwards :
-			increment = -1
+			return -1
 
+		return None
+
+	def __timerCallback( self ) :
+
+		increment = self.__increment()
 		if increment is None :
 			return
 
@@ -155,10 +177,15 @@ class Playback( object ) :
 
 	def __incrementFrame( self, increment ) :
 
-		frame = self.context().getFrame() + increment
+		self.context().setFrame(
+			self.__wrapFrame( self.context().getFrame() + increment )
+		)
+
+	def __wrapFrame( self, frame ) :
+
 		if frame > self.__frameRange[1] :
 			frame = self.__frameRange[0] + ( frame - math.floor( frame ) )
 		elif frame < self.__frameRange[0] :
 			frame = self.__frameRange[1] + ( frame - math.floor( frame ) )
 
-		self.context().setFrame( frame )
+		return frame
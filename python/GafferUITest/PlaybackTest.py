@@ -72,5 +72,24 @@ class PlaybackTest( GafferUITest.TestCase ) :
 		s2.execute( s.serialise() )
 		self.assertEqual( s2.context().getFrame(), s.context().getFrame() )
 
+	def testUpcomingFrames( self ) :
+
+		c = Gaffer.Context()
+		c.setFrame( 9 )
+
+		p = GafferUI.Playback.acquire( c )
+		p.setFrameRange( 1, 10 )
+		self.assertEqual( p.upcomingFrames( 3 ), [] )
+
+		p.setState( p.State.PlayingForwards )
+		self.assertEqual( p.upcomingFrames( 3 ), [ 10, 1, 2 ] )
+
+		c.setFrame( 2 )
+		p.setState( p.State.PlayingBackwards )
+		self.assertEqual( p.upcomingFrames( 3 ), [ 1, 10, 9 ] )
+
+		p.setState( p.State.Stopped )
+		self.assertEqual( p.upcomingFrames( 3 ), [] )
+
 if __name__ == "__main__":
 	unittest.main()
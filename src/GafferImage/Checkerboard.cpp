@@ -262,19 +262,27 @@ void Checkerboard::hashChannelData( const GafferImage::ImagePlug *output, const
 {
 	FlatImageSource::hashChannelData( output, context, h );
 
-	V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
-	h.append( tileOrigin );
-
 	string channelName = context->get<std::string>( ImagePlug::channelNameContextName );
-	h.append( channelName );
-
 	const int channelIndex = ImageAlgo::colorIndex( channelName );
 	if( channelIndex == -1 )
 	{
 		throw IECore::Exception( "Evaluated with invalid channel name: \"" + channelName + "\". This indicates a bug in a downstream node." );
 	}
-	colorAPlug()->getChild( channelIndex )->hash( h );
-	colorBPlug()->getChild( channelIndex )->hash( h );
+
+	const float valueA = colorAPlug()->getChild( channelIndex )->getValue();
+	const float valueB = colorBPlug()->getChild( channelIndex )->getValue();
+	if( valueA == valueB )
+	{
+		// Constant tile, independent of position.
+		h.append( valueA );
+		return;
+	}
+
+	V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+	h.append( tileOrigin );
+	h.append( channelName );
+	h.append( valueA );
+	h.append( valueB );
 
 	h.append( sizePlug()->getValue() );
 	transformPlug()->hash( h );
@@ -290,6 +298,11 @@ IECore::ConstFloatVectorDataPtr Checkerboard::computeChannelData( const std::str
 
 	const float valueA = colorAPlug()->getChild( channelIndex )->getValue();
 	const float valueB = colorBPlug()->getChild( channelIndex )->getValue();
+	if( valueA == valueB )
+	{
+		return ImagePlug::constantTile( valueA );
+	}
+
 	const V2f size = sizePlug()->getValue();
 	const M33f transform = transformPlug()->matrix();
 	const M33f inverseTransform = transform.inverse();
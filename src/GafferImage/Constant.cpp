@@ -193,8 +193,5 @@ IECore::ConstFloatVectorDataPtr Constant::computeChannelData( const std::string
 	}
 	const float value = colorPlug()->getChild( channelIndex )->getValue();
 
-	FloatVectorDataPtr result = new FloatVectorData;
-	result->writable().resize( ImagePlug::tileSize() * ImagePlug::tileSize(), value );
-
-	return result;
+	return ImagePlug::constantTile( value );
 }
@@ -755,6 +755,36 @@ IECore::IntVectorDataPtr computeSampleSorting(
 	return resultData;
 }
 
+// Given sorted Z and ZBack channels, modifies the depths of any samples that lie within `tolerance`
+// of an earlier sample in the same pixel, so that they exactly match that sample. SampleMerge will
+// then combine them into a single output sample. Each sample is compared with the first sample of
+// its group, rather than with the previous sample, so that a long run of samples can't drift by
+// more than `tolerance`.
+void snapNearbyDepths( const std::vector<int> &sampleOffsets, std::vector<float> &z, std::vector<float> &zBack, float tolerance )
+{
+	int prevOffset = 0;
+	for( const int offset : sampleOffsets )
+	{
+		int groupStart = prevOffset;
+		for( int i = prevOffset + 1; i < offset; i++ )
+		{
+			if(
+				z[i] - z[groupStart] <= tolerance &&
+				std::abs( std::max( z[i], zBack[i] ) - std::max( z[groupStart], zBack[groupStart] ) ) <= tolerance
+			)
+			{
+				z[i] = z[groupStart];
+				zBack[i] = zBack[groupStart];
+			}
+			else
+			{
+				groupStart = i;
+			}
+		}
+		prevOffset = offset;
+	}
+}
+
 void checkState( const std::vector<int> &offsets,
 	const std::vector<float> &zChannel, const std::vector<float> &zBackChannel,
 	bool &isSorted, bool &isTidy )
@@ -835,6 +865,7 @@ DeepState::DeepState( const std::string &name )
 	addChild( new BoolPlug( "pruneTransparent", Gaffer::Plug::In, false ) );
 	addChild( new BoolPlug( "pruneOccluded", Gaffer::Plug::In, false ) );
 	addChild( new FloatPlug( "occludedThreshold", Gaffer::Plug::In, 1.0 ) );
+	addChild( new FloatPlug( "mergeTolerance", Gaffer::Plug::In, 0.0f, 0.0f ) );
 
 	addChild( new CompoundObjectPlug( "__sampleMapping", Gaffer::Plug::Out, new IECore::CompoundObject ) );
 
@@ -890,14 +921,24 @@ const Gaffer::FloatPlug *DeepState::occludedThresholdPlug() const
 	return getChild<FloatPlug>( g_firstPlugIndex + 3 );
 }
 
+Gaffer::FloatPlug *DeepState::mergeTolerancePlug()
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::FloatPlug *DeepState::mergeTolerancePlug() const
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 4 );
+}
+
 Gaffer::CompoundObjectPlug *DeepState::sampleMappingPlug()
 {
-	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 4 );
+	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 5 );
 }
 
 const Gaffer::CompoundObjectPlug *DeepState::sampleMappingPlug() const
 {
-	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 4 );
+	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 5 );
 }
 
 void DeepState::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
@@ -928,6 +969,10 @@ void DeepState::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outp
 	{
 		outputs.push_back( sampleMappingPlug() );
 	}
+	else if( input == mergeTolerancePlug() )
+	{
+		outputs.push_back( sampleMappingPlug() );
+	}
 	else if( input == inPlug()->deepPlug() )
 	{
 		outputs.push_back( sampleMappingPlug() );
@@ -961,6 +1006,7 @@ void DeepState::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *co
 		pruneTransparentPlug()->hash( h );
 		pruneOccludedPlug()->hash( h );
 		occludedThresholdPlug()->hash( h );
+		mergeTolerancePlug()->hash( h );
 		deepStatePlug()->hash( h );
 		channelNamesData = inPlug()->channelNamesPlug()->getValue();
 	}
@@ -1013,7 +1059,7 @@ void DeepState::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 
 	TargetState requestedDeepState;
 	bool pruneTransparent, pruneOccluded;
-	float occludedThreshold;
+	float occludedThreshold, mergeTolerance;
 
 	{
 		ImagePlug::GlobalScope s( context );
@@ -1021,6 +1067,7 @@ void DeepState::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 		pruneTransparent = pruneTransparentPlug()->getValue();
 		pruneOccluded = pruneOccludedPlug()->getValue();
 		occludedThreshold = occludedThresholdPlug()->getValue();
+		mergeTolerance = mergeTolerancePlug()->getValue();
 
 		channelNamesData = inPlug()->channelNamesPlug()->getValue();
 	}
@@ -1032,6 +1079,9 @@ void DeepState::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 	ImagePlug::ChannelDataScope channelScope( Context::current() );
 	bool hasZ = ImageAlgo::channelExists( channelNames, ImageAlgo::channelNameZ );
 
+	// Merging nearby samples only makes sense when tidying, and requires depth
+	const bool mergeNearby = hasZ && requestedDeepState == TargetState::Tidy && mergeTolerance > 0.0f;
+
 	ConstFloatVectorDataPtr zData;
 	if( hasZ )
 	{
@@ -1099,7 +1149,7 @@ void DeepState::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 			return;
 		}
 		else if( requestedDeepState == TargetState::Sorted || ( requestedDeepState == TargetState::Tidy &&
-			!pruneTransparent && !pruneOccluded ) )
+			!pruneTransparent && !pruneOccluded && !mergeNearby ) )
 		{
 			// We're already sorted, nothing needs to be done
 			static_cast<CompoundObjectPlug *>( output )->setValue( result );
@@ -1139,6 +1189,17 @@ void DeepState::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 			}
 		}
 
+		if( mergeNearby )
+		{
+			// Snap the depths of nearby samples together, so that they are merged into a single
+			// sample rather than being split into many thin slivers.
+			FloatVectorDataPtr snappedZData = zData->copy();
+			FloatVectorDataPtr snappedZBackData = zBackData->copy();
+			snapNearbyDepths( sampleOffsetsData->readable(), snappedZData->writable(), snappedZBackData->writable(), mergeTolerance );
+			zData = snappedZData;
+			zBackData = snappedZBackData;
+		}
+
 		// Set up the sample merge data
 		SampleMerge sampleMerge( sampleOffsetsData->readable(),
 			hasZ ? &zData->readable() : nullptr, hasZ ? &zBackData->readable() : nullptr );
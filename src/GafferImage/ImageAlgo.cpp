@@ -36,12 +36,17 @@
 
 #include "GafferImage/ImageAlgo.h"
 
+#include "Gaffer/ThreadState.h"
+
 #include "IECore/CompoundData.h"
 
 #include "Imath/ImathBox.h"
 
 #include "fmt/format.h"
 
+#include "tbb/parallel_for.h"
+
+#include <numeric>
 #include <set>
 #include <regex>
 
@@ -497,6 +502,210 @@ IECore::ConstCompoundObjectPtr GafferImage::ImageAlgo::tiles( const ImagePlug *i
 	return result;
 }
 
+void GafferImage::ImageAlgo::copyPixels( const ImagePlug *imagePlug, const std::vector<std::string> &channelNames, const Imath::Box2i &window, float *buffer, const std::string *viewName )
+{
+	GafferImage::ImagePlug::ViewScope viewScope( Gaffer::Context::current() );
+	if( viewName )
+	{
+		viewScope.setViewName( viewName );
+	}
+	if( !viewIsValid( viewScope.context(), imagePlug->viewNames()->readable() ) )
+	{
+		throw IECore::Exception(
+			"ImageAlgo::copyPixels() : No view \"" +
+			viewScope.context()->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) + "\""
+		);
+	}
+
+	if( imagePlug->deepPlug()->getValue() )
+	{
+		throw IECore::Exception( "ImageAlgo::copyPixels() : Deep images are not supported" );
+	}
+
+	if( BufferAlgo::empty( window ) || channelNames.empty() )
+	{
+		return;
+	}
+
+	const Imath::Box2i dataWindow = imagePlug->dataWindowPlug()->getValue();
+	IECore::ConstStringVectorDataPtr existingChannelNamesData = imagePlug->channelNamesPlug()->getValue();
+
+	vector<const string *> existingChannels;
+	bool zeroFill = !BufferAlgo::contains( dataWindow, window );
+	for( const auto &channelName : channelNames )
+	{
+		if( channelExists( existingChannelNamesData->readable(), channelName ) )
+		{
+			existingChannels.push_back( &channelName );
+		}
+		else
+		{
+			existingChannels.push_back( nullptr );
+			zeroFill = true;
+		}
+	}
+
+	const size_t numChannels = channelNames.size();
+	const size_t width = window.size().x;
+	if( zeroFill )
+	{
+		std::fill( buffer, buffer + width * window.size().y * numChannels, 0.0f );
+	}
+
+	const Imath::Box2i processWindow = BufferAlgo::intersection( window, dataWindow );
+	if( BufferAlgo::empty( processWindow ) )
+	{
+		return;
+	}
+
+	parallelProcessTiles(
+		imagePlug,
+		[&] ( const ImagePlug *image, const Imath::V2i &tileOrigin )
+		{
+			const Imath::Box2i tileBound( tileOrigin, tileOrigin + Imath::V2i( ImagePlug::tileSize() ) );
+			const Imath::Box2i copyBound = BufferAlgo::intersection( tileBound, processWindow );
+
+			ImagePlug::ChannelDataScope channelDataScope( Gaffer::Context::current() );
+			for( size_t c = 0; c < numChannels; ++c )
+			{
+				if( !existingChannels[c] )
+				{
+					continue;
+				}
+
+				channelDataScope.setChannelName( existingChannels[c] );
+				IECore::ConstFloatVectorDataPtr channelData = image->channelDataPlug()->getValue();
+				const float *tileData = channelData->readable().data();
+
+				for( int y = copyBound.min.y; y < copyBound.max.y; ++y )
+				{
+					const float *source = tileData + BufferAlgo::index( Imath::V2i( copyBound.min.x, y ), tileBound );
+					float *destination = buffer + ( ( window.max.y - 1 - y ) * width + ( copyBound.min.x - window.min.x ) ) * numChannels + c;
+					for( int x = copyBound.min.x; x < copyBound.max.x; ++x )
+					{
+						*destination = *source++;
+						destination += numChannels;
+					}
+				}
+			}
+		},
+		processWindow
+	);
+}
+
+IECore::CompoundDataPtr GafferImage::ImageAlgo::samplePixels( const ImagePlug *imagePlug, const std::vector<std::string> &channelNames, const std::vector<Imath::V2f> &positions, bool interpolate, Sampler::BoundingMode boundingMode )
+{
+	IECore::CompoundDataPtr resultData = new IECore::CompoundData;
+
+	IECore::ConstStringVectorDataPtr existingChannelNamesData;
+	{
+		ImagePlug::GlobalScope globalScope( Gaffer::Context::current() );
+		if( imagePlug->deepPlug()->getValue() )
+		{
+			throw IECore::Exception( "ImageAlgo::samplePixels does not support deep image data" );
+		}
+		existingChannelNamesData = imagePlug->channelNamesPlug()->getValue();
+	}
+
+	std::vector<std::string> sampledChannels;
+	std::vector<std::vector<float> *> sampledResults;
+	for( const auto &channelName : channelNames )
+	{
+		if( resultData->readable().count( channelName ) )
+		{
+			// Duplicate. Replacing the existing entry would free the
+			// buffer already referenced by `sampledResults`.
+			continue;
+		}
+		IECore::FloatVectorDataPtr channelData = new IECore::FloatVectorData( std::vector<float>( positions.size(), 0.0f ) );
+		resultData->writable()[channelName] = channelData;
+		if( channelExists( existingChannelNamesData->readable(), channelName ) )
+		{
+			sampledChannels.push_back( channelName );
+			sampledResults.push_back( &channelData->writable() );
+		}
+	}
+
+	if( sampledChannels.empty() || positions.empty() )
+	{
+		return resultData;
+	}
+
+	// Sort the positions by tile, and split them into groups that
+	// each touch just a single tile (or a few neighbours for interpolated
+	// lookups near tile edges).
+
+	std::vector<Imath::V2i> pixels;
+	pixels.reserve( positions.size() );
+	for( const auto &p : positions )
+	{
+		pixels.push_back( Imath::V2i( floorf( p.x ), floorf( p.y ) ) );
+	}
+
+	std::vector<size_t> order( positions.size() );
+	std::iota( order.begin(), order.end(), 0 );
+	std::sort(
+		order.begin(), order.end(),
+		[&pixels] ( size_t a, size_t b ) {
+			const Imath::V2i tileA = ImagePlug::tileOrigin( pixels[a] );
+			const Imath::V2i tileB = ImagePlug::tileOrigin( pixels[b] );
+			return std::tie( tileA.y, tileA.x, a ) < std::tie( tileB.y, tileB.x, b );
+		}
+	);
+
+	std::vector<size_t> groupStarts;
+	for( size_t i = 0; i < order.size(); ++i )
+	{
+		if( i == 0 || ImagePlug::tileOrigin( pixels[order[i]] ) != ImagePlug::tileOrigin( pixels[order[i-1]] ) )
+		{
+			groupStarts.push_back( i );
+		}
+	}
+	groupStarts.push_back( order.size() );
+
+	const Gaffer::ThreadState &threadState = Gaffer::ThreadState::current();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, groupStarts.size() - 1, 1 ),
+		[&] ( const tbb::blocked_range<size_t> &range ) {
+
+			Gaffer::ThreadState::Scope threadStateScope( threadState );
+			for( size_t group = range.begin(); group != range.end(); ++group )
+			{
+				Imath::Box2i sampleWindow;
+				for( size_t i = groupStarts[group]; i < groupStarts[group+1]; ++i )
+				{
+					sampleWindow.extendBy( pixels[order[i]] );
+				}
+				sampleWindow.max += Imath::V2i( 1 );
+
+				// As in `parallelProcessTiles()`, we process channels serially
+				// to avoid contention where they share upstream dependencies.
+				for( size_t c = 0; c < sampledChannels.size(); ++c )
+				{
+					Sampler sampler( imagePlug, sampledChannels[c], sampleWindow, boundingMode );
+					std::vector<float> &result = *sampledResults[c];
+					for( size_t i = groupStarts[group]; i < groupStarts[group+1]; ++i )
+					{
+						const size_t index = order[i];
+						if( interpolate )
+						{
+							result[index] = sampler.sample( positions[index].x, positions[index].y );
+						}
+						else
+						{
+							result[index] = sampler.sample( pixels[index].x, pixels[index].y );
+						}
+					}
+				}
+			}
+		},
+		taskGroupContext
+	);
+
+	return resultData;
+}
+
 void GafferImage::ImageAlgo::throwIfSampleOffsetsMismatch( const IECore::IntVectorData* sampleOffsetsDataA, const IECore::IntVectorData* sampleOffsetsDataB, const Imath::V2i &tileOrigin, const std::string &message )
 {
 	if( sampleOffsetsDataA != sampleOffsetsDataB )
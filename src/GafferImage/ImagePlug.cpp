@@ -45,6 +45,9 @@
 
 #include "Gaffer/Context.h"
 #include "Gaffer/ContextAlgo.h"
+#include "Gaffer/Private/IECorePreview/LRUCache.h"
+
+#include <cstring>
 
 using namespace std;
 using namespace tbb;
@@ -200,6 +203,37 @@ const IECore::FloatVectorData *ImagePlug::blackTile()
 	return g_blackTile.get();
 };
 
+IECore::ConstFloatVectorDataPtr ImagePlug::constantTile( float value )
+{
+	uint32_t bits;
+	std::memcpy( &bits, &value, sizeof( bits ) );
+	if( bits == 0 )
+	{
+		return blackTile();
+	}
+	else if( value == 1.0f )
+	{
+		return whiteTile();
+	}
+
+	// Keyed on the bit pattern rather than the value itself, so
+	// that -0 and NaN get tiles of their own.
+	using ConstantTileCache = IECorePreview::LRUCache<uint32_t, ConstFloatVectorDataPtr>;
+	static ConstantTileCache g_cache(
+		[] ( uint32_t bits, size_t &cost, const IECore::Canceller *canceller ) -> ConstFloatVectorDataPtr {
+			float value;
+			std::memcpy( &value, &bits, sizeof( value ) );
+			cost = 1;
+			return new FloatVectorData( std::vector<float>( ImagePlug::tilePixels(), value ) );
+		},
+		// Tiles remain valid after eviction for as long as they are
+		// referenced, so this just limits the memory held speculatively.
+		256
+	);
+
+	return g_cache.get( bits );
+}
+
 bool ImagePlug::acceptsChild( const GraphComponent *potentialChild ) const
 {
 	if( !ValuePlug::acceptsChild( potentialChild ) )
@@ -86,6 +86,25 @@ std::string channelName( const ValuePlug *outChannelPlug, const vector<string> &
 	return "";
 }
 
+// Statistics are gathered hierarchically, first combining the tiles in
+// each row, and then combining the rows. The rows are identified by the
+// tiles in the first column of the area, and these functions return the
+// windows to pass to `parallelGatherTiles()` for each stage.
+
+Imath::Box2i rowBound( const Imath::Box2i &bound, const Context *context )
+{
+	const int y = context->get<Imath::V2i>( ImagePlug::tileOriginContextName ).y;
+	return Imath::Box2i(
+		Imath::V2i( bound.min.x, std::max( y, bound.min.y ) ),
+		Imath::V2i( bound.max.x, std::min( y + ImagePlug::tileSize(), bound.max.y ) )
+	);
+}
+
+Imath::Box2i firstColumnBound( const Imath::Box2i &bound )
+{
+	return Imath::Box2i( bound.min, Imath::V2i( bound.min.x + 1, bound.max.y ) );
+}
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -128,6 +147,7 @@ ImageStats::ImageStats( const std::string &name )
 	) );
 
 	addChild( new ObjectPlug( "__tileStats", Gaffer::Plug::Out, new IECore::V3dData() ) );
+	addChild( new ObjectPlug( "__rowStats", Gaffer::Plug::Out, new IECore::V3dData() ) );
 	addChild( new ObjectPlug( "__allStats", Gaffer::Plug::Out, new IECore::V3dData() ) );
 
 	addChild( new ImagePlug( "__flattenedIn", Plug::In, Plug::Default & ~Plug::Serialisable ) );
@@ -234,25 +254,35 @@ const ObjectPlug *ImageStats::tileStatsPlug() const
 	return getChild<ObjectPlug>( g_firstPlugIndex + 8 );
 }
 
-ObjectPlug *ImageStats::allStatsPlug()
+ObjectPlug *ImageStats::rowStatsPlug()
 {
 	return getChild<ObjectPlug>( g_firstPlugIndex + 9 );
 }
 
-const ObjectPlug *ImageStats::allStatsPlug() const
+const ObjectPlug *ImageStats::rowStatsPlug() const
 {
 	return getChild<ObjectPlug>( g_firstPlugIndex + 9 );
 }
 
+ObjectPlug *ImageStats::allStatsPlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 10 );
+}
+
+const ObjectPlug *ImageStats::allStatsPlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 10 );
+}
+
 
 ImagePlug *ImageStats::flattenedInPlug()
 {
-	return getChild<ImagePlug>( g_firstPlugIndex + 10 );
+	return getChild<ImagePlug>( g_firstPlugIndex + 11 );
 }
 
 const ImagePlug *ImageStats::flattenedInPlug() const
 {
-	return getChild<ImagePlug>( g_firstPlugIndex + 10 );
+	return getChild<ImagePlug>( g_firstPlugIndex + 11 );
 }
 
 void ImageStats::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
@@ -281,6 +311,19 @@ void ImageStats::affects( const Gaffer::Plug *input, AffectedPlugsContainer &out
 		input == areaSourcePlug() ||
 		areaPlug()->isAncestorOf( input )
 	)
+	{
+		outputs.push_back( rowStatsPlug() );
+	}
+
+	if(
+		input == viewPlug() ||
+		input == flattenedInPlug()->viewNamesPlug() ||
+		input == rowStatsPlug() ||
+		input == flattenedInPlug()->dataWindowPlug() ||
+		input == flattenedInPlug()->formatPlug() ||
+		input == areaSourcePlug() ||
+		areaPlug()->isAncestorOf( input )
+	)
 	{
 		outputs.push_back( allStatsPlug() );
 	}
@@ -381,6 +424,26 @@ void ImageStats::hash( const ValuePlug *output, const Context *context, IECore::
 		h.append( tileBound.max );
 		flattenedInPlug()->channelDataPlug()->hash( h );
 	}
+	else if( output == rowStatsPlug() )
+	{
+		// We traverse in TopToBottom order because otherwise the hash could change just based on
+		// the order in which hashes are combined
+		ImageAlgo::parallelGatherTiles(
+			flattenedInPlug(),
+			// Tile
+			[this] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin )
+			{
+				return tileStatsPlug()->hash();
+			},
+			// Gather
+			[ &h ] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin, const IECore::MurmurHash &tileHash )
+			{
+				h.append( tileHash );
+			},
+			rowBound( boundsIntersection, context ),
+			ImageAlgo::TopToBottom
+		);
+	}
 	else if( output == allStatsPlug() )
 	{
 		if( BufferAlgo::empty( boundsIntersection ) )
@@ -391,21 +454,19 @@ void ImageStats::hash( const ValuePlug *output, const Context *context, IECore::
 
 		h.append( beyondDataWindow );
 
-		// We traverse in TopToBottom order because otherwise the hash could change just based on
-		// the order in which hashes are combined
 		ImageAlgo::parallelGatherTiles(
 			flattenedInPlug(),
-			// Tile
+			// Row
 			[this] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin )
 			{
-				return tileStatsPlug()->hash();
+				return rowStatsPlug()->hash();
 			},
 			// Gather
-			[ &h ] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin, const IECore::MurmurHash &tileHash )
+			[ &h ] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin, const IECore::MurmurHash &rowHash )
 			{
-				h.append( tileHash );
+				h.append( rowHash );
 			},
-			boundsIntersection,
+			firstColumnBound( boundsIntersection ),
 			ImageAlgo::TopToBottom
 		);
 		h.append( areaMult );
@@ -508,6 +569,34 @@ void ImageStats::compute( ValuePlug *output, const Context *context ) const
 
 		static_cast<ObjectPlug *>( output )->setValue( new IECore::V3dData( Imath::V3d( min, max, sum ) ) );
 	}
+	else if( output == rowStatsPlug() )
+	{
+		float min = std::numeric_limits<float>::infinity();
+		float max = -std::numeric_limits<float>::infinity();
+		double sum = 0.;
+
+		// We traverse in TopToBottom order because floating point precision means that changing
+		// the order to sum in could produce slightly non-deterministic results
+		ImageAlgo::parallelGatherTiles(
+			flattenedInPlug(),
+			// Tile
+			[this] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin ) -> Imath::V3d
+			{
+				return boost::static_pointer_cast<const IECore::V3dData>( tileStatsPlug()->getValue() )->readable();
+			},
+			// Gather
+			[ &min, &max, &sum ] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin, const Imath::V3d &v )
+			{
+				min = std::min( float(v[0]), min );
+				max = std::max( float(v[1]), max );
+				sum += v[2];
+			},
+			rowBound( boundsIntersection, context ),
+			ImageAlgo::TopToBottom
+		);
+
+		static_cast<ObjectPlug *>( output )->setValue( new IECore::V3dData( Imath::V3d( min, max, sum ) ) );
+	}
 	else if( output == allStatsPlug() )
 	{
 		if( BufferAlgo::empty( boundsIntersection ) )
@@ -525,14 +614,12 @@ void ImageStats::compute( ValuePlug *output, const Context *context ) const
 			max = 0.;
 		}
 
-		// We traverse in TopToBottom order because floating point precision means that changing
-		// the order to sum in could produce slightly non-deterministic results
 		ImageAlgo::parallelGatherTiles(
 			flattenedInPlug(),
-			// Tile
+			// Row
 			[this] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin ) -> Imath::V3d
 			{
-				return boost::static_pointer_cast<const IECore::V3dData>( tileStatsPlug()->getValue() )->readable();
+				return boost::static_pointer_cast<const IECore::V3dData>( rowStatsPlug()->getValue() )->readable();
 			},
 			// Gather
 			[ &min, &max, &sum ] ( const ImagePlug *imageP, const Imath::V2i &tileOrigin, const Imath::V3d &v )
@@ -541,7 +628,7 @@ void ImageStats::compute( ValuePlug *output, const Context *context ) const
 				max = std::max( float(v[1]), max );
 				sum += v[2];
 			},
-			boundsIntersection,
+			firstColumnBound( boundsIntersection ),
 			ImageAlgo::TopToBottom
 		);
 		float average = sum / areaMult;
@@ -551,7 +638,7 @@ void ImageStats::compute( ValuePlug *output, const Context *context ) const
 
 ValuePlug::CachePolicy ImageStats::computeCachePolicy( const Gaffer::ValuePlug *output ) const
 {
-	if( output == allStatsPlug() )
+	if( output == allStatsPlug() || output == rowStatsPlug() )
 	{
 		return ValuePlug::CachePolicy::TaskCollaboration;
 	}
@@ -561,7 +648,7 @@ ValuePlug::CachePolicy ImageStats::computeCachePolicy( const Gaffer::ValuePlug *
 
 ValuePlug::CachePolicy ImageStats::hashCachePolicy( const Gaffer::ValuePlug *output ) const
 {
-	if( output == allStatsPlug() )
+	if( output == allStatsPlug() || output == rowStatsPlug() )
 	{
 		return ValuePlug::CachePolicy::TaskCollaboration;
 	}
@@ -71,8 +71,14 @@
 
 #include "fmt/format.h"
 
+#include <condition_variable>
+#include <deque>
+#include <exception>
 #include <filesystem>
+#include <functional>
 #include <memory>
+#include <mutex>
+#include <thread>
 
 #ifndef _MSC_VER
 #include <sys/utsname.h>
@@ -169,6 +175,127 @@ void copyDeepArea(
 
 using ImageOutputPtr = std::shared_ptr<ImageOutput>;
 
+// Runs write operations for an ImageOutput on a dedicated thread, so that
+// compressing and writing one batch of scanlines or tiles overlaps with
+// the computation of the next. Operations are run in the order they are
+// pushed, which is required by formats that need sequential writes. At most
+// `maxPending` operations may be queued at once, so the memory used for
+// buffered data is bounded. Exceptions thrown by an operation are rethrown
+// on the calling thread by the next call to `push()` or `wait()`, and any
+// operations queued after a failure are discarded.
+class WriteQueue
+{
+
+	public :
+
+		using Operation = std::function<void ()>;
+
+		WriteQueue( size_t maxPending = 4 )
+			:	m_maxPending( std::max<size_t>( maxPending, 1 ) ), m_busy( false ), m_stop( false )
+		{
+			m_thread = std::thread( [this] { run(); } );
+		}
+
+		~WriteQueue()
+		{
+			{
+				std::unique_lock<std::mutex> lock( m_mutex );
+				// If we're being destroyed without `wait()` having been called,
+				// we're unwinding from an exception (typically cancellation). Discard
+				// any outstanding operations rather than continuing to write.
+				m_pending.clear();
+				m_stop = true;
+			}
+			m_condition.notify_all();
+			m_thread.join();
+		}
+
+		WriteQueue( const WriteQueue & ) = delete;
+		WriteQueue &operator=( const WriteQueue & ) = delete;
+
+		void push( Operation &&operation )
+		{
+			std::unique_lock<std::mutex> lock( m_mutex );
+			m_condition.wait( lock, [this] { return m_pending.size() < m_maxPending || m_exception; } );
+			rethrow();
+			m_pending.push_back( std::move( operation ) );
+			lock.unlock();
+			m_condition.notify_all();
+		}
+
+		void wait()
+		{
+			std::unique_lock<std::mutex> lock( m_mutex );
+			m_condition.wait( lock, [this] { return ( m_pending.empty() && !m_busy ) || m_exception; } );
+			rethrow();
+		}
+
+	private :
+
+		void run()
+		{
+			std::unique_lock<std::mutex> lock( m_mutex );
+			while( true )
+			{
+				m_condition.wait( lock, [this] { return !m_pending.empty() || m_stop; } );
+				if( m_pending.empty() )
+				{
+					return;
+				}
+
+				Operation operation = std::move( m_pending.front() );
+				m_pending.pop_front();
+				m_busy = true;
+				lock.unlock();
+				m_condition.notify_all();
+
+				std::exception_ptr exception;
+				try
+				{
+					operation();
+				}
+				catch( ... )
+				{
+					exception = std::current_exception();
+				}
+				// Release any buffers held by the operation before
+				// reacquiring the lock.
+				operation = nullptr;
+
+				lock.lock();
+				m_busy = false;
+				if( exception )
+				{
+					m_exception = exception;
+					m_pending.clear();
+				}
+				m_condition.notify_all();
+			}
+		}
+
+		void rethrow()
+		{
+			if( m_exception )
+			{
+				std::exception_ptr exception = m_exception;
+				m_exception = nullptr;
+				std::rethrow_exception( exception );
+			}
+		}
+
+		const size_t m_maxPending;
+
+		std::mutex m_mutex;
+		std::condition_variable m_condition;
+		std::deque<Operation> m_pending;
+		bool m_busy;
+		bool m_stop;
+		std::exception_ptr m_exception;
+
+		std::thread m_thread;
+
+};
+
 class TileSampleOffsetsProcessor
 {
 	public:
@@ -281,6 +408,11 @@ class FlatTileWriter
 	// black, which is what we want. So iterate over the remaining tiles, and
 	// if memory has been allocated for that tile, write it to the file, and if
 	// nothing has been allocated, write a black tile.
+	//
+	// The actual writes are performed asynchronously by a WriteQueue, so that
+	// compressing and writing tiles overlaps with the computation of the
+	// next Gaffer tiles. Ownership of each filled tile is passed to the queue,
+	// and released once it has been written.
 	public:
 		FlatTileWriter(
 				ImageOutputPtr out,
@@ -327,6 +459,8 @@ class FlatTileWriter
 					writeTile( tileOrigin, blackTile() );
 				}
 			}
+
+			m_writeQueue.wait();
 		}
 
 		void operator()( const ImagePlug *imagePlug, const string &channelName, const V2i &tileOrigin, ConstFloatVectorDataPtr data )
@@ -459,14 +593,18 @@ class FlatTileWriter
 		}
 
 
-		void writeTile( const Imath::V2i &tileOrigin, ConstFloatVectorDataPtr tileData ) const
+		void writeTile( const Imath::V2i &tileOrigin, ConstFloatVectorDataPtr tileData )
 		{
-			Imath::V2i exrTileOrigin = m_format.toEXRSpace( tileOrigin + Imath::V2i( 0, m_spec.tile_height - 1 ) );
+			const Imath::V2i exrTileOrigin = m_format.toEXRSpace( tileOrigin + Imath::V2i( 0, m_spec.tile_height - 1 ) );
 
-			if( !m_out->write_tile( exrTileOrigin.x, exrTileOrigin.y, 0, TypeDesc::FLOAT, &tileData->readable()[0] ) )
-			{
-				throw IECore::Exception( fmt::format( "Could not write tile to \"{}\", error = {}", m_fileName, m_out->geterror() ) );
-			}
+			m_writeQueue.push(
+				[out = m_out, &fileName = m_fileName, exrTileOrigin, tileData = std::move( tileData )] {
+					if( !out->write_tile( exrTileOrigin.x, exrTileOrigin.y, 0, TypeDesc::FLOAT, &tileData->readable()[0] ) )
+					{
+						throw IECore::Exception( fmt::format( "Could not write tile to \"{}\", error = {}", fileName, out->geterror() ) );
+					}
+				}
+			);
 		}
 
 		ImageOutputPtr m_out;
@@ -482,6 +620,9 @@ class FlatTileWriter
 		std::vector<FloatVectorDataPtr> m_tilesData;
 		std::vector<bool> m_tilesFilled;
 		ConstFloatVectorDataPtr m_blackTile;
+		// Declared last, so that it is destroyed first, completing
+		// or discarding any writes that reference our members.
+		WriteQueue m_writeQueue;
 };
 
 class FlatScanlineWriter
@@ -493,11 +634,12 @@ class FlatScanlineWriter
 	// scanlines that fall between the start of the image and the start of the
 	// data that it is going to be given.
 	//
-	// It stores a vector of floats big enough to hold ImagePlug::tileSize()
-	// scanlines. As it receives each tile, it copies the data into the
-	// appropriate location in the buffer. When it's copied the last channel
-	// of the last tile of each row, it writes all of the data from the buffer
-	// into the ImageOutput object.
+	// It allocates a buffer big enough to hold ImagePlug::tileSize()
+	// scanlines for each row of tiles. As it receives each tile, it copies the
+	// data into the appropriate location in the buffer. When it's copied the
+	// last channel of the last tile of each row, it passes the buffer to a
+	// WriteQueue, which writes it into the ImageOutput object on a separate
+	// thread while we continue to gather the following rows.
 	public:
 		FlatScanlineWriter(
 				ImageOutputPtr out,
@@ -514,24 +656,22 @@ class FlatScanlineWriter
 				m_processWindow( processWindow ),
 				m_tilesBounds( Imath::Box2i( ImagePlug::tileOrigin( processWindow.min ), ImagePlug::tileOrigin( processWindow.max - Imath::V2i( 1 ) ) + Imath::V2i( ImagePlug::tileSize() ) ) )
 		{
-			m_scanlinesData.resize( m_spec.width * ImagePlug::tileSize() * m_channels.size(), 0.0 );
-
 			writeInitialBlankScanlines();
 		}
 
 		void finish()
 		{
-			if( BufferAlgo::empty( m_processWindow ) )
+			if( !BufferAlgo::empty( m_processWindow ) )
 			{
-				// If the source data window is empty, we handle everything during construct
-				return;
+				// If the source data window is empty, we handled everything during construction
+				const int scanlinesEnd = m_format.toEXRSpace( m_tilesBounds.min.y - 1 );
+				if( scanlinesEnd < ( m_spec.y + m_spec.height ) )
+				{
+					writeBlankScanlines( scanlinesEnd, m_spec.y + m_spec.height );
+				}
 			}
 
-			const int scanlinesEnd = m_format.toEXRSpace( m_tilesBounds.min.y - 1 );
-			if( scanlinesEnd < ( m_spec.y + m_spec.height ) )
-			{
-				writeBlankScanlines( scanlinesEnd, m_spec.y + m_spec.height );
-			}
+			m_writeQueue.wait();
 		}
 
 		void operator()( const ImagePlug *imagePlug, const string &channelName, const V2i &tileOrigin, ConstFloatVectorDataPtr data )
@@ -546,18 +686,22 @@ class FlatScanlineWriter
 
 			if( firstTileOfRow( channelIndex, tileOrigin ) )
 			{
-				std::fill( m_scanlinesData.begin(), m_scanlinesData.end(), 0.0 );
+				// The previous buffer may still be waiting to be written, so
+				// we start each row with a fresh one.
+				m_scanlinesData = new FloatVectorData;
+				m_scanlinesData->writable().resize( scanlinesBufferSize(), 0.0 );
 			}
 
 			Imath::Box2i copyArea( BufferAlgo::intersection( m_processWindow, BufferAlgo::intersection( inTileBounds, scanlinesBounds ) ) );
 
-			copyBufferArea( &data->readable()[0], inTileBounds, &m_scanlinesData[0], scanlinesBounds, channelIndex, m_channels.size(), true, copyArea );
+			copyBufferArea( &data->readable()[0], inTileBounds, &m_scanlinesData->writable()[0], scanlinesBounds, channelIndex, m_channels.size(), true, copyArea );
 
 			if( lastTileOfRow( channelIndex, tileOrigin ) )
 			{
 				writeScanlines(
 					std::max( exrInTileBounds.min.y, m_spec.y ),
 					std::min( exrInTileBounds.max.y + 1, m_spec.y + m_spec.height ),
+					std::move( m_scanlinesData ),
 					std::max( m_spec.y - exrInTileBounds.min.y, 0 )
 				);
 			}
@@ -575,22 +719,34 @@ class FlatScanlineWriter
 			return channelIndex == ( m_channels.size() - 1 ) && tileOrigin.x == ( m_tilesBounds.max.x - ImagePlug::tileSize() ) ;
 		}
 
-		void writeScanlines( const int exrYBegin, const int exrYEnd, const int scanlinesYOffset = 0 ) const
+		inline size_t scanlinesBufferSize() const
 		{
-			if ( !m_out->write_scanlines( exrYBegin, exrYEnd, 0, TypeDesc::FLOAT, &m_scanlinesData[0] + ( scanlinesYOffset * m_spec.width * m_channels.size() ) ) )
-			{
-				throw IECore::Exception( fmt::format( "Could not write scanline to \"{}\", error = {}", m_fileName, m_out->geterror() ) );
-			}
+			return m_spec.width * ImagePlug::tileSize() * m_channels.size();
+		}
+
+		void writeScanlines( const int exrYBegin, const int exrYEnd, ConstFloatVectorDataPtr scanlinesData, const int scanlinesYOffset = 0 )
+		{
+			const size_t offset = scanlinesYOffset * m_spec.width * m_channels.size();
+			m_writeQueue.push(
+				[out = m_out, &fileName = m_fileName, exrYBegin, exrYEnd, scanlinesData = std::move( scanlinesData ), offset] {
+					if( !out->write_scanlines( exrYBegin, exrYEnd, 0, TypeDesc::FLOAT, &scanlinesData->readable()[0] + offset ) )
+					{
+						throw IECore::Exception( fmt::format( "Could not write scanline to \"{}\", error = {}", fileName, out->geterror() ) );
+					}
+				}
+			);
 		}
 
 		void writeBlankScanlines( int yBegin, int yEnd )
 		{
-			float *scanlines = &m_scanlinesData[0];
-			memset( scanlines, 0, sizeof(float) * m_spec.width * std::min( ImagePlug::tileSize(), yEnd - yBegin ) * m_channels.size() );
+			// Blank scanlines are read-only, so a single buffer can be shared
+			// by all the writes.
+			FloatVectorDataPtr blankScanlines = new FloatVectorData;
+			blankScanlines->writable().resize( m_spec.width * std::min( ImagePlug::tileSize(), yEnd - yBegin ) * m_channels.size(), 0.0 );
 			while( yBegin < yEnd )
 			{
 				const int numLines = std::min( yEnd - yBegin, ImagePlug::tileSize() );
-				writeScanlines( yBegin, yBegin + numLines );
+				writeScanlines( yBegin, yBegin + numLines, blankScanlines );
 				yBegin += numLines;
 			}
 		}
@@ -619,7 +775,10 @@ class FlatScanlineWriter
 		const ImageSpec m_spec;
 		const Imath::Box2i &m_processWindow;
 		const Imath::Box2i m_tilesBounds;
-		vector<float> m_scanlinesData;
+		FloatVectorDataPtr m_scanlinesData;
+		// Declared last, so that it is destroyed first, completing
+		// or discarding any writes that reference our members.
+		WriteQueue m_writeQueue;
 };
 
 class DeepTileWriter
@@ -39,11 +39,33 @@ using namespace GafferImage;
 
 GAFFER_NODE_DEFINE_TYPE( Median );
 
+size_t Median::g_firstPlugIndex = 0;
+
 Median::Median( const std::string &name )
 	:   RankFilter( name, MedianRank )
 {
+	storeIndexOfNextChild( g_firstPlugIndex );
+	addChild( new Gaffer::IntPlug( "algorithm", Gaffer::Plug::In, Sort, Sort, Histogram ) );
 }
 
 Median::~Median()
 {
 }
+
+Gaffer::IntPlug *Median::algorithmPlug()
+{
+	return getChild<Gaffer::IntPlug>( g_firstPlugIndex );
+}
+
+const Gaffer::IntPlug *Median::algorithmPlug() const
+{
+	return getChild<Gaffer::IntPlug>( g_firstPlugIndex );
+}
+
+bool Median::useHistogramMedian() const
+{
+	// Both algorithms give identical results, so `algorithmPlug()` doesn't
+	// affect any outputs and isn't included in any hashes.
+	ImagePlug::GlobalScope globalScope( Gaffer::Context::current() );
+	return algorithmPlug()->getValue() == Histogram;
+}
@@ -639,6 +639,32 @@ struct MergeDataWindowFunctor
 
 };
 
+// Returns true if `alpha` is exactly 1 for every pixel in `bound`, which is
+// relative to the tile origin.
+bool opaque( const vector<float> &alpha, const Box2i &bound )
+{
+	for( int y = bound.min.y; y < bound.max.y; ++y )
+	{
+		const float *a = &alpha[y * ImagePlug::tileSize() + bound.min.x];
+		for( int x = bound.min.x; x < bound.max.x; ++x )
+		{
+			if( *a++ != 1.0f )
+			{
+				return false;
+			}
+		}
+	}
+	return true;
+}
+
+struct MergeInput
+{
+	const ImagePlug *plug;
+	ConstStringVectorDataPtr channelNames;
+	Box2i validBound;
+	ConstFloatVectorDataPtr alphaData;
+};
+
 } // namespace
 
 GAFFER_NODE_DEFINE_TYPE( Merge );
@@ -916,8 +942,7 @@ IECore::ConstFloatVectorDataPtr Merge::computeChannelData( const std::string &ch
 		finalTileDataWindowLocal = boxIntersection( fullBound, finalDataWindowLocal );
 	}
 
-	bool partialBound = false;
-
+	vector<MergeInput> inputs;
 	for( ImagePlug::Iterator it( inPlugs() ); !it.done(); ++it )
 	{
 		if( !(*it)->getInput<ValuePlug>() || !ImageAlgo::viewIsValid( context, (*it)->viewNames()->readable() ) )
@@ -925,22 +950,61 @@ IECore::ConstFloatVectorDataPtr Merge::computeChannelData( const std::string &ch
 			continue;
 		}
 
-		IECore::ConstStringVectorDataPtr channelNamesData;
+		MergeInput &input = inputs.emplace_back();
+		input.plug = (*it).get();
+
 		Box2i dataWindow;
 		{
 			ImagePlug::GlobalScope c( Context::current() );
-			channelNamesData = (*it)->channelNamesPlug()->getValue();
-			dataWindow = (*it)->dataWindowPlug()->getValue();
+			input.channelNames = input.plug->channelNamesPlug()->getValue();
+			dataWindow = input.plug->dataWindowPlug()->getValue();
 		}
-		Box2i dataWindowLocal( dataWindow.min - tileOrigin, dataWindow.max - tileOrigin );
+		const Box2i dataWindowLocal( dataWindow.min - tileOrigin, dataWindow.max - tileOrigin );
+		input.validBound = boxIntersection( finalTileDataWindowLocal, dataWindowLocal );
+	}
+
+	// For Over and Matte, a layer that is fully opaque across the whole tile completely
+	// hides all the layers beneath it. Working down from the top, we look for such a layer
+	// so that we can avoid computing the hidden layers entirely. We need the alpha of the
+	// upper layers to composite them anyway, so this costs us nothing except the check itself.
+
+	size_t firstInput = 0;
+	if( op == Over || op == Matte )
+	{
+		for( size_t i = inputs.size(); i-- > 1; )
+		{
+			MergeInput &input = inputs[i];
+			if(
+				BufferAlgo::empty( input.validBound ) || input.validBound != finalTileDataWindowLocal ||
+				!ImageAlgo::channelExists( input.channelNames->readable(), "A" )
+			)
+			{
+				continue;
+			}
 
-		const std::vector<std::string> &channelNames = channelNamesData->readable();
+			input.alphaData = input.plug->channelData( "A", tileOrigin );
+			if(
+				(int)input.alphaData->readable().size() == ImagePlug::tilePixels() &&
+				opaque( input.alphaData->readable(), input.validBound )
+			)
+			{
+				firstInput = i;
+				break;
+			}
+		}
+	}
+
+	bool partialBound = false;
+
+	for( size_t i = firstInput; i < inputs.size(); ++i )
+	{
+		const MergeInput &input = inputs[i];
+		const std::vector<std::string> &channelNames = input.channelNames->readable();
+		const Box2i &validBound = input.validBound;
 
 		ConstFloatVectorDataPtr channelData;
 		ConstFloatVectorDataPtr alphaData;
 
-		const Box2i validBound = boxIntersection( finalTileDataWindowLocal, dataWindowLocal );
-
 		// \todo : There is opportunity for optimizing using pass-throughs for missing channel cases.
 		// If both channel and alpha are missing, we could check for SingleInputMode::Copy.  If one or
 		// the other is missing, we would need extra information about the Op to know how to proceed.
@@ -948,16 +1012,20 @@ IECore::ConstFloatVectorDataPtr Merge::computeChannelData( const std::string &ch
 		// a performance priority.
 		if( ImageAlgo::channelExists( channelNames, channelName ) && !BufferAlgo::empty( validBound ) )
 		{
-			channelData = (*it)->channelDataPlug()->getValue();
+			channelData = input.plug->channelDataPlug()->getValue();
 		}
 		else
 		{
 			channelData = ImagePlug::blackTile();
 		}
 
-		if( ImageAlgo::channelExists( channelNames, "A" ) && !BufferAlgo::empty( validBound ) )
+		if( input.alphaData )
 		{
-			alphaData = (*it)->channelData( "A", tileOrigin );
+			alphaData = input.alphaData;
+		}
+		else if( ImageAlgo::channelExists( channelNames, "A" ) && !BufferAlgo::empty( validBound ) )
+		{
+			alphaData = input.plug->channelData( "A", tileOrigin );
 		}
 		else
 		{
@@ -982,6 +1050,16 @@ IECore::ConstFloatVectorDataPtr Merge::computeChannelData( const std::string &ch
 		dispatchOperation( op, MergeFunctor(), resultBound, resultChannelData, resultAlphaData, validBound, channelData, alphaData, mergeChannelBuffer, mergeAlphaBuffer, partialBound );
 		dispatchOperation( op, MergeDataWindowFunctor(), resultBound, validBound, first );
 
+		// For Under, once the accumulated result is fully opaque across the whole tile,
+		// none of the remaining layers can contribute, so we don't need to compute them.
+		if(
+			op == Under && i + 1 < inputs.size() &&
+			resultBound == finalTileDataWindowLocal && !BufferAlgo::empty( resultBound ) &&
+			opaque( resultAlphaData->readable(), resultBound )
+		)
+		{
+			break;
+		}
 	}
 
 	return resultChannelData;
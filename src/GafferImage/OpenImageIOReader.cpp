@@ -710,6 +710,37 @@ Box2i expandToGrid( Box2i region, V2i gridOrigin, V2i gridSize )
 	);
 }
 
+// Returns true if Gaffer tiles can be read directly from a subimage one channel at
+// a time, without going via a tile batch. This requires the file to be tiled with
+// the same tile size as Gaffer, with the file tiles lining up with the Gaffer tiles
+// once the display window has been flipped. We also require the data to be uncompressed,
+// since otherwise reading a single channel would mean decompressing all the others
+// each time.
+bool supportsDirectTileReads( const ImageSpec &spec, const std::string &formatName )
+{
+	if( spec.deep || formatName != "openexr" )
+	{
+		return false;
+	}
+
+	const int tileSize = ImagePlug::tileSize();
+	if( spec.tile_width != tileSize || spec.tile_height != tileSize )
+	{
+		return false;
+	}
+
+	if( spec.get_string_attribute( g_oiioCompression, "none" ) != "none" )
+	{
+		return false;
+	}
+
+	const int flippedY = spec.full_y + spec.full_y + spec.full_height - spec.y;
+	return
+		coordinateDivide( spec.x, tileSize ) * tileSize == spec.x &&
+		coordinateDivide( flippedY, tileSize ) * tileSize == flippedY
+	;
+}
+
 
 // This class handles storing a file handle, and reading data from it in a way compatible with how we want
 // to store it on plugs.
@@ -767,6 +798,12 @@ class File
 					throw IECore::Exception( "OpenImageIOReader : " + filePath + " : GafferImage does not support 3D pixel arrays " );
 				}
 
+				m_subImages.push_back( {
+					supportsDirectTileReads( currentSpec, m_imageInput->format_name() ),
+					Box2i( V2i( currentSpec.x, currentSpec.y ), V2i( currentSpec.x + currentSpec.width, currentSpec.y + currentSpec.height ) ),
+					currentSpec
+				} );
+
 				std::string viewName = currentSpec.get_string_attribute( "view", "" );
 
 				if( viewName == "" && subImageIndex == 0 )
@@ -1314,6 +1351,68 @@ class File
 			return result;
 		}
 
+		// Returns true if the tiles for `channelName` can be read individually using `readTile()`,
+		// rather than by reading a whole tile batch.
+		bool supportsDirectTileReads( const Context *c, const std::string &channelName ) const
+		{
+			const View &view = lookupView( c );
+			auto findIt = view.channelMap.find( channelName );
+			if( findIt == view.channelMap.end() )
+			{
+				// Let `findTile()` deal with the error.
+				return false;
+			}
+			return m_subImages[findIt->second.subImage].directTileReads;
+		}
+
+		// Reads a single channel of a single tile, straight into the tile data. May only be
+		// called if `supportsDirectTileReads()` returns true.
+		ConstFloatVectorDataPtr readTile( const Context *c, const std::string &channelName, const V2i &tileOrigin )
+		{
+			const View &view = lookupView( c );
+			const ChannelMapEntry &channelMapEntry = view.channelMap.at( channelName );
+			const SubImage &subImage = m_subImages[channelMapEntry.subImage];
+			assert( subImage.directTileReads );
+
+			const Box2i tileBound( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) );
+			const Box2i fileRegion = BufferAlgo::intersection( flopDisplayWindow( tileBound, subImage.spec ), subImage.fileDataWindow );
+			if( BufferAlgo::empty( fileRegion ) )
+			{
+				return ImagePlug::blackTile();
+			}
+
+			const Box2i region = flopDisplayWindow( fileRegion, subImage.spec );
+
+			FloatVectorDataPtr resultData = new FloatVectorData;
+			std::vector<float> &result = resultData->writable();
+			if( region == tileBound )
+			{
+				podVectorResizeUninitialized<float>( result, ImagePlug::tilePixels() );
+			}
+			else
+			{
+				result.resize( ImagePlug::tilePixels(), 0.0f );
+			}
+
+			// OIIO stores rows from the top down, and we store them from the bottom up, so
+			// we point OIIO at the top row of the region, and give it a negative y stride.
+			// OIIO converts directly into our buffer, so there is no intermediate buffer
+			// to blit from.
+			float *topRow = &result[ ( region.max.y - 1 - tileOrigin.y ) * ImagePlug::tileSize() + region.min.x - tileOrigin.x ];
+			if( !m_imageInput->read_tiles(
+				channelMapEntry.subImage, 0,
+				fileRegion.min.x, fileRegion.max.x, fileRegion.min.y, fileRegion.max.y, 0, 1,
+				channelMapEntry.channelIndex, channelMapEntry.channelIndex + 1,
+				TypeDesc::FLOAT, topRow,
+				sizeof( float ), -(stride_t)( sizeof( float ) * ImagePlug::tileSize() ), AutoStride
+			) )
+			{
+				handleOIIOError( "Failed to read tile", region );
+			}
+
+			return resultData;
+		}
+
 		// Given a channelName and tileOrigin, return the information necessary to look up the data for this tile.
 		// The tileBatchOrigin is used to find a tileBatch, and then the tileBatchSubIndex tells you the index
 		// within that tile to use
@@ -1603,10 +1702,19 @@ class File
 			);
 		}
 
+		struct SubImage
+		{
+			bool directTileReads;
+			Box2i fileDataWindow;
+			ImageSpec spec;
+		};
+
 		std::unique_ptr<ImageInput> m_imageInput;
 		std::string m_filePath;
 		StringVectorDataPtr m_viewNamesData;
 		std::map<std::string, std::unique_ptr< View > > m_views;
+		// Indexed by subimage.
+		std::vector<SubImage> m_subImages;
 };
 
 using FilePtr = std::shared_ptr<File>;
@@ -1707,6 +1815,7 @@ OpenImageIOReader::OpenImageIOReader( const std::string &name )
 	addChild( new BoolPlug( "fileValid", Plug::Out ) );
 	addChild( new IntPlug( "channelInterpretation", Plug::In, (int)ImageReader::ChannelInterpretation::Default, /* min */ (int)ImageReader::ChannelInterpretation::Legacy, /* max */ (int)ImageReader::ChannelInterpretation::Specification ) );
 	addChild( new ObjectVectorPlug( "__tileBatch", Plug::Out, new ObjectVector ) );
+	addChild( new FloatVectorDataPlug( "__tile", Plug::Out, ImagePlug::blackTile() ) );
 
 	plugSetSignal().connect( boost::bind( &OpenImageIOReader::plugSet, this, ::_1 ) );
 }
@@ -1785,6 +1894,16 @@ const Gaffer::ObjectVectorPlug *OpenImageIOReader::tileBatchPlug() const
 	return getChild<ObjectVectorPlug>( g_firstPlugIndex + 6 );
 }
 
+Gaffer::FloatVectorDataPlug *OpenImageIOReader::tilePlug()
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 7 );
+}
+
+const Gaffer::FloatVectorDataPlug *OpenImageIOReader::tilePlug() const
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 7 );
+}
+
 void OpenImageIOReader::setOpenFilesLimit( size_t maxOpenFiles )
 {
 	fileCache()->setMaxCost( maxOpenFiles );
@@ -1836,6 +1955,7 @@ void OpenImageIOReader::affects( const Gaffer::Plug *input, AffectedPlugsContain
 	if( input == fileNamePlug() || input == refreshCountPlug() || input == missingFrameModePlug() || input == channelInterpretationPlug() )
 	{
 		outputs.push_back( tileBatchPlug() );
+		outputs.push_back( tilePlug() );
 		for( ValuePlug::Iterator it( outPlug() ); !it.done(); ++it )
 		{
 			outputs.push_back( it->get() );
@@ -1876,6 +1996,18 @@ void OpenImageIOReader::hash( const ValuePlug *output, const Context *context, I
 		missingFrameModePlug()->hash( h );
 		channelInterpretationPlug()->hash( h );
 	}
+	else if( output == tilePlug() )
+	{
+		h.append( context->get<V2i>( ImagePlug::tileOriginContextName ) );
+		h.append( context->get<std::string>( ImagePlug::channelNameContextName ) );
+		h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
+
+		ImagePlug::GlobalScope c( context );
+		hashFileName( c.context(), h );
+		refreshCountPlug()->hash( h );
+		missingFrameModePlug()->hash( h );
+		channelInterpretationPlug()->hash( h );
+	}
 }
 
 void OpenImageIOReader::compute( ValuePlug *output, const Context *context ) const
@@ -1946,6 +2078,23 @@ void OpenImageIOReader::compute( ValuePlug *output, const Context *context ) con
 			file->readTileBatch( context, tileBatchOrigin )
 		);
 	}
+	else if( output == tilePlug() )
+	{
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+		const std::string channelName = context->get<std::string>( ImagePlug::channelNameContextName );
+
+		ImagePlug::GlobalScope c( context );
+		FilePtr file = std::static_pointer_cast<File>( retrieveFile( c.context() ) );
+
+		if( !file )
+		{
+			throw IECore::Exception( "OpenImageIOReader - trying to evaluate tilePlug() with invalid file, this should never happen." );
+		}
+
+		static_cast<FloatVectorDataPlug *>( output )->setValue(
+			file->readTile( c.context(), channelName, tileOrigin )
+		);
+	}
 	else
 	{
 		ImageNode::compute( output, context );
@@ -1964,7 +2113,7 @@ Gaffer::ValuePlug::CachePolicy OpenImageIOReader::computeCachePolicy( const Gaff
 	else if( output == outPlug()->channelDataPlug() )
 	{
 		// Disable caching on channelDataPlug, since it is just a redirect to the correct tile of
-		// the private tileBatchPlug, which is already being cached.
+		// the private tileBatchPlug, or to the private tilePlug, both of which are already being cached.
 		return ValuePlug::CachePolicy::Uncached;
 	}
 	return ImageNode::computeCachePolicy( output );
@@ -2263,6 +2412,15 @@ IECore::ConstFloatVectorDataPtr OpenImageIOReader::computeChannelData( const std
 		);
 	}
 
+	if( file->supportsDirectTileReads( context, channelName ) )
+	{
+		// The tile can be read on its own, without reading all the other tiles and
+		// channels in a tile batch. Evaluate tilePlug() in the original context, since
+		// it depends on the tile origin and channel name.
+		Context::Scope tileScope( context );
+		return tilePlug()->getValue();
+	}
+
 	V3i tileBatchOrigin;
 	int subIndex;
 	file->findTile( context, channelName, tileOrigin, tileBatchOrigin, subIndex );
@@ -42,6 +42,8 @@
 
 #include <algorithm>
 #include <climits>
+#include <cstdint>
+#include <cstring>
 #include <boost/heap/d_ary_heap.hpp>
 
 using namespace std;
@@ -570,6 +572,269 @@ private:
 	std::vector< MaxHeap::handle_type > m_maxHeapHandles;
 };
 
+// For large radii, RankMedianBuffer must sort each new row and then rebalance the splits across all
+// rows using the heaps, so the cost per pixel grows as O( r log r ). RankHistogramMedianBuffer instead
+// uses a sliding histogram, in the style of Huang's algorithm. Each step removes the outgoing row and
+// adds the incoming one, which is O( r ) per pixel with a very small constant, and no sorting. Note that
+// this is not the constant time algorithm of Perreault and Hébert, which would also require a histogram
+// per column of the input.
+//
+// Floats are mapped to 32 bit keys which sort in the same order as the floats themselves. We maintain
+// two levels of histogram over the top 16 bits of the key ( a coarse one with 256 bins, and a fine one
+// with 65536 bins ), updated incrementally as rows are replaced. Finding the fine bin containing the
+// median then requires scanning at most 512 bins. To recover the exact value, we keep a second pair of
+// histograms over the bottom 16 bits of the key, but only for the keys within a few recently used fine
+// bins. These "refinements" are also updated incrementally, so they only need to be built when the median
+// moves to a bin that doesn't have one. To make that cheap, we keep a linked list of the slots holding
+// keys in each fine bin, so that building a refinement only visits the keys within that bin, rather than
+// the whole filter. Keeping several refinements means that input where the median alternates between a
+// few bins, such as noise on a flat background, doesn't need any rebuilds at all.
+class RankHistogramMedianBuffer
+{
+public:
+	inline RankHistogramMedianBuffer( const V2i &size ) :
+		m_size( size ), m_rows( size.x * size.y, sortKey( 0.0f ) ),
+		m_nextSlots( m_rows.size() ), m_previousSlots( m_rows.size() ), m_firstSlots( 65536, -1 ),
+		m_coarse( 256, 0 ), m_fine( 65536, 0 ),
+		m_refinementIndices( 65536, -1 ), m_refinements( g_numRefinements ), m_useCount( 0 ),
+		m_result( 0.0f )
+	{
+		// Start with every slot holding a zero, so that replacing a row is always a matter of
+		// removing the old values and adding the new ones.
+		const uint32_t zeroKey = sortKey( 0.0f );
+		const int numSlots = int( m_rows.size() );
+		m_coarse[zeroKey >> 24] = numSlots;
+		m_fine[zeroKey >> 16] = numSlots;
+
+		for( int i = 0; i < numSlots; ++i )
+		{
+			m_previousSlots[i] = i - 1;
+			m_nextSlots[i] = i + 1 < numSlots ? i + 1 : -1;
+		}
+		m_firstSlots[zeroKey >> 16] = 0;
+	}
+
+	inline void sampleRow( int rowIndex, Sampler &sampler, const Box2i &rowBound )
+	{
+		int slot = m_size.x * rowIndex;
+		sampler.visitPixels( rowBound,
+			[this, &slot] ( float v, int x, int y )
+			{
+				if( std::isnan( v ) )
+				{
+					v = -infinity;
+				}
+				replaceKey( slot++, sortKey( v ) );
+			}
+		);
+	}
+
+	inline float currentResult()
+	{
+		// The index of the median in the sorted set of all values, matching RankMedianBuffer
+		int rank = ( m_size.x * m_size.y ) / 2;
+
+		const int fineBin = findBin( m_coarse, m_fine, rank );
+		const Refinement &refinement = acquireRefinement( fineBin );
+		const int lowBits = findBin( refinement.coarse, refinement.fine, rank );
+
+		m_result = keyValue( ( uint32_t( fineBin ) << 16 ) | uint32_t( lowBits ) );
+		return m_result;
+	}
+
+	inline bool rowContainsResult( int rowIndex, float result )
+	{
+		assert( result == m_result );
+		const uint32_t *row = &m_rows[ m_size.x * rowIndex ];
+		for( int i = 0; i < m_size.x; ++i )
+		{
+			if( keyValue( row[i] ) == result )
+			{
+				return true;
+			}
+		}
+		return false;
+	}
+
+private:
+
+	// Maps a float to an unsigned integer with the same ordering
+	static inline uint32_t sortKey( float v )
+	{
+		uint32_t i;
+		std::memcpy( &i, &v, sizeof( i ) );
+		return ( i & 0x80000000 ) ? ~i : ( i | 0x80000000 );
+	}
+
+	// Inverse of sortKey()
+	static inline float keyValue( uint32_t key )
+	{
+		const uint32_t i = ( key & 0x80000000 ) ? ( key & 0x7FFFFFFF ) : ~key;
+		float v;
+		std::memcpy( &v, &i, sizeof( v ) );
+		return v;
+	}
+
+	inline void replaceKey( int slot, uint32_t key )
+	{
+		const uint32_t oldKey = m_rows[slot];
+		if( key == oldKey )
+		{
+			return;
+		}
+
+		addKey( oldKey, -1 );
+		if( ( oldKey >> 16 ) != ( key >> 16 ) )
+		{
+			unlinkSlot( slot, oldKey >> 16 );
+			linkSlot( slot, key >> 16 );
+		}
+		addKey( key, 1 );
+		m_rows[slot] = key;
+	}
+
+	inline void addKey( uint32_t key, int count )
+	{
+		m_coarse[key >> 24] += count;
+		m_fine[key >> 16] += count;
+		const int refinementIndex = m_refinementIndices[key >> 16];
+		if( refinementIndex != -1 )
+		{
+			Refinement &refinement = m_refinements[refinementIndex];
+			refinement.coarse[( key >> 8 ) & 0xFF] += count;
+			refinement.fine[key & 0xFFFF] += count;
+		}
+	}
+
+	inline void unlinkSlot( int slot, uint32_t bin )
+	{
+		const int previous = m_previousSlots[slot];
+		const int next = m_nextSlots[slot];
+		if( previous != -1 )
+		{
+			m_nextSlots[previous] = next;
+		}
+		else
+		{
+			m_firstSlots[bin] = next;
+		}
+		if( next != -1 )
+		{
+			m_previousSlots[next] = previous;
+		}
+	}
+
+	inline void linkSlot( int slot, uint32_t bin )
+	{
+		const int first = m_firstSlots[bin];
+		m_previousSlots[slot] = -1;
+		m_nextSlots[slot] = first;
+		if( first != -1 )
+		{
+			m_previousSlots[first] = slot;
+		}
+		m_firstSlots[bin] = slot;
+	}
+
+	// Finds the fine bin containing the element with the given rank, and
+	// modifies `rank` to be the rank within that bin.
+	static inline int findBin( const std::vector<int> &coarse, const std::vector<int> &fine, int &rank )
+	{
+		int coarseBin = 0;
+		while( rank >= coarse[coarseBin] )
+		{
+			rank -= coarse[coarseBin++];
+		}
+
+		int fineBin = coarseBin << 8;
+		while( rank >= fine[fineBin] )
+		{
+			rank -= fine[fineBin++];
+		}
+
+		return fineBin;
+	}
+
+	// Histograms of bits 8-15 and 0-15 of the keys whose top 16 bits are `bin`
+	struct Refinement
+	{
+		int bin = -1;
+		size_t lastUsed = 0;
+		std::vector<int> coarse;
+		std::vector<int> fine;
+	};
+
+	// Returns the refinement for `bin`, building it if necessary.
+	inline const Refinement &acquireRefinement( int bin )
+	{
+		int8_t &index = m_refinementIndices[bin];
+		if( index == -1 )
+		{
+			// Reuse the least recently used refinement.
+			auto it = std::min_element(
+				m_refinements.begin(), m_refinements.end(),
+				[] ( const Refinement &a, const Refinement &b ) { return a.lastUsed < b.lastUsed; }
+			);
+
+			if( it->bin != -1 )
+			{
+				// Clear the entries used by the previous bin. This is cheaper than
+				// clearing the whole of `fine`.
+				for( int slot = m_firstSlots[it->bin]; slot != -1; slot = m_nextSlots[slot] )
+				{
+					const uint32_t key = m_rows[slot];
+					it->coarse[( key >> 8 ) & 0xFF] = 0;
+					it->fine[key & 0xFFFF] = 0;
+				}
+				m_refinementIndices[it->bin] = -1;
+			}
+			else
+			{
+				it->coarse.resize( 256, 0 );
+				it->fine.resize( 65536, 0 );
+			}
+
+			it->bin = bin;
+			index = int8_t( it - m_refinements.begin() );
+			for( int slot = m_firstSlots[bin]; slot != -1; slot = m_nextSlots[slot] )
+			{
+				const uint32_t key = m_rows[slot];
+				it->coarse[( key >> 8 ) & 0xFF]++;
+				it->fine[key & 0xFFFF]++;
+			}
+		}
+
+		Refinement &result = m_refinements[index];
+		result.lastUsed = ++m_useCount;
+		return result;
+	}
+
+	static const int g_numRefinements = 4;
+
+	// Size of the filter, x is the size of each row, y is the number of rows
+	V2i m_size;
+
+	// The keys for each row, stored in the same layout as RankMedianBuffer::m_sortedRows,
+	// but unsorted.
+	std::vector<uint32_t> m_rows;
+
+	// Doubly linked lists of the slots in `m_rows` whose keys fall in each fine bin.
+	std::vector<int> m_nextSlots;
+	std::vector<int> m_previousSlots;
+	std::vector<int> m_firstSlots;
+
+	// Histograms of the top 8 and top 16 bits of all keys
+	std::vector<int> m_coarse;
+	std::vector<int> m_fine;
+
+	// Index into `m_refinements` for each fine bin, or -1
+	std::vector<int8_t> m_refinementIndices;
+	std::vector<Refinement> m_refinements;
+	size_t m_useCount;
+
+	float m_result;
+};
+
 inline int positiveModulo( int a, int d )
 {
 	return ( ( a % d ) + d ) % d;
@@ -771,7 +1036,14 @@ void RankFilter::compute( Gaffer::ValuePlug *output, const Gaffer::Context *cont
 		switch( m_mode )
 		{
 			case MedianRank:
-				processTileIndices<RankMedianBuffer>( sampler, radius, tileBound, result, context->canceller() );
+				if( useHistogramMedian() )
+				{
+					processTileIndices<RankHistogramMedianBuffer>( sampler, radius, tileBound, result, context->canceller() );
+				}
+				else
+				{
+					processTileIndices<RankMedianBuffer>( sampler, radius, tileBound, result, context->canceller() );
+				}
 				break;
 			case ErodeRank:
 				processTileIndices<RankMinBuffer>( sampler, radius, tileBound, result, context->canceller() );
@@ -827,6 +1099,11 @@ void RankFilter::hashChannelData( const GafferImage::ImagePlug *parent, const Ga
 
 }
 
+bool RankFilter::useHistogramMedian() const
+{
+	return false;
+}
+
 IECore::ConstFloatVectorDataPtr RankFilter::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
 {
 	const V2i radius = radiusPlug()->getValue();
@@ -880,7 +1157,14 @@ IECore::ConstFloatVectorDataPtr RankFilter::computeChannelData( const std::strin
 	switch( m_mode )
 	{
 		case MedianRank:
-			processTile<RankMedianBuffer>( sampler, radius, tileBound, result, context->canceller() );
+			if( useHistogramMedian() )
+			{
+				processTile<RankHistogramMedianBuffer>( sampler, radius, tileBound, result, context->canceller() );
+			}
+			else
+			{
+				processTile<RankMedianBuffer>( sampler, radius, tileBound, result, context->canceller() );
+			}
 			break;
 		case ErodeRank:
 			processTile<RankMinBuffer>( sampler, radius, tileBound, result, context->canceller() );
@@ -221,6 +221,12 @@ IECore::FloatVectorDataPtr whiteTile( bool copy )
 	return copy ? d->copy() : boost::const_pointer_cast<IECore::FloatVectorData>( d );
 }
 
+IECore::FloatVectorDataPtr constantTile( float value, bool copy )
+{
+	IECore::ConstFloatVectorDataPtr d = ImagePlug::constantTile( value );
+	return copy ? d->copy() : boost::const_pointer_cast<IECore::FloatVectorData>( d );
+}
+
 boost::python::list registeredFormats()
 {
 	std::vector<std::string> names;
@@ -351,6 +357,7 @@ void GafferImageModule::bindCore()
 		.def( "emptyTile", &emptyTile, ( arg( "_copy" ) = true ) ).staticmethod( "emptyTile" )
 		.def( "blackTile", &blackTile, ( arg( "_copy" ) = true ) ).staticmethod( "blackTile" )
 		.def( "whiteTile", &whiteTile, ( arg( "_copy" ) = true ) ).staticmethod( "whiteTile" )
+		.def( "constantTile", &constantTile, ( arg( "value" ), arg( "_copy" ) = true ) ).staticmethod( "constantTile" )
 	;
 
 	using ImageNodeWrapper = ComputeNodeWrapper<ImageNode>;
@@ -53,7 +53,14 @@ void GafferImageModule::bindFilters()
 {
 	DependencyNodeClass<Blur>();
 	DependencyNodeClass<RankFilter>( nullptr, no_init );
-	DependencyNodeClass<Median>();
+	{
+		scope s = DependencyNodeClass<Median>();
+
+		enum_<Median::Algorithm>( "Algorithm" )
+			.value( "Sort", Median::Sort )
+			.value( "Histogram", Median::Histogram )
+		;
+	}
 	DependencyNodeClass<Dilate>();
 	DependencyNodeClass<Erode>();
 
@@ -43,6 +43,10 @@
 
 #include "boost/python/suite/indexing/container_utils.hpp"
 
+#include "fmt/format.h"
+
+#include <memory>
+
 using namespace std;
 using namespace boost::python;
 using namespace GafferImage;
@@ -196,6 +200,45 @@ IECore::CompoundObjectPtr tilesWrapper( const ImagePlug *plug, bool copy, const
 	return copy ? d->copy() : boost::const_pointer_cast<IECore::CompoundObject>( d );
 }
 
+void copyPixelsWrapper( const ImagePlug *plug, object pythonChannelNames, const Imath::Box2i &window, object pythonBuffer, const char *viewName )
+{
+	vector<string> channelNames;
+	boost::python::container_utils::extend_container( channelNames, pythonChannelNames );
+
+	Py_buffer buffer;
+	if( PyObject_GetBuffer( pythonBuffer.ptr(), &buffer, PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS ) != 0 )
+	{
+		throw_error_already_set();
+	}
+
+	// Make sure we release the buffer however we exit.
+	std::unique_ptr<Py_buffer, decltype( &PyBuffer_Release )> bufferReleaser( &buffer, &PyBuffer_Release );
+
+	if( buffer.itemsize != sizeof( float ) || !buffer.format || ( string( buffer.format ) != "f" && string( buffer.format ) != "=f" && string( buffer.format ) != "<f" ) )
+	{
+		throw IECore::Exception( "Buffer must contain 32 bit floats" );
+	}
+
+	const size_t requiredSize = (size_t)std::max( window.size().x, 0 ) * (size_t)std::max( window.size().y, 0 ) * channelNames.size();
+	if( (size_t)( buffer.len / buffer.itemsize ) < requiredSize )
+	{
+		throw IECore::Exception( fmt::format( "Buffer too small. Expected at least {} elements but got {}", requiredSize, buffer.len / buffer.itemsize ) );
+	}
+
+	IECorePython::ScopedGILRelease gilRelease;
+	std::string viewNameStr( viewName ? viewName : "" );
+	ImageAlgo::copyPixels( plug, channelNames, window, static_cast<float *>( buffer.buf ), viewName ? &viewNameStr : nullptr );
+}
+
+IECore::CompoundDataPtr samplePixelsWrapper( const ImagePlug *plug, object pythonChannelNames, const IECore::V2fVectorData *positions, bool interpolate, Sampler::BoundingMode boundingMode )
+{
+	vector<string> channelNames;
+	boost::python::container_utils::extend_container( channelNames, pythonChannelNames );
+
+	IECorePython::ScopedGILRelease gilRelease;
+	return ImageAlgo::samplePixels( plug, channelNames, positions->readable(), interpolate, boundingMode );
+}
+
 
 } // namespace
 
@@ -246,6 +289,26 @@ void GafferImageModule::bindImageAlgo()
 	def( "image", &imageWrapper, ( boost::python::arg( "viewName" ) = object() ) );
 	def( "imageHash", &imageHashWrapper, ( boost::python::arg( "viewName" ) = object() ) );
 	def( "tiles", &tilesWrapper, ( boost::python::arg( "_copy" ) = true, boost::python::arg( "viewName" ) = object() ) );
+	def(
+		"copyPixels", &copyPixelsWrapper,
+		(
+			boost::python::arg( "image" ),
+			boost::python::arg( "channelNames" ),
+			boost::python::arg( "window" ),
+			boost::python::arg( "buffer" ),
+			boost::python::arg( "viewName" ) = object()
+		)
+	);
+	def(
+		"samplePixels", &samplePixelsWrapper,
+		(
+			boost::python::arg( "image" ),
+			boost::python::arg( "channelNames" ),
+			boost::python::arg( "positions" ),
+			boost::python::arg( "interpolate" ) = true,
+			boost::python::arg( "boundingMode" ) = Sampler::Black
+		)
+	);
 
 	StringVectorFromStringVectorData();
 
@@ -65,6 +65,7 @@
 #include "boost/bind/bind.hpp"
 #include "boost/lexical_cast.hpp"
 
+#include <deque>
 #include <regex>
 
 using namespace std;
@@ -841,9 +842,97 @@ const TileShaderSelectedIDs *tileShaderSelectedIDs()
 }
 
 const std::string g_idChannelInternalName( "__internal_ID_channel__" );
+const IECore::InternedString g_frame( "frame" );
+
+// Returns the channels we need to compute in order to display `rgbaChannels`.
+// This is the intersection of the available channels (`channelNames`) and the
+// channels we want to display, plus `idChannelResultName` if the ID channel
+// is available.
+vector<string> channelsToCompute(
+	const vector<string> &channelNames, const ImageGadget::Channels &rgbaChannels,
+	int soloChannel, const IECore::InternedString &idChannel, const std::string &idChannelResultName
+)
+{
+	vector<string> result;
+	for( const auto &channelName : channelNames )
+	{
+		if( find( rgbaChannels.begin(), rgbaChannels.end(), channelName ) != rgbaChannels.end() )
+		{
+			if( soloChannel < 0 || rgbaChannels[soloChannel] == channelName || rgbaChannels[3] == channelName )
+			{
+				result.push_back( channelName );
+			}
+		}
+
+		if( channelName == idChannel.string() )
+		{
+			result.push_back( idChannelResultName );
+		}
+	}
+	return result;
+}
+
+// Returns true if `frames` follows on from `previous`, as it does when
+// playback advances. This is the case if the first of `frames` is in
+// `previous`, and all the frames the two lists share from that point on
+// match, meaning that the direction of playback is unchanged.
+bool isContinuation( const vector<float> &previous, const vector<float> &frames )
+{
+	if( previous.empty() || frames.empty() )
+	{
+		return false;
+	}
+
+	auto it = std::find( previous.begin(), previous.end(), frames.front() );
+	if( it == previous.end() )
+	{
+		return false;
+	}
+
+	const size_t overlap = std::min<size_t>( previous.end() - it, frames.size() );
+	return std::equal( it, it + overlap, frames.begin() );
+}
 
 } // namespace
 
+//////////////////////////////////////////////////////////////////////////
+// PrefetchQueue
+//////////////////////////////////////////////////////////////////////////
+
+struct ImageGadget::PrefetchQueue
+{
+
+	// Pops the next frame to prefetch, returning false if there are none
+	// left, in which case the task must exit.
+	bool pop( float &frame )
+	{
+		tbb::spin_mutex::scoped_lock lock( mutex );
+		if( frames.empty() )
+		{
+			running = false;
+			return false;
+		}
+		frame = frames.front();
+		frames.pop_front();
+		return true;
+	}
+
+	// Called when the task exits early, most likely because it was cancelled.
+	// Returns `frame` to the queue, since it wasn't completed.
+	void abort( float frame )
+	{
+		tbb::spin_mutex::scoped_lock lock( mutex );
+		frames.push_front( frame );
+		running = false;
+	}
+
+	tbb::spin_mutex mutex;
+	std::deque<float> frames;
+	// False once the task has exited.
+	bool running = false;
+
+};
+
 //////////////////////////////////////////////////////////////////////////
 // ImageGadget implementation
 //////////////////////////////////////////////////////////////////////////
@@ -873,9 +962,10 @@ ImageGadget::ImageGadget()
 
 ImageGadget::~ImageGadget()
 {
-	// Make sure background task completes before anything
-	// it relies on is destroyed.
+	// Make sure background tasks complete before anything
+	// they rely on is destroyed.
 	m_tilesTask.reset();
+	m_prefetchTask.reset();
 }
 
 void ImageGadget::setImage( GafferImage::ImagePlugPtr image )
@@ -885,6 +975,9 @@ void ImageGadget::setImage( GafferImage::ImagePlugPtr image )
 		return;
 	}
 
+	// Cancel prefetching before modifying `m_image`, so that
+	// the background task never sees the old image.
+	m_prefetchTask.reset();
 	m_image = image;
 
 	if( Gaffer::Node *node = const_cast<Gaffer::Node *>( image->node() ) )
@@ -897,6 +990,7 @@ void ImageGadget::setImage( GafferImage::ImagePlugPtr image )
 	}
 
 	dirty( AllDirty );
+	updatePrefetch();
 }
 
 const GafferImage::ImagePlug *ImageGadget::getImage() const
@@ -911,12 +1005,14 @@ void ImageGadget::setContext( Gaffer::ConstContextPtr context )
 		return;
 	}
 
+	m_prefetchTask.reset();
 	m_context = context;
 	m_contextChangedConnection = const_cast<Context *>( m_context.get() )->changedSignal().connect(
 		boost::bind( &ImageGadget::contextChanged, this, ::_2 )
 	);
 
 	dirty( AllDirty );
+	updatePrefetch();
 }
 
 const Gaffer::Context *ImageGadget::getContext() const
@@ -934,6 +1030,7 @@ void ImageGadget::setChannels( const Channels &channels )
 	m_rgbaChannels = channels;
 	channelsChangedSignal()( this );
 	dirty( TilesDirty );
+	updatePrefetch();
 }
 
 const ImageGadget::Channels &ImageGadget::getChannels() const
@@ -952,6 +1049,7 @@ void ImageGadget::setIDChannel( const IECore::InternedString & idChannel )
 
 	channelsChangedSignal()( this );
 	dirty( TilesDirty );
+	updatePrefetch();
 }
 
 const IECore::InternedString ImageGadget::getIDChannel()
@@ -987,6 +1085,7 @@ void ImageGadget::setSoloChannel( int index )
 	m_soloChannel = index;
 
 	Gadget::dirty( DirtyType::Render );
+	updatePrefetch();
 }
 
 int ImageGadget::getSoloChannel() const
@@ -1019,10 +1118,16 @@ void ImageGadget::setPaused( bool paused )
 	if( m_paused )
 	{
 		m_tilesTask.reset();
+		m_prefetchTask.reset();
+		m_prefetchQueue.reset();
 	}
-	else if( m_dirtyFlags )
+	else
 	{
-		Gadget::dirty( DirtyType::Render );
+		if( m_dirtyFlags )
+		{
+			Gadget::dirty( DirtyType::Render );
+		}
+		updatePrefetch();
 	}
 	stateChangedSignal()( this );
 }
@@ -1032,6 +1137,59 @@ bool ImageGadget::getPaused() const
 	return m_paused;
 }
 
+void ImageGadget::setPrefetchFrames( const std::vector<float> &frames )
+{
+	if( frames == m_prefetchFrames )
+	{
+		return;
+	}
+
+	const bool continuation = isContinuation( m_prefetchFrames, frames );
+	const vector<float> previousFrames = m_prefetchFrames;
+	m_prefetchFrames = frames;
+
+	if( !continuation || !m_prefetchQueue )
+	{
+		updatePrefetch();
+		return;
+	}
+
+	// Playback has advanced, and the new frames follow on from the ones
+	// we were already prefetching. Rather than throw away work in progress,
+	// we update the queue the existing task is working through, skipping
+	// any frames it has already taken.
+
+	bool running;
+	{
+		tbb::spin_mutex::scoped_lock lock( m_prefetchQueue->mutex );
+		std::deque<float> queue;
+		for( float frame : frames )
+		{
+			const bool taken =
+				std::find( previousFrames.begin(), previousFrames.end(), frame ) != previousFrames.end() &&
+				std::find( m_prefetchQueue->frames.begin(), m_prefetchQueue->frames.end(), frame ) == m_prefetchQueue->frames.end()
+			;
+			if( !taken )
+			{
+				queue.push_back( frame );
+			}
+		}
+		m_prefetchQueue->frames.swap( queue );
+		running = m_prefetchQueue->running;
+	}
+
+	if( !running && !m_prefetchQueue->frames.empty() )
+	{
+		// Previous task ran out of work and exited.
+		startPrefetchTask();
+	}
+}
+
+const std::vector<float> &ImageGadget::getPrefetchFrames() const
+{
+	return m_prefetchFrames;
+}
+
 uint64_t ImageGadget::tileUpdateCount()
 {
 	return g_tileUpdateCount;
@@ -1171,6 +1329,7 @@ void ImageGadget::plugDirtied( const Gaffer::Plug *plug )
 	if( plug == m_image->formatPlug() )
 	{
 		dirty( FormatDirty );
+		return;
 	}
 	else if( plug == m_image->dataWindowPlug() )
 	{
@@ -1184,11 +1343,25 @@ void ImageGadget::plugDirtied( const Gaffer::Plug *plug )
 	{
 		dirty( TilesDirty );
 	}
+	else
+	{
+		return;
+	}
+
+	// Any frames we have already prefetched are now out of date,
+	// so start again.
+	updatePrefetch();
 }
 
 void ImageGadget::contextChanged( const IECore::InternedString &name )
 {
 	dirty( AllDirty );
+	if( name != g_frame )
+	{
+		// The prefetch frames are absolute, so only changes to
+		// other variables invalidate them.
+		updatePrefetch();
+	}
 }
 
 //////////////////////////////////////////////////////////////////////////
@@ -1477,23 +1650,9 @@ void ImageGadget::updateTiles()
 	// Decide which channels to compute. This is the intersection
 	// of the available channels (channelNames) and the channels
 	// we want to display (m_rgbaChannels).
-	const vector<string> &channelNames = this->channelNames();
-	vector<string> channelsToCompute;
-	for( vector<string>::const_iterator it = channelNames.begin(), eIt = channelNames.end(); it != eIt; ++it )
-	{
-		if( find( m_rgbaChannels.begin(), m_rgbaChannels.end(), *it ) != m_rgbaChannels.end() )
-		{
-			if( m_soloChannel < 0 || m_rgbaChannels[m_soloChannel] == *it || m_rgbaChannels[3] == *it )
-			{
-				channelsToCompute.push_back( *it );
-			}
-		}
-
-		if( *it == m_idChannel.string() )
-		{
-			channelsToCompute.push_back( g_idChannelInternalName );
-		}
-	}
+	const vector<string> channelsToCompute = ::channelsToCompute(
+		this->channelNames(), m_rgbaChannels, m_soloChannel, m_idChannel, g_idChannelInternalName
+	);
 
 	const Box2i dataWindow = this->dataWindow();
 
@@ -1589,6 +1748,77 @@ void ImageGadget::updateTiles()
 
 }
 
+void ImageGadget::updatePrefetch()
+{
+	m_prefetchTask.reset();
+	m_prefetchQueue.reset();
+	if( m_prefetchFrames.empty() || m_paused || !m_image || !visible() )
+	{
+		return;
+	}
+
+	m_prefetchQueue = std::make_shared<PrefetchQueue>();
+	m_prefetchQueue->frames.assign( m_prefetchFrames.begin(), m_prefetchFrames.end() );
+	startPrefetchTask();
+}
+
+void ImageGadget::startPrefetchTask()
+{
+	m_prefetchTask.reset();
+	m_prefetchQueue->running = true;
+
+	// `callOnBackgroundThread()` takes a copy of the current context,
+	// so the task is unaffected by subsequent changes to `m_context`.
+	Context::Scope scopedContext( m_context.get() );
+	m_prefetchTask = ParallelAlgo::callOnBackgroundThread(
+		// Subject
+		m_image.get(),
+		// We take copies of everything we need, because the members may be
+		// changed on the UI thread while we run. Any change that invalidates
+		// the prefetch cancels the task before modifying the member.
+		[ image = m_image, queue = m_prefetchQueue, rgbaChannels = m_rgbaChannels, soloChannel = m_soloChannel, idChannel = m_idChannel ] {
+
+			Context::EditableScope frameScope( Context::current() );
+			float frame;
+			while( queue->pop( frame ) )
+			{
+				frameScope.setFrame( frame );
+				try
+				{
+					const Box2i dataWindow = image->dataWindowPlug()->getValue();
+					ConstStringVectorDataPtr channelNamesData = image->channelNamesPlug()->getValue();
+					const vector<string> channels = ::channelsToCompute(
+						channelNamesData->readable(), rgbaChannels, soloChannel, idChannel, idChannel.string()
+					);
+
+					// We just need the tiles to be in the compute cache,
+					// so we discard the results.
+					ImageAlgo::parallelProcessTiles(
+						image.get(), channels,
+						[] ( const ImagePlug *image, const string &channelName, const V2i &tileOrigin ) {
+							image->channelDataPlug()->getValue();
+						},
+						dataWindow
+					);
+				}
+				catch( const Gaffer::ProcessException & )
+				{
+					// Errors will be reported if and when the frame
+					// is displayed, so we just move on to the next one.
+				}
+				catch( ... )
+				{
+					// Cancellation. Make sure that `setPrefetchFrames()` knows
+					// it must start a new task to finish the queue.
+					queue->abort( frame );
+					throw;
+				}
+			}
+
+		}
+	);
+}
+
 void ImageGadget::removeOutOfBoundsTiles() const
 {
 	// In theory, any given tile we hold could turn out to be valid
@@ -1625,6 +1855,12 @@ void ImageGadget::visibilityChanged()
 	if( !visible() )
 	{
 		m_tilesTask.reset();
+		m_prefetchTask.reset();
+		m_prefetchQueue.reset();
+	}
+	else
+	{
+		updatePrefetch();
 	}
 }
 
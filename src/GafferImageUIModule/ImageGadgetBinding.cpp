@@ -35,6 +35,7 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "boost/python.hpp"
+#include "boost/python/suite/indexing/container_utils.hpp"
 
 #include "ImageGadgetBinding.h"
 
@@ -73,6 +74,24 @@ void setPaused( ImageGadget &g, bool paused )
 	g.setPaused( paused );
 }
 
+void setPrefetchFrames( ImageGadget &g, object frames )
+{
+	std::vector<float> f;
+	container_utils::extend_container( f, frames );
+	ScopedGILRelease gilRelease;
+	g.setPrefetchFrames( f );
+}
+
+list getPrefetchFrames( const ImageGadget &g )
+{
+	list result;
+	for( float frame : g.getPrefetchFrames() )
+	{
+		result.append( frame );
+	}
+	return result;
+}
+
 Imath::V2f pixelAt( const ImageGadget &g, const IECore::LineSegment3f &lineInGadgetSpace )
 {
 	// Need GIL release because this method may trigger a compute of the format.
@@ -114,6 +133,8 @@ void GafferImageUIModule::bindImageGadget()
 		.def( "getSoloChannel", &ImageGadget::getSoloChannel )
 		.def( "setPaused", &setPaused )
 		.def( "getPaused", &ImageGadget::getPaused )
+		.def( "setPrefetchFrames", &setPrefetchFrames )
+		.def( "getPrefetchFrames", &getPrefetchFrames )
 		.def( "tileUpdateCount", &ImageGadget::tileUpdateCount )
 		.staticmethod( "tileUpdateCount" )
 		.def( "resetTileUpdateCount", &ImageGadget::resetTileUpdateCount )
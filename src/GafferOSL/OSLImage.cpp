@@ -644,7 +644,8 @@ IECore::ConstCompoundDataPtr OSLImage::computeShading( const Gaffer::Context *co
 	shadingPoints->writable()["v"] = vData;
 
 
-	CompoundDataPtr result = shadingEngine->shade( shadingPoints.get() );
+	// Ci is never used as a channel, so we don't ask for it.
+	CompoundDataPtr result = shadingEngine->shade( shadingPoints.get(), ShadingEngine::Transforms(), ShadingEngine::PointClouds(), /* outputCi = */ false );
 
 	// remove results that aren't suitable to become channels
 	for( CompoundDataMap::iterator it = result->writable().begin(); it != result->writable().end();  )
@@ -592,15 +592,12 @@ IECore::ConstObjectPtr OSLObject::computeProcessedObject( const ScenePath &path,
 		}
 	}
 
-	CompoundDataPtr shadedPoints = shadingEngine->shade( shadingPoints.get(), transforms, pointClouds );
+	// We don't request the output color closure as the debug closures are used to define what is 'exported'
+	// from the shader. This avoids allocating and accumulating a full-size Ci array that we'd only throw away.
+	CompoundDataPtr shadedPoints = shadingEngine->shade( shadingPoints.get(), transforms, pointClouds, /* outputCi = */ false );
 	for( CompoundDataMap::const_iterator it = shadedPoints->readable().begin(), eIt = shadedPoints->readable().end(); it != eIt; ++it )
 	{
-
-		// Ignore the output color closure as the debug closures are used to define what is 'exported' from the shader
-		if( it->first != "Ci" )
-		{
-			outputPrimitive->variables[it->first] = PrimitiveVariable( interpolation, it->second );
-		}
+		outputPrimitive->variables[it->first] = PrimitiveVariable( interpolation, it->second );
 	}
 
 	return outputPrimitive;
@@ -39,6 +39,7 @@
 #include "GafferOSL/OSLShader.h"
 
 #include "Gaffer/Context.h"
+#include "Gaffer/Private/IECorePreview/LRUCache.h"
 
 #include "IECoreScene/ShaderNetworkAlgo.h"
 
@@ -1474,15 +1475,16 @@ class ShadingResults
 
 	public :
 
-		ShadingResults( size_t numPoints )
-			:	m_results( new CompoundData ), m_ci( nullptr )
+		ShadingResults( size_t numPoints, bool outputCi )
+			:	m_results( new CompoundData ), m_numPoints( numPoints ), m_ci( nullptr )
 		{
-			Color3fVectorDataPtr ciData = new Color3fVectorData();
-			m_ci = &ciData->writable();
-			m_ci->resize( numPoints, Color3f( 0.0f ) );
-
-			CompoundDataPtr result = new CompoundData();
-			m_results->writable()["Ci"] = ciData;
+			if( outputCi )
+			{
+				Color3fVectorDataPtr ciData = new Color3fVectorData();
+				m_ci = &ciData->writable();
+				m_ci->resize( numPoints, Color3f( 0.0f ) );
+				m_results->writable()["Ci"] = ciData;
+			}
 		}
 
 		/// \todo This is a lot like the UserData struct above - maybe we should
@@ -1543,7 +1545,10 @@ class ShadingResults
 
 		void addEmission( size_t pointIndex, const EmissionParameters *parameters, const Color3f &weight )
 		{
-			(*m_ci)[pointIndex] += weight;
+			if( m_ci )
+			{
+				(*m_ci)[pointIndex] += weight;
+			}
 		}
 
 		DebugResult acquireDebugResult( const DebugParameters *parameters, DebugResultsMap &threadCache )
@@ -1573,7 +1578,7 @@ class ShadingResults
 					// Create the result.
 					DebugResult result;
 					result.type = typeDescFromTypeName( parameters->type.asUString() );
-					result.type.arraylen = m_ci->size();
+					result.type.arraylen = m_numPoints;
 
 					DataPtr data = dataFromTypeDesc( result.type, result.basePointer );
 					if( !data )
@@ -1651,6 +1656,7 @@ class ShadingResults
 		}
 
 		CompoundDataPtr m_results;
+		const size_t m_numPoints;
 		vector<Color3f> *m_ci;
 		DebugResultsMap m_debugResults;
 		tbb::spin_rw_mutex m_resultsMutex;
@@ -1745,25 +1751,57 @@ const T *varyingValue( const IECore::CompoundData *points, const char *name )
 
 } // namespace
 
-ShadingEngine::ShadingEngine( const IECoreScene::ShaderNetwork *shaderNetwork ) : ShadingEngine( shaderNetwork->copy() )
+//////////////////////////////////////////////////////////////////////////
+// Shader group cache
+//////////////////////////////////////////////////////////////////////////
+
+namespace
 {
-}
 
+// Declaring a ShaderGroup is relatively cheap, but OSL defers optimisation
+// and JIT compilation until the group is first executed, and that can be
+// very expensive. We share groups between all ShadingEngines with identical
+// networks, so that the work is done only once no matter how many nodes or
+// contexts produce the same network.
 
-ShadingEngine::ShadingEngine( IECoreScene::ShaderNetworkPtr &&shaderNetwork )
-	:	m_hash( shaderNetwork->Object::hash() ), m_timeNeeded( false ), m_unknownAttributesNeeded( false ), m_hasDeformation( false )
+struct ShaderGroupCacheGetterKey
+{
+
+	ShaderGroupCacheGetterKey()
+		:	network( nullptr )
+	{
+	}
+
+	ShaderGroupCacheGetterKey( const IECore::MurmurHash &hash, ShaderNetwork *network )
+		:	hash( hash ), network( network )
+	{
+	}
+
+	operator const IECore::MurmurHash & () const
+	{
+		return hash;
+	}
+
+	MurmurHash hash;
+	ShaderNetwork *network;
+
+};
+
+ShaderGroupRef shaderGroupGetter( const ShaderGroupCacheGetterKey &key, size_t &cost, const IECore::Canceller *canceller )
 {
-	IECoreScene::ShaderNetworkAlgo::convertToOSLConventions( shaderNetwork.get(), OSL_VERSION );
+	cost = 1;
+
+	IECoreScene::ShaderNetworkAlgo::convertToOSLConventions( key.network, OSL_VERSION );
 
 	ShadingSystem *shadingSystem = ::shadingSystem();
 
 	{
 		ShadingSystemWriteMutex::scoped_lock shadingSystemWriteLock( g_shadingSystemWriteMutex );
-		m_shaderGroupRef = new ShaderGroupRef( shadingSystem->ShaderGroupBegin() );
+		ShaderGroupRef result = shadingSystem->ShaderGroupBegin();
 		std::vector<std::string> invalidShaders;
 
 		ShaderNetworkAlgo::depthFirstTraverse(
-			shaderNetwork.get(),
+			key.network,
 			[shadingSystem, &invalidShaders] ( const ShaderNetwork *shaderNetwork, const InternedString &handle ) {
 
 				// Check for invalid (non-OSL) shaders. We stop declaring shaders if any
@@ -1803,8 +1841,30 @@ ShadingEngine::ShadingEngine( IECoreScene::ShaderNetworkPtr &&shaderNetwork )
 			std::string exceptionMessage = "The following shaders can't be used as they are not OSL shaders: ";
 			throw Exception( exceptionMessage + boost::algorithm::join( invalidShaders, ", " ) );
 		}
+
+		return result;
 	}
+}
+
+using ShaderGroupCache = IECorePreview::LRUCache<IECore::MurmurHash, ShaderGroupRef, IECorePreview::LRUCachePolicy::Parallel, ShaderGroupCacheGetterKey>;
+
+ShaderGroupCache &shaderGroupCache()
+{
+	static ShaderGroupCache g_cache( shaderGroupGetter, 10000 );
+	return g_cache;
+}
+
+} // namespace
 
+ShadingEngine::ShadingEngine( const IECoreScene::ShaderNetwork *shaderNetwork ) : ShadingEngine( shaderNetwork->copy() )
+{
+}
+
+
+ShadingEngine::ShadingEngine( IECoreScene::ShaderNetworkPtr &&shaderNetwork )
+	:	m_hash( shaderNetwork->Object::hash() ), m_timeNeeded( false ), m_unknownAttributesNeeded( false ), m_hasDeformation( false )
+{
+	m_shaderGroupRef = new ShaderGroupRef( shaderGroupCache().get( ShaderGroupCacheGetterKey( m_hash, shaderNetwork.get() ) ) );
 	queryShaderGroup();
 }
 
@@ -1918,6 +1978,7 @@ struct ExecuteShadeParameters
 	const IECore::Canceller *canceller;
 
 	size_t numPoints;
+	bool outputCi;
 	const OSL::Vec3 *p;
 	const float *u;
 	const float *v;
@@ -1930,7 +1991,7 @@ struct ExecuteShadeParameters
 IECore::CompoundDataPtr executeShade( const ExecuteShadeParameters &params, const RenderState &renderState, ShaderGroup &shaderGroup, ShadingSystem *shadingSystem )
 {
 	// Allocate data for the result
-	ShadingResults results( params.numPoints );
+	ShadingResults results( params.numPoints, params.outputCi );
 
 	// Iterate over the input points, doing the shading as we go
 	auto f = [&params, &renderState, &shaderGroup, &shadingSystem, &results]( const tbb::blocked_range<size_t> &r )
@@ -1994,7 +2055,7 @@ template< int WidthT >
 IECore::CompoundDataPtr executeShadeBatched( const ExecuteShadeParameters &params, const RenderState &renderState, ShaderGroup &shaderGroup, ShadingSystem::BatchedExecutor<WidthT> &executor )
 {
 	// Allocate data for the result
-	ShadingResults results( params.numPoints );
+	ShadingResults results( params.numPoints, params.outputCi );
 
 	executor.jit_group( &shaderGroup, params.threadInfoCache.local().shadingContext );
 
@@ -2106,16 +2167,37 @@ IECore::CompoundDataPtr executeShadeBatched( const ExecuteShadeParameters &param
 
 } // namespace
 
+size_t ShadingEngine::getShaderGroupCacheSizeLimit()
+{
+	return shaderGroupCache().getMaxCost();
+}
+
+void ShadingEngine::setShaderGroupCacheSizeLimit( size_t maxEntries )
+{
+	shaderGroupCache().setMaxCost( maxEntries );
+}
+
+size_t ShadingEngine::shaderGroupCacheUsage()
+{
+	return shaderGroupCache().currentCost();
+}
+
+void ShadingEngine::clearShaderGroupCache()
+{
+	shaderGroupCache().clear();
+}
+
 IECore::CompoundDataPtr ShadingEngine::shade( const IECore::CompoundData *points, const ShadingEngine::Transforms &transforms ) const
 {
 	return shade( points, transforms, PointClouds() );
 }
 
-IECore::CompoundDataPtr ShadingEngine::shade( const IECore::CompoundData *points, const Transforms &transforms, const PointClouds &pointClouds ) const
+IECore::CompoundDataPtr ShadingEngine::shade( const IECore::CompoundData *points, const Transforms &transforms, const PointClouds &pointClouds, bool outputCi ) const
 {
 	ShaderGroup &shaderGroup = **static_cast<ShaderGroupRef *>( m_shaderGroupRef );
 
 	ExecuteShadeParameters shadeParameters;
+	shadeParameters.outputCi = outputCi;
 	int batchSize;
 	ShadingSystem *shadingSystem = ::shadingSystem( &batchSize );
 
@@ -117,7 +117,7 @@ std::string repr( ShadingEngine::Transform &s )
 	);
 }
 
-IECore::CompoundDataPtr shadeWrapper( ShadingEngine &shadingEngine, const IECore::CompoundData *points, boost::python::dict pythonTransforms, boost::python::dict pythonPointClouds )
+IECore::CompoundDataPtr shadeWrapper( ShadingEngine &shadingEngine, const IECore::CompoundData *points, boost::python::dict pythonTransforms, boost::python::dict pythonPointClouds, bool outputCi )
 {
 	ShadingEngine::Transforms transforms;
 
@@ -173,7 +173,7 @@ IECore::CompoundDataPtr shadeWrapper( ShadingEngine &shadingEngine, const IECore
 		pointClouds[keyElem()] = valueElem();
 	}
 
-	return shadingEngine.shade( points, transforms, pointClouds );
+	return shadingEngine.shade( points, transforms, pointClouds, outputCi );
 }
 
 IECore::CompoundDataPtr shadeUVTextureWrapper( const IECoreScene::ShaderNetwork &shaderNetwork, const Imath::V2i &resolution, const IECoreScene::ShaderNetwork::Parameter &output )
@@ -239,11 +239,20 @@ BOOST_PYTHON_MODULE( _GafferOSL )
 				(
 					boost::python::arg( "points" ),
 					boost::python::arg( "transforms" ) = boost::python::dict(),
-					boost::python::arg( "pointClouds" ) = boost::python::dict()
+					boost::python::arg( "pointClouds" ) = boost::python::dict(),
+					boost::python::arg( "outputCi" ) = true
 				)
 			)
 			.def( "needsAttribute", &ShadingEngine::needsAttribute )
 			.def( "hasDeformation", &ShadingEngine::hasDeformation )
+			.def( "getShaderGroupCacheSizeLimit", &ShadingEngine::getShaderGroupCacheSizeLimit )
+			.staticmethod( "getShaderGroupCacheSizeLimit" )
+			.def( "setShaderGroupCacheSizeLimit", &ShadingEngine::setShaderGroupCacheSizeLimit )
+			.staticmethod( "setShaderGroupCacheSizeLimit" )
+			.def( "shaderGroupCacheUsage", &ShadingEngine::shaderGroupCacheUsage )
+			.staticmethod( "shaderGroupCacheUsage" )
+			.def( "clearShaderGroupCache", &ShadingEngine::clearShaderGroupCache )
+			.staticmethod( "clearShaderGroupCache" )
 		;
 
 		class_<ShadingEngine::Transform>( "Transform" )
@@ -59,6 +59,7 @@
 #include "Gaffer/StringPlug.h"
 #include "Gaffer/Spreadsheet.h"
 
+#include "IECore/MessageHandler.h"
 #include "IECore/NullObject.h"
 
 #include "boost/algorithm/string.hpp"
@@ -67,8 +68,16 @@
 #include "boost/regex.hpp"
 #include "boost/unordered_map.hpp"
 
+#include "fmt/format.h"
+
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <mutex>
 #include <thread>
 #include <unordered_map>
+#include <unordered_set>
+#include <vector>
 
 using namespace std;
 using namespace boost::placeholders;
@@ -159,6 +168,138 @@ namespace
 
 		return nullptr;
 	}
+
+	// Returns the number of threads used to save images, as specified by the
+	// `GAFFERSCENE_CATALOGUE_SAVE_THREADS` environment variable.
+	size_t saveThreads()
+	{
+		if( const char *e = getenv( "GAFFERSCENE_CATALOGUE_SAVE_THREADS" ) )
+		{
+			try
+			{
+				return std::max( 1, std::stoi( e ) );
+			}
+			catch( const std::exception & )
+			{
+				IECore::msg(
+					IECore::Msg::Warning, "Catalogue",
+					fmt::format( "Invalid value \"{}\" for GAFFERSCENE_CATALOGUE_SAVE_THREADS", e )
+				);
+			}
+		}
+		return 2;
+	}
+
+	// Runs the background saves for all Catalogues on a small fixed pool
+	// of threads, rather than launching a new thread for every image. This
+	// stops long sessions with many renders from oversubscribing the machine
+	// with simultaneous saves, each of which is already parallelised internally.
+	//
+	// The trade-off is that images arriving in bursts must wait their turn,
+	// and an image's display driver data is only released once it has been
+	// saved. The number of threads can be increased with the
+	// `GAFFERSCENE_CATALOGUE_SAVE_THREADS` environment variable, to drain the
+	// queue faster at the expense of more simultaneous saves.
+	class SaveQueue
+	{
+
+		public :
+
+			static SaveQueue &instance()
+			{
+				static SaveQueue g_instance( saveThreads() );
+				return g_instance;
+			}
+
+			~SaveQueue()
+			{
+				// By the time we are destroyed, every AsynchronousSaver has
+				// already waited for its job, so the workers are idle and we
+				// just need to wake them up so that they can exit.
+				{
+					std::unique_lock<std::mutex> lock( m_mutex );
+					m_stopping = true;
+				}
+				m_jobsCondition.notify_all();
+				for( auto &thread : m_threads )
+				{
+					thread.join();
+				}
+			}
+
+			void push( const void *owner, std::function<void ()> &&job )
+			{
+				{
+					std::unique_lock<std::mutex> lock( m_mutex );
+					m_jobs.emplace_back( owner, std::move( job ) );
+				}
+				m_jobsCondition.notify_one();
+			}
+
+			// Waits for the job for `owner` to complete. If it has not been
+			// started by a worker yet, it is removed from the queue and run
+			// on the calling thread instead.
+			void wait( const void *owner )
+			{
+				std::unique_lock<std::mutex> lock( m_mutex );
+				for( auto it = m_jobs.begin(); it != m_jobs.end(); ++it )
+				{
+					if( it->first == owner )
+					{
+						std::function<void ()> job = std::move( it->second );
+						m_jobs.erase( it );
+						lock.unlock();
+						job();
+						return;
+					}
+				}
+				m_finishedCondition.wait( lock, [this, owner] { return !m_running.count( owner ); } );
+			}
+
+		private :
+
+			SaveQueue( size_t numThreads )
+				:	m_stopping( false )
+			{
+				for( size_t i = 0; i < numThreads; ++i )
+				{
+					m_threads.emplace_back( [this] { run(); } );
+				}
+			}
+
+			void run()
+			{
+				std::unique_lock<std::mutex> lock( m_mutex );
+				while( true )
+				{
+					m_jobsCondition.wait( lock, [this] { return m_stopping || !m_jobs.empty(); } );
+					if( m_stopping )
+					{
+						return;
+					}
+
+					auto [owner, job] = std::move( m_jobs.front() );
+					m_jobs.pop_front();
+					m_running.insert( owner );
+
+					lock.unlock();
+					job();
+					lock.lock();
+
+					m_running.erase( owner );
+					m_finishedCondition.notify_all();
+				}
+			}
+
+			std::mutex m_mutex;
+			std::condition_variable m_jobsCondition;
+			std::condition_variable m_finishedCondition;
+			std::deque<std::pair<const void *, std::function<void ()>>> m_jobs;
+			std::unordered_set<const void *> m_running;
+			bool m_stopping;
+			std::vector<std::thread> m_threads;
+
+	};
 }
 
 //////////////////////////////////////////////////////////////////////////
@@ -575,29 +716,32 @@ class Catalogue::InternalImage : public ImageNode
 				Ptr saver = Ptr( new AsynchronousSaver( imageCopy, fileName, renderManifest ) );
 				saver->registerClient( client );
 
-				// Note that the background thread doesn't own a reference to the saver -
+				// Note that the background job doesn't own a reference to the saver -
 				// see ~AsychronousSaver for details.
-				std::thread thread( boost::bind( &AsynchronousSaver::save, saver.get(), WeakPtr( saver ) ) );
-				saver->m_thread.swap( thread );
+				SaveQueue::instance().push(
+					saver.get(), [s = saver.get(), forWrapUp = WeakPtr( saver )] { s->save( forWrapUp ); }
+				);
 				return saver;
 			}
 
 			virtual ~AsynchronousSaver()
 			{
-				// Wait for our background thread to complete. This achieves
-				// two things :
+				// Wait for our background job to complete, running it ourselves
+				// if it hasn't been started yet. This achieves three things :
 				//
 				// - Makes sure our member data is not deleted until the background
-				//   thread has finished using it.
-				// - Ensures that the background thread finishes before program shutdown
+				//   job has finished using it.
+				// - Ensures that the background job finishes before program shutdown
 				//   reaches the stage of calling static destructors, at which point
 				//   it would crash as the libraries it relies on are torn down around it.
+				// - Ensures that the image is always saved, even if we are destroyed
+				//   while other saves are still occupying the queue.
 				//
-				// Note that for this to work, the background thread must _not_ own a
+				// Note that for this to work, the background job must _not_ own a
 				// reference to `this`, as that would prevent destruction on the main
 				// thread and never give us an opportunity to wait for the background
-				// thread.
-				m_thread.join();
+				// job.
+				SaveQueue::instance().wait( this );
 			}
 
 			void registerClient( InternalImage *client )
@@ -768,7 +912,6 @@ class Catalogue::InternalImage : public ImageNode
 				std::shared_ptr<const GafferScene::RenderManifest> m_renderManifest;
 				std::filesystem::path m_manifestDest;
 
-				std::thread m_thread;
 				set<InternalImage *> m_clients;
 
 		};
@@ -39,8 +39,10 @@
 #include "GafferImage/ImageAlgo.h"
 
 #include "Gaffer/Context.h"
+#include "Gaffer/NameValuePlug.h"
 
 #include "IECore/MessageHandler.h"
+#include "IECore/ObjectVector.h"
 
 #include <boost/iostreams/stream.hpp>
 #include <boost/property_tree/ptree.hpp>
@@ -50,6 +52,7 @@
 #include "fmt/format.h"
 
 #include <filesystem>
+#include <map>
 #include <regex>
 #include <unordered_map>
 #include <unordered_set>
@@ -160,6 +163,88 @@ inline float matteNameToValue( const std::string &matteName )
 	return result;
 }
 
+// Inserts the ID values for `matteNames` into `matteValues`, using `manifest`
+// (if provided) to resolve wildcards and hierarchical matches.
+void insertMatteValues( const std::vector<std::string> &matteNames, const CompoundData *manifest, std::unordered_set<float> &matteValues )
+{
+	IECore::PathMatcher pathMatcher;
+	for( const auto &name : matteNames )
+	{
+		if( name.size() > 0 && name.front() == '<' && name.back() == '>' )
+		{
+			try
+			{
+				matteValues.insert( std::stof( name.substr(1, name.size() - 2) ) );
+			}
+			catch( const std::exception & )
+			{
+				IECore::msg( IECore::Msg::Error, "Cryptomatte::matteValues", fmt::format( "Error converting value: {}", name ) );
+				continue;
+			}
+		}
+		else
+		{
+			if( manifest )
+			{
+				pathMatcher.addPath( name );
+			}
+
+			if( !StringAlgo::hasWildcards( name ) || name.find( "..." ) == string::npos )
+			{
+				// Hash names without wildcards directly. This allows them to still be matched if no manifest exists or has been truncated by the renderer
+				matteValues.insert( matteNameToValue( name ) );
+			}
+		}
+	}
+
+	if( manifest && !pathMatcher.isEmpty() )
+	{
+		for( const auto &manifestEntry : manifest->readable() )
+		{
+			const std::string &matteName = static_cast<IECore::StringData *>( manifestEntry.second.get() )->readable();
+			if( pathMatcher.match( matteName ) & ( IECore::PathMatcher::ExactMatch | IECore::PathMatcher::AncestorMatch ) )
+			{
+				matteValues.insert( matteNameToValue( matteName ) );
+			}
+		}
+	}
+}
+
+// Returns the enabled entries from the `mattes` plug, as pairs of
+// output channel name and matte names plug. Where several entries
+// share a channel name, the last one wins.
+using Mattes = std::vector<std::pair<std::string, const StringVectorDataPlug *>>;
+Mattes enabledMattes( const CompoundDataPlug *mattesPlug )
+{
+	Mattes result;
+	for( const auto &matte : NameValuePlug::Range( *mattesPlug ) )
+	{
+		if( matte->enabledPlug() && !matte->enabledPlug()->getValue() )
+		{
+			continue;
+		}
+
+		const auto matteNamesPlug = matte->valuePlug<StringVectorDataPlug>();
+		const std::string channelName = matte->namePlug()->getValue();
+		if( !matteNamesPlug || channelName.empty() )
+		{
+			continue;
+		}
+
+		auto it = std::find_if( result.begin(), result.end(), [&channelName] ( const auto &m ) { return m.first == channelName; } );
+		if( it != result.end() )
+		{
+			it->second = matteNamesPlug;
+		}
+		else
+		{
+			result.push_back( { channelName, matteNamesPlug } );
+		}
+	}
+
+	return result;
+}
+
 IECore::CompoundDataPtr propertyTreeToCompoundData( const boost::property_tree::ptree &pt )
 {
 	boost::regex instanceDataRegex( "^instance:[0-9a-f]+$" );
@@ -365,6 +450,36 @@ static const ChannelMap g_channelMap = {
 const std::string g_firstDataChannelSuffix = "00.R";
 const std::string g_cryptomatteChannelPattern = "^{}[0-9]+\\.[RGBA]";
 
+// Returns pairs of ID and coverage channel names for all the ranks
+// stored in `cryptomatteLayer`.
+static std::vector<std::pair<std::string, std::string>> rankChannels( const std::vector<std::string> &channelNames, const std::string &cryptomatteLayer )
+{
+	std::vector<std::pair<std::string, std::string>> result;
+
+	boost::regex channelNameRegex( fmt::format( g_cryptomatteChannelPattern, cryptomatteLayer ) );
+	for( const auto &c : channelNames )
+	{
+		if( boost::regex_match( c, channelNameRegex ) )
+		{
+			ChannelMap::const_iterator cIt = g_channelMap.find( GafferImage::ImageAlgo::baseName( c ) );
+			if( cIt == g_channelMap.end() )
+			{
+				continue;
+			}
+
+			const std::string alphaChannel = GafferImage::ImageAlgo::channelName( GafferImage::ImageAlgo::layerName( c ), cIt->second );
+			if( !GafferImage::ImageAlgo::channelExists( channelNames, alphaChannel ) )
+			{
+				continue;
+			}
+
+			result.push_back( { c, alphaChannel } );
+		}
+	}
+
+	return result;
+}
+
 Cryptomatte::Cryptomatte( const std::string &name )
 	: GafferImage::FlatImageProcessor( name )
 {
@@ -380,6 +495,10 @@ Cryptomatte::Cryptomatte( const std::string &name )
 	addChild( new PathMatcherDataPlug( "__manifestPaths", Gaffer::Plug::Out, new PathMatcherData ) );
 	addChild( new ScenePlug( "manifestScene", Gaffer::Plug::Out ) );
 	addChild( new FloatVectorDataPlug( "__matteChannelData", Gaffer::Plug::Out, GafferImage::ImagePlug::blackTile() ) );
+	addChild( new CompoundDataPlug( "mattes" ) );
+	addChild( new StringVectorDataPlug( "__matteChannels", Gaffer::Plug::Out, new StringVectorData() ) );
+	addChild( new CompoundObjectPlug( "__matteIndex", Gaffer::Plug::Out, new CompoundObject() ) );
+	addChild( new ObjectVectorPlug( "__mattesChannelData", Gaffer::Plug::Out, new ObjectVector() ) );
 
 	outPlug()->formatPlug()->setInput( inPlug()->formatPlug() );
 	outPlug()->metadataPlug()->setInput( inPlug()->metadataPlug() );
@@ -500,6 +619,46 @@ const Gaffer::FloatVectorDataPlug *Cryptomatte::matteChannelDataPlug() const
 	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 10 );
 }
 
+Gaffer::CompoundDataPlug *Cryptomatte::mattesPlug()
+{
+	return getChild<CompoundDataPlug>( g_firstPlugIndex + 11 );
+}
+
+const Gaffer::CompoundDataPlug *Cryptomatte::mattesPlug() const
+{
+	return getChild<CompoundDataPlug>( g_firstPlugIndex + 11 );
+}
+
+Gaffer::StringVectorDataPlug *Cryptomatte::matteChannelsPlug()
+{
+	return getChild<StringVectorDataPlug>( g_firstPlugIndex + 12 );
+}
+
+const Gaffer::StringVectorDataPlug *Cryptomatte::matteChannelsPlug() const
+{
+	return getChild<StringVectorDataPlug>( g_firstPlugIndex + 12 );
+}
+
+Gaffer::CompoundObjectPlug *Cryptomatte::matteIndexPlug()
+{
+	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 13 );
+}
+
+const Gaffer::CompoundObjectPlug *Cryptomatte::matteIndexPlug() const
+{
+	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 13 );
+}
+
+Gaffer::ObjectVectorPlug *Cryptomatte::mattesChannelDataPlug()
+{
+	return getChild<ObjectVectorPlug>( g_firstPlugIndex + 14 );
+}
+
+const Gaffer::ObjectVectorPlug *Cryptomatte::mattesChannelDataPlug() const
+{
+	return getChild<ObjectVectorPlug>( g_firstPlugIndex + 14 );
+}
+
 void Cryptomatte::affects(const Gaffer::Plug *input, AffectedPlugsContainer &outputs) const
 {
 	FlatImageProcessor::affects(input, outputs);
@@ -512,17 +671,34 @@ void Cryptomatte::affects(const Gaffer::Plug *input, AffectedPlugsContainer &out
 		outputs.push_back( matteChannelDataPlug() );
 	}
 
-	if( input == matteChannelDataPlug() )
+	if( input == inPlug()->channelDataPlug() ||
+		input == inPlug()->channelNamesPlug() ||
+		input == layerPlug() ||
+		input == matteIndexPlug() )
+	{
+		outputs.push_back( mattesChannelDataPlug() );
+	}
+
+	if( input == matteChannelDataPlug() ||
+		input == mattesChannelDataPlug() ||
+		input == matteChannelsPlug() )
 	{
 		outputs.push_back( outPlug()->channelDataPlug() );
 	}
 
 	if( input == inPlug()->channelNamesPlug() ||
-		input == outputChannelPlug() )
+		input == outputChannelPlug() ||
+		input == matteChannelsPlug() )
 	{
 		outputs.push_back( outPlug()->channelNamesPlug() );
 	}
 
+	if( mattesPlug()->isAncestorOf( input ) )
+	{
+		outputs.push_back( matteChannelsPlug() );
+		outputs.push_back( matteIndexPlug() );
+	}
+
 	if( input == layerPlug() ||
 		input == manifestDirectoryPlug() ||
 		input == sidecarFilePlug() ||
@@ -540,6 +716,7 @@ void Cryptomatte::affects(const Gaffer::Plug *input, AffectedPlugsContainer &out
 
 	if( input == manifestPlug() )
 	{
+		outputs.push_back( matteIndexPlug() );
 		outputs.push_back( manifestPathDataPlug() );
 	}
 
@@ -595,7 +772,15 @@ void Cryptomatte::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *
 		ScenePlug::GlobalScope globalScope( context );
 		manifestPathDataPlug()->hash(h);
 	}
-	else if( output == matteChannelDataPlug() )
+	else if( output == matteChannelsPlug() || output == matteIndexPlug() )
+	{
+		mattesPlug()->hash( h );
+		if( output == matteIndexPlug() )
+		{
+			manifestPlug()->hash( h );
+		}
+	}
+	else if( output == matteChannelDataPlug() || output == mattesChannelDataPlug() )
 	{
 		std::string cryptomatteLayer;
 		ConstStringVectorDataPtr channelNamesData;
@@ -603,34 +788,23 @@ void Cryptomatte::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *
 			GafferImage::ImagePlug::GlobalScope globalScope( context );
 			channelNamesData = inPlug()->channelNamesPlug()->getValue();
 			cryptomatteLayer = layerPlug()->getValue();
-			matteValuesPlug()->hash( h );
+			if( output == matteChannelDataPlug() )
+			{
+				matteValuesPlug()->hash( h );
+			}
+			else
+			{
+				matteIndexPlug()->hash( h );
+			}
 		}
 
-		const std::vector<std::string> &channelNames = channelNamesData->readable();
-
-		boost::regex channelNameRegex( fmt::format( g_cryptomatteChannelPattern, cryptomatteLayer ) );
 		GafferImage::ImagePlug::ChannelDataScope channelDataScope( context );
-		for( const auto &c : channelNames )
+		for( const auto &[idChannel, alphaChannel] : rankChannels( channelNamesData->readable(), cryptomatteLayer ) )
 		{
-			if( boost::regex_match( c, channelNameRegex ) )
-			{
-				ChannelMap::const_iterator cIt = g_channelMap.find( GafferImage::ImageAlgo::baseName( c ) );
-				if( cIt == g_channelMap.end() )
-				{
-					continue;
-				}
-
-				const std::string &alphaChannel = GafferImage::ImageAlgo::channelName( GafferImage::ImageAlgo::layerName( c ), cIt->second );
-				if( !GafferImage::ImageAlgo::channelExists( channelNames, alphaChannel ) )
-				{
-					continue;
-				}
-
-				channelDataScope.setChannelName( &c );
-				inPlug()->channelDataPlug()->hash( h );
-				channelDataScope.setChannelName( &alphaChannel );
-				inPlug()->channelDataPlug()->hash( h );
-			}
+			channelDataScope.setChannelName( &idChannel );
+			inPlug()->channelDataPlug()->hash( h );
+			channelDataScope.setChannelName( &alphaChannel );
+			inPlug()->channelDataPlug()->hash( h );
 		}
 	}
 }
@@ -686,54 +860,69 @@ void Cryptomatte::compute( Gaffer::ValuePlug *output, const Gaffer::Context *con
 
 		ConstStringVectorDataPtr matteNames = matteNamesPlug()->getValue();
 		ConstCompoundDataPtr manifest = manifestPlug()->getValue();
+		insertMatteValues( matteNames->readable(), manifest.get(), matteValues );
 
-		IECore::PathMatcher pathMatcher;
-		for( const auto &name : matteNames->readable() )
-		{
-			if( name.size() > 0 && name.front() == '<' && name.back() == '>' )
-			{
-				try
-				{
-					matteValues.insert( std::stof( name.substr(1, name.size() - 2) ) );
-				}
-				catch( const std::exception & )
-				{
-					IECore::msg( IECore::Msg::Error, "Cryptomatte::matteValues", fmt::format( "Error converting value: {}", name ) );
-					continue;
-				}
-			}
-			else
-			{
-				if( manifest )
-				{
-					pathMatcher.addPath( name );
-				}
+		result.insert( result.end(), matteValues.begin(), matteValues.end() );
+		// NOTE: pre-sort values as they're later used in a binary_search
+		std::sort( result.begin(), result.end() );
 
-				if( !StringAlgo::hasWildcards( name ) || name.find( "..." ) == string::npos )
-				{
-					// Hash names without wildcards directly. This allows them to still be matched if no manifest exists or has been truncated by the renderer
-					matteValues.insert( matteNameToValue( name ) );
-				}
-			}
+		static_cast<FloatVectorDataPlug *>( output )->setValue( resultData );
+	}
+	else if( output == matteChannelsPlug() )
+	{
+		StringVectorDataPtr resultData = new StringVectorData;
+		for( const auto &matte : enabledMattes( mattesPlug() ) )
+		{
+			resultData->writable().push_back( matte.first );
 		}
 
-		if( manifest )
+		static_cast<StringVectorDataPlug *>( output )->setValue( resultData );
+	}
+	else if( output == matteIndexPlug() )
+	{
+		// Invert the per-matte ID values into a single sorted list of
+		// IDs, each mapping to the range of mattes it contributes to.
+		// This lets us extract all mattes in a single pass over the
+		// rank channels, with one lookup per pixel.
+
+		ConstCompoundDataPtr manifest = manifestPlug()->getValue();
+
+		std::map<float, std::vector<int>> valueMattes;
+		const Mattes mattes = enabledMattes( mattesPlug() );
+		for( size_t i = 0; i < mattes.size(); ++i )
 		{
-			for( const auto &manifestEntry : manifest->readable() )
+			std::unordered_set<float> matteValues;
+			ConstStringVectorDataPtr matteNames = mattes[i].second->getValue();
+			insertMatteValues( matteNames->readable(), manifest.get(), matteValues );
+			for( float v : matteValues )
 			{
-				const std::string &matteName = static_cast<IECore::StringData *>( manifestEntry.second.get() )->readable();
-				if( pathMatcher.match( matteName ) & ( IECore::PathMatcher::ExactMatch | IECore::PathMatcher::AncestorMatch ) )
-				{
-					matteValues.insert( matteNameToValue( matteName ) );
-				}
+				valueMattes[v].push_back( i );
 			}
 		}
 
-		result.insert( result.end(), matteValues.begin(), matteValues.end() );
-		// NOTE: pre-sort values as they're later used in a binary_search
-		std::sort( result.begin(), result.end() );
+		FloatVectorDataPtr valuesData = new FloatVectorData;
+		IntVectorDataPtr offsetsData = new IntVectorData;
+		IntVectorDataPtr indicesData = new IntVectorData;
+		std::vector<float> &values = valuesData->writable();
+		std::vector<int> &offsets = offsetsData->writable();
+		std::vector<int> &indices = indicesData->writable();
+
+		values.reserve( valueMattes.size() );
+		offsets.reserve( valueMattes.size() + 1 );
+		offsets.push_back( 0 );
+		for( const auto &[value, matteIndices] : valueMattes )
+		{
+			values.push_back( value );
+			indices.insert( indices.end(), matteIndices.begin(), matteIndices.end() );
+			offsets.push_back( indices.size() );
+		}
 
-		static_cast<FloatVectorDataPlug *>( output )->setValue( resultData );
+		CompoundObjectPtr result = new CompoundObject;
+		result->members()["values"] = valuesData;
+		result->members()["offsets"] = offsetsData;
+		result->members()["indices"] = indicesData;
+
+		static_cast<CompoundObjectPlug *>( output )->setValue( result );
 	}
 	else if( output == manifestPathDataPlug() )
 	{
@@ -810,28 +999,69 @@ void Cryptomatte::compute( Gaffer::ValuePlug *output, const Gaffer::Context *con
 			matteValuesData = matteValuesPlug()->getValue();
 		}
 
-		const std::vector<std::string> &channelNames = channelNamesData->readable();
 		const std::vector<float> &matteValues = matteValuesData->readable();
 
-		boost::regex channelNameRegex( fmt::format( g_cryptomatteChannelPattern, cryptomatteLayer ) );
 		GafferImage::ImagePlug::ChannelDataScope channelDataScope( context );
-		for( const auto &c : channelNames )
+		for( const auto &[idChannel, alphaChannel] : rankChannels( channelNamesData->readable(), cryptomatteLayer ) )
 		{
-			if( boost::regex_match( c, channelNameRegex ) )
+			channelDataScope.setChannelName( &idChannel );
+			ConstFloatVectorDataPtr valueData = inPlug()->channelDataPlug()->getValue();
+			const std::vector<float> &value = valueData->readable();
+
+			channelDataScope.setChannelName( &alphaChannel );
+			ConstFloatVectorDataPtr alphaData = inPlug()->channelDataPlug()->getValue();
+			const std::vector<float> &alpha = alphaData->readable();
+
+			std::vector<float>::const_iterator vIt = value.begin();
+			std::vector<float>::const_iterator aIt = alpha.begin();
+			for( std::vector<float>::iterator it = result.begin(), eIt = result.end(); it != eIt; ++it, ++vIt, ++aIt )
 			{
-				ChannelMap::const_iterator cIt = g_channelMap.find( GafferImage::ImageAlgo::baseName( c ) );
-				if( cIt == g_channelMap.end() )
+				if( std::binary_search( matteValues.begin(), matteValues.end(), *vIt ) )
 				{
-					continue;
+					*it += *aIt;
 				}
+			}
+		}
 
-				const std::string &alphaChannel = GafferImage::ImageAlgo::channelName( GafferImage::ImageAlgo::layerName( c ), cIt->second );
-				if( !GafferImage::ImageAlgo::channelExists( channelNames, alphaChannel ) )
-				{
-					continue;
-				}
+		static_cast<FloatVectorDataPlug *>( output )->setValue( resultData );
+	}
+	else if( output == mattesChannelDataPlug() )
+	{
+		ConstStringVectorDataPtr channelNamesData;
+		std::string cryptomatteLayer;
+		ConstCompoundObjectPtr matteIndex;
+		{
+			GafferImage::ImagePlug::GlobalScope c( context );
+			channelNamesData = inPlug()->channelNamesPlug()->getValue();
+			cryptomatteLayer = layerPlug()->getValue();
+			matteIndex = matteIndexPlug()->getValue();
+		}
 
-				channelDataScope.setChannelName( &c );
+		const std::vector<float> &values = matteIndex->member<FloatVectorData>( "values", /* throwExceptions = */ true )->readable();
+		const std::vector<int> &offsets = matteIndex->member<IntVectorData>( "offsets", /* throwExceptions = */ true )->readable();
+		const std::vector<int> &indices = matteIndex->member<IntVectorData>( "indices", /* throwExceptions = */ true )->readable();
+
+		size_t numMattes = 0;
+		for( int i : indices )
+		{
+			numMattes = std::max( numMattes, (size_t)i + 1 );
+		}
+
+		ObjectVectorPtr resultData = new ObjectVector;
+		std::vector<std::vector<float> *> mattes;
+		for( size_t i = 0; i < numMattes; ++i )
+		{
+			FloatVectorDataPtr matteData = new FloatVectorData( std::vector<float>( GafferImage::ImagePlug::tilePixels(), 0.0f ) );
+			mattes.push_back( &matteData->writable() );
+			resultData->members().push_back( matteData );
+		}
+
+		if( numMattes )
+		{
+			GafferImage::ImagePlug::ChannelDataScope channelDataScope( context );
+			for( const auto &[idChannel, alphaChannel] : rankChannels( channelNamesData->readable(), cryptomatteLayer ) )
+			{
+				channelDataScope.setChannelName( &idChannel );
 				ConstFloatVectorDataPtr valueData = inPlug()->channelDataPlug()->getValue();
 				const std::vector<float> &value = valueData->readable();
 
@@ -839,19 +1069,24 @@ void Cryptomatte::compute( Gaffer::ValuePlug *output, const Gaffer::Context *con
 				ConstFloatVectorDataPtr alphaData = inPlug()->channelDataPlug()->getValue();
 				const std::vector<float> &alpha = alphaData->readable();
 
-				std::vector<float>::const_iterator vIt = value.begin();
-				std::vector<float>::const_iterator aIt = alpha.begin();
-				for( std::vector<float>::iterator it = result.begin(), eIt = result.end(); it != eIt; ++it, ++vIt, ++aIt )
+				for( size_t i = 0, e = value.size(); i < e; ++i )
 				{
-					if( std::binary_search( matteValues.begin(), matteValues.end(), *vIt ) )
+					auto vIt = std::lower_bound( values.begin(), values.end(), value[i] );
+					if( vIt == values.end() || *vIt != value[i] )
 					{
-						*it += *aIt;
+						continue;
+					}
+
+					const size_t valueIndex = vIt - values.begin();
+					for( int j = offsets[valueIndex]; j < offsets[valueIndex+1]; ++j )
+					{
+						(*mattes[indices[j]])[i] += alpha[i];
 					}
 				}
 			}
 		}
 
-		static_cast<FloatVectorDataPlug *>( output )->setValue( resultData );
+		static_cast<ObjectVectorPlug *>( output )->setValue( resultData );
 	}
 }
 
@@ -859,11 +1094,19 @@ Gaffer::ValuePlug::CachePolicy Cryptomatte::computeCachePolicy( const Gaffer::Va
 {
 	if( output == matteValuesPlug() ||
 		output == manifestPlug() ||
-		output == manifestPathDataPlug() )
+		output == manifestPathDataPlug() ||
+		output == matteIndexPlug() )
 	{
 		// Request blocking compute to avoid concurrent threads computing the manifest redundantly.
 		return ValuePlug::CachePolicy::Standard;
 	}
+	else if( output == mattesChannelDataPlug() )
+	{
+		// Each tile is shared by all the channels in `mattes`, which are
+		// likely to be requested concurrently. Block so that only one
+		// thread computes it.
+		return ValuePlug::CachePolicy::Standard;
+	}
 
 	return ImageNode::computeCachePolicy( output );
 }
@@ -885,6 +1128,7 @@ void Cryptomatte::hashChannelNames( const GafferImage::ImagePlug *parent, const
 	FlatImageProcessor::hashChannelNames( parent, context, h );
 	inPlug()->channelNamesPlug()->hash( h );
 	outputChannelPlug()->hash( h );
+	matteChannelsPlug()->hash( h );
 }
 
 IECore::ConstStringVectorDataPtr Cryptomatte::computeChannelNames( const Gaffer::Context *context, const GafferImage::ImagePlug *parent ) const
@@ -906,6 +1150,15 @@ IECore::ConstStringVectorDataPtr Cryptomatte::computeChannelNames( const Gaffer:
 		result.push_back( alphaChannel );
 	}
 
+	ConstStringVectorDataPtr matteChannelsData = matteChannelsPlug()->getValue();
+	for( const auto &matteChannel : matteChannelsData->readable() )
+	{
+		if( find( result.begin(), result.end(), matteChannel ) == result.end() )
+		{
+			result.push_back( matteChannel );
+		}
+	}
+
 	return resultData;
 }
 
@@ -915,9 +1168,27 @@ void Cryptomatte::hashChannelData( const GafferImage::ImagePlug *output, const G
 	const Imath::V2i &tileOrigin = context->get<Imath::V2i>( GafferImage::ImagePlug::tileOriginContextName );
 
 	std::string alphaChannel;
+	ConstStringVectorDataPtr matteChannelsData;
 	{
 		GafferImage::ImagePlug::GlobalScope globalScope( context );
 		alphaChannel = outputChannelPlug()->getValue();
+		matteChannelsData = matteChannelsPlug()->getValue();
+	}
+
+	const std::vector<std::string> &matteChannels = matteChannelsData->readable();
+	auto matteIt = find( matteChannels.begin(), matteChannels.end(), channelName );
+	if( matteIt != matteChannels.end() )
+	{
+		FlatImageProcessor::hashChannelData( output, context, h );
+		{
+			// All channels share the same `mattesChannelData`, so remove
+			// the channel name to avoid redundant hashing.
+			Context::EditableScope tileScope( context );
+			tileScope.remove( GafferImage::ImagePlug::channelNameContextName );
+			mattesChannelDataPlug()->hash( h );
+		}
+		h.append( (uint64_t)( matteIt - matteChannels.begin() ) );
+		return;
 	}
 
 	if( channelName != "R" && channelName != "G" && channelName != "B" && channelName != alphaChannel )
@@ -982,9 +1253,31 @@ void Cryptomatte::hashChannelData( const GafferImage::ImagePlug *output, const G
 IECore::ConstFloatVectorDataPtr Cryptomatte::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const GafferImage::ImagePlug *parent ) const
 {
 	std::string alphaChannel;
+	ConstStringVectorDataPtr matteChannelsData;
 	{
 		GafferImage::ImagePlug::GlobalScope globalScope( context );
 		alphaChannel = outputChannelPlug()->getValue();
+		matteChannelsData = matteChannelsPlug()->getValue();
+	}
+
+	const std::vector<std::string> &matteChannels = matteChannelsData->readable();
+	auto matteIt = find( matteChannels.begin(), matteChannels.end(), channelName );
+	if( matteIt != matteChannels.end() )
+	{
+		ConstObjectVectorPtr mattesData;
+		{
+			Context::EditableScope tileScope( context );
+			tileScope.remove( GafferImage::ImagePlug::channelNameContextName );
+			mattesData = mattesChannelDataPlug()->getValue();
+		}
+
+		const size_t matteIndex = matteIt - matteChannels.begin();
+		if( matteIndex < mattesData->members().size() )
+		{
+			return static_cast<const FloatVectorData *>( mattesData->members()[matteIndex].get() );
+		}
+		// No IDs matched this matte.
+		return GafferImage::ImagePlug::blackTile();
 	}
 
 	if( channelName != "R" && channelName != "G" && channelName != "B" && channelName != alphaChannel )
@@ -164,40 +164,64 @@ class GafferDisplayDriver : public IECoreImage::DisplayDriver
 		{
 			Box2i gafferBox = m_gafferFormat.fromEXRSpace( box );
 
+			const int numChannels = channelNames().size();
+			const size_t srcRowStride = ( box.size().x + 1 ) * numChannels;
+			std::vector<Tile *> tiles( numChannels );
+
 			const V2i boxMinTileOrigin = GafferImage::ImagePlug::tileOrigin( gafferBox.min );
 			const V2i boxMaxTileOrigin = GafferImage::ImagePlug::tileOrigin( gafferBox.max - Imath::V2i( 1 ) );
 			for( int tileOriginY = boxMinTileOrigin.y; tileOriginY <= boxMaxTileOrigin.y; tileOriginY += GafferImage::ImagePlug::tileSize() )
 			{
 				for( int tileOriginX = boxMinTileOrigin.x; tileOriginX <= boxMaxTileOrigin.x; tileOriginX += GafferImage::ImagePlug::tileSize() )
 				{
-					for( int channelIndex = 0, numChannels = channelNames().size(); channelIndex < numChannels; ++channelIndex )
+					const V2i tileOrigin( tileOriginX, tileOriginY );
+					bool outsideDataWindow = false;
+					for( int channelIndex = 0; channelIndex < numChannels; ++channelIndex )
 					{
-						const V2i tileOrigin( tileOriginX, tileOriginY );
-						Tile * tile = getTile( tileOrigin, channelIndex );
-						if( !tile )
+						tiles[channelIndex] = getTile( tileOrigin, channelIndex );
+						if( !tiles[channelIndex] )
 						{
-							// we've been sent data outside of the data window
-							continue;
+							outsideDataWindow = true;
+							break;
 						}
+					}
 
-						vector<float> &buffer = tile->backBuffer;
-						const Box2i tileBound( tileOrigin, tileOrigin + Imath::V2i( GafferImage::ImagePlug::tileSize() ) );
-						const Box2i transferBound = IECore::boxIntersection( tileBound, gafferBox );
+					if( outsideDataWindow )
+					{
+						// we've been sent data outside of the data window
+						continue;
+					}
+
+					const Box2i tileBound( tileOrigin, tileOrigin + Imath::V2i( GafferImage::ImagePlug::tileSize() ) );
+					const Box2i transferBound = IECore::boxIntersection( tileBound, gafferBox );
+					const int width = transferBound.size().x;
 
-						for( int y = transferBound.min.y; y<transferBound.max.y; ++y )
+					// The data is interleaved, so we visit each source row once, distributing
+					// the values to all channels as we go. This is considerably faster than
+					// making a separate strided pass over the row for each channel when
+					// there are many AOVs.
+					for( int y = transferBound.min.y; y<transferBound.max.y; ++y )
+					{
+						int srcY = m_gafferFormat.toEXRSpace( y );
+						const float *src = data + ( srcY - box.min.y ) * srcRowStride + ( transferBound.min.x - box.min.x ) * numChannels;
+						const size_t dstIndex = ( y - tileBound.min.y ) * GafferImage::ImagePlug::tileSize() + transferBound.min.x - tileBound.min.x;
+						if( numChannels == 1 )
 						{
-							int srcY = m_gafferFormat.toEXRSpace( y );
-							size_t srcIndex = ( ( srcY - box.min.y ) * ( box.size().x + 1 ) + ( transferBound.min.x - box.min.x ) ) * numChannels + channelIndex;
-							size_t dstIndex = ( y - tileBound.min.y ) * GafferImage::ImagePlug::tileSize() + transferBound.min.x - tileBound.min.x;
-							const size_t srcEndIndex = srcIndex + transferBound.size().x * numChannels;
-							while( srcIndex < srcEndIndex )
+							memcpy( &tiles[0]->backBuffer[dstIndex], src, width * sizeof( float ) );
+							continue;
+						}
+
+						for( int x = 0; x < width; ++x )
+						{
+							for( int channelIndex = 0; channelIndex < numChannels; ++channelIndex )
 							{
-								buffer[dstIndex] = data[srcIndex];
-								srcIndex += numChannels;
-								dstIndex++;
+								tiles[channelIndex]->backBuffer[dstIndex + x] = *src++;
 							}
 						}
+					}
 
+					for( auto tile : tiles )
+					{
 						tile->dirty = true;
 					}
 				}
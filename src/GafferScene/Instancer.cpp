@@ -62,12 +62,15 @@
 
 #include "tbb/blocked_range.h"
 #include "tbb/parallel_for.h"
+#include "tbb/parallel_for_each.h"
 #include "tbb/parallel_reduce.h"
 #include "tbb/spin_mutex.h"
 
 #include "fmt/format.h"
 
 #include <functional>
+#include <map>
+#include <tuple>
 #include <unordered_map>
 
 using namespace std;
@@ -410,6 +413,7 @@ class Instancer::EngineData : public Data
 			const std::string &inactiveIds,
 			const std::string &attributes,
 			const std::string &attributePrefix,
+			float chunkSize,
 			const std::vector< PrototypeContextVariable > &prototypeContextVariables
 		)
 			:	m_primitive( primitive ),
@@ -420,6 +424,7 @@ class Instancer::EngineData : public Data
 				m_orientations( nullptr ),
 				m_scales( nullptr ),
 				m_uniformScales( nullptr ),
+				m_chunkSize( chunkSize ),
 				m_prototypeContextVariables( prototypeContextVariables )
 		{
 			if( !m_primitive )
@@ -657,6 +662,96 @@ class Instancer::EngineData : public Data
 			return pointIndex( boost::lexical_cast<size_t>( name ) );
 		}
 
+		// Returns the sorted names of the instances for the specified point indices.
+		InternedStringVectorDataPtr instanceNames( const std::vector<size_t> &pointIndices ) const
+		{
+			// The names we output use the ids, not the point indices, and must be sorted.
+			// So we need to allocate a temp buffer of integer ids, before converting to strings.
+			std::vector<int64_t> ids;
+			ids.reserve( pointIndices.size() );
+			for( size_t q : pointIndices )
+			{
+				ids.push_back( instanceId( q ) );
+			}
+
+			// Sort ids before converting to string ( they have already been uniquified but not sorted by
+			// the EngineData which uses a hash table )
+			std::sort( ids.begin(), ids.end() );
+
+			InternedStringVectorDataPtr namesData = new InternedStringVectorData;
+			std::vector<InternedString> &names = namesData->writable();
+			names.reserve( ids.size() );
+			for( int64_t id : ids )
+			{
+				names.emplace_back( id );
+			}
+
+			return namesData;
+		}
+
+		float chunkSize() const
+		{
+			return m_chunkSize;
+		}
+
+		// When chunking, instances are grouped into an extra level of hierarchy, so
+		// they are found at `<name>/<prototypeName>/<chunkName>/<id>` rather than
+		// `<name>/<prototypeName>/<id>`.
+		size_t instanceDepth() const
+		{
+			return m_chunkSize > 0.0f ? 4 : 3;
+		}
+
+		// Returns the grid cell containing the point. Cells are anchored at the origin
+		// so that they remain stable as points move.
+		V3i chunk( size_t pointIndex ) const
+		{
+			if( !m_positions )
+			{
+				return V3i( 0 );
+			}
+
+			const V3f &p = (*m_positions)[pointIndex];
+			return V3i(
+				(int)std::floor( p.x / m_chunkSize ),
+				(int)std::floor( p.y / m_chunkSize ),
+				(int)std::floor( p.z / m_chunkSize )
+			);
+		}
+
+		// Returns the union of the bounds of the specified instances.
+		Box3f instancesBound( const std::vector<size_t> &pointIndices, const M44f &childTransform, const Box3f &childBound ) const
+		{
+			// TODO - might be worth using a looser approximation - expand point cloud bound by largest diagonal of
+			// prototype bound x largest scale. Especially since this isn't fully accurate anyway: we are getting a
+			// single bound for the prototype with no context variables set, which may have nothing to do with actual
+			// prototype we get once the context variables are set.
+			task_group_context taskGroupContext( task_group_context::isolated );
+			return parallel_reduce(
+				tbb::blocked_range<size_t>( 0, pointIndices.size() ),
+				Box3f(),
+				[ this, &pointIndices, &childBound, &childTransform ] ( const tbb::blocked_range<size_t> &r, Box3f u ) {
+					for( size_t i = r.begin(); i != r.end(); ++i )
+					{
+						const size_t pointIndex = pointIndices[i];
+						const M44f m = childTransform * instanceTransform( pointIndex );
+						const Box3f b = transform( childBound, m );
+						u.extendBy( b );
+					}
+					return u;
+				},
+				// Union
+				[] ( const Box3f &b0, const Box3f &b1 ) {
+					Box3f u( b0 );
+					u.extendBy( b1 );
+					return u;
+				},
+				tbb::auto_partitioner(),
+				// Prevents outer tasks silently cancelling our tasks
+				taskGroupContext
+			);
+		}
+
 		size_t numValidPrototypes() const
 		{
 			return m_numValidPrototypes;
@@ -1146,6 +1241,7 @@ class Instancer::EngineData : public Data
 		const std::vector<Imath::Quatf> *m_orientations;
 		const std::vector<Imath::V3f> *m_scales;
 		const std::vector<float> *m_uniformScales;
+		const float m_chunkSize;
 
 		using IdsToPointIndices = std::unordered_map <int64_t, size_t>;
 		IdsToPointIndices m_idsToPointIndices;
@@ -1185,7 +1281,16 @@ class Instancer::EngineSplitPrototypesData : public Data
 				if( constantPrototypeIndex == -1 )
 				{
 					// If we have no indices to specify other prototypes, and the first prototype is
-					// invalid, we're not going to output anything, and can early exit
+					// invalid, we're not going to output anything, and can early exit. We still
+					// register an empty list for each prototype, so that they can be queried.
+					for( const auto &name : m_engineData->m_names->outputChildNames()->readable() )
+					{
+						m_pointIndicesForPrototype[name];
+						if( m_engineData->chunkSize() > 0.0f )
+						{
+							initChunks( m_pointIndicesForPrototype[name], m_chunksForPrototype[name] );
+						}
+					}
 					return;
 				}
 			}
@@ -1241,6 +1346,25 @@ class Instancer::EngineSplitPrototypesData : public Data
 
 				m_pointIndicesForPrototype.emplace( IECore::InternedString( outputChildNames[prototypeIndex] ), std::move( pointIndicesForPrototypeIndex[prototypeIndex] ) );
 			}
+
+			if( m_engineData->chunkSize() > 0.0f )
+			{
+				// Group the instances of each prototype into chunks. Each prototype is processed
+				// independently, so we can do this in parallel.
+				for( const auto &p : m_pointIndicesForPrototype )
+				{
+					m_chunksForPrototype[p.first];
+				}
+
+				task_group_context taskGroupContext( task_group_context::isolated );
+				tbb::parallel_for_each(
+					m_chunksForPrototype.begin(), m_chunksForPrototype.end(),
+					[this] ( std::pair<const InternedString, Chunks> &prototypeChunks ) {
+						initChunks( m_pointIndicesForPrototype.at( prototypeChunks.first ), prototypeChunks.second );
+					},
+					taskGroupContext
+				);
+			}
 		}
 
 		const EngineData *engine() const
@@ -1253,11 +1377,67 @@ class Instancer::EngineSplitPrototypesData : public Data
 			return m_pointIndicesForPrototype.at( prototypeName );
 		}
 
+		const InternedStringVectorData *chunkNames( const IECore::InternedString &prototypeName ) const
+		{
+			return m_chunksForPrototype.at( prototypeName ).names.get();
+		}
+
+		const std::vector<size_t> & pointIndicesForChunk( const IECore::InternedString &prototypeName, const IECore::InternedString &chunkName ) const
+		{
+			const Chunks &chunks = m_chunksForPrototype.at( prototypeName );
+			auto it = chunks.pointIndices.find( chunkName );
+			if( it == chunks.pointIndices.end() )
+			{
+				throw IECore::Exception( fmt::format( "Chunk \"{}\" is invalid. Topology may have changed during shutter.", chunkName.string() ) );
+			}
+			return it->second;
+		}
+
 
 	protected :
 
+		struct Chunks
+		{
+			InternedStringVectorDataPtr names;
+			std::unordered_map< InternedString, std::vector<size_t> > pointIndices;
+		};
+
+		void initChunks( const std::vector<size_t> &pointIndices, Chunks &chunks ) const
+		{
+			// Using an ordered map gives us a deterministic order for the chunk names.
+			std::map< std::tuple<int, int, int>, std::vector<size_t> > cells;
+			for( size_t pointIndex : pointIndices )
+			{
+				const V3i c = m_engineData->chunk( pointIndex );
+				cells[ std::make_tuple( c.x, c.y, c.z ) ].push_back( pointIndex );
+			}
+
+			chunks.names = new InternedStringVectorData;
+			std::vector<InternedString> &names = chunks.names->writable();
+			names.reserve( cells.size() );
+			for( auto &cell : cells )
+			{
+				// Negative coordinates are prefixed with "n" rather than "-", so that
+				// the names can be used in set expressions.
+				const InternedString name = fmt::format(
+					"chunk_{}_{}_{}",
+					chunkCoordinate( std::get<0>( cell.first ) ),
+					chunkCoordinate( std::get<1>( cell.first ) ),
+					chunkCoordinate( std::get<2>( cell.first ) )
+				);
+				names.push_back( name );
+				chunks.pointIndices.emplace( name, std::move( cell.second ) );
+			}
+		}
+
+		static std::string chunkCoordinate( int c )
+		{
+			return c < 0 ? "n" + std::to_string( -(int64_t)c ) : std::to_string( c );
+		}
+
 		ConstEngineDataPtr m_engineData;
 		std::unordered_map< InternedString, std::vector<size_t> > m_pointIndicesForPrototype;
+		std::unordered_map< InternedString, Chunks > m_chunksForPrototype;
 };
 
 
@@ -1430,6 +1610,7 @@ Instancer::Instancer( const std::string &name )
 	addChild( new StringPlug( "attributes", Plug::In ) );
 	addChild( new StringPlug( "attributePrefix", Plug::In ) );
 	addChild( new BoolPlug( "encapsulate", Plug::In ) );
+	addChild( new FloatPlug( "chunkSize", Plug::In, 0.0f, 0.0f ) );
 	addChild( new BoolPlug( "seedEnabled", Plug::In ) );
 	addChild( new StringPlug( "seedVariable", Plug::In, "seed" ) );
 	addChild( new IntPlug( "seeds", Plug::In, 10, 1 ) );
@@ -1614,144 +1795,154 @@ const Gaffer::BoolPlug *Instancer::encapsulatePlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 14 );
 }
 
+Gaffer::FloatPlug *Instancer::chunkSizePlug()
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 15 );
+}
+
+const Gaffer::FloatPlug *Instancer::chunkSizePlug() const
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 15 );
+}
+
 Gaffer::BoolPlug *Instancer::seedEnabledPlug()
 {
-	return getChild<BoolPlug>( g_firstPlugIndex + 15 );
+	return getChild<BoolPlug>( g_firstPlugIndex + 16 );
 }
 
 const Gaffer::BoolPlug *Instancer::seedEnabledPlug() const
 {
-	return getChild<BoolPlug>( g_firstPlugIndex + 15 );
+	return getChild<BoolPlug>( g_firstPlugIndex + 16 );
 }
 
 Gaffer::StringPlug *Instancer::seedVariablePlug()
 {
-	return getChild<StringPlug>( g_firstPlugIndex + 16 );
+	return getChild<StringPlug>( g_firstPlugIndex + 17 );
 }
 
 const Gaffer::StringPlug *Instancer::seedVariablePlug() const
 {
-	return getChild<StringPlug>( g_firstPlugIndex + 16 );
+	return getChild<StringPlug>( g_firstPlugIndex + 17 );
 }
 
 Gaffer::IntPlug *Instancer::seedsPlug()
 {
-	return getChild<IntPlug>( g_firstPlugIndex + 17 );
+	return getChild<IntPlug>( g_firstPlugIndex + 18 );
 }
 
 const Gaffer::IntPlug *Instancer::seedsPlug() const
 {
-	return getChild<IntPlug>( g_firstPlugIndex + 17 );
+	return getChild<IntPlug>( g_firstPlugIndex + 18 );
 }
 
 Gaffer::IntPlug *Instancer::seedPermutationPlug()
 {
-	return getChild<IntPlug>( g_firstPlugIndex + 18 );
+	return getChild<IntPlug>( g_firstPlugIndex + 19 );
 }
 
 const Gaffer::IntPlug *Instancer::seedPermutationPlug() const
 {
-	return getChild<IntPlug>( g_firstPlugIndex + 18 );
+	return getChild<IntPlug>( g_firstPlugIndex + 19 );
 }
 
 Gaffer::BoolPlug *Instancer::rawSeedPlug()
 {
-	return getChild<BoolPlug>( g_firstPlugIndex + 19 );
+	return getChild<BoolPlug>( g_firstPlugIndex + 20 );
 }
 
 const Gaffer::BoolPlug *Instancer::rawSeedPlug() const
 {
-	return getChild<BoolPlug>( g_firstPlugIndex + 19 );
+	return getChild<BoolPlug>( g_firstPlugIndex + 20 );
 }
 
 Gaffer::ValuePlug *Instancer::contextVariablesPlug()
 {
-	return getChild<ValuePlug>( g_firstPlugIndex + 20 );
+	return getChild<ValuePlug>( g_firstPlugIndex + 21 );
 }
 
 const Gaffer::ValuePlug *Instancer::contextVariablesPlug() const
 {
-	return getChild<ValuePlug>( g_firstPlugIndex + 20 );
+	return getChild<ValuePlug>( g_firstPlugIndex + 21 );
 }
 
 GafferScene::Instancer::ContextVariablePlug *Instancer::timeOffsetPlug()
 {
-	return getChild<ContextVariablePlug>( g_firstPlugIndex + 21 );
+	return getChild<ContextVariablePlug>( g_firstPlugIndex + 22 );
 }
 
 const GafferScene::Instancer::ContextVariablePlug *Instancer::timeOffsetPlug() const
 {
-	return getChild<ContextVariablePlug>( g_firstPlugIndex + 21 );
+	return getChild<ContextVariablePlug>( g_firstPlugIndex + 22 );
 }
 
 Gaffer::AtomicCompoundDataPlug *Instancer::variationsPlug()
 {
-	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 22 );
+	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 23 );
 }
 
 const Gaffer::AtomicCompoundDataPlug *Instancer::variationsPlug() const
 {
-	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 22 );
+	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 23 );
 }
 
 Gaffer::ObjectPlug *Instancer::enginePlug()
 {
-	return getChild<ObjectPlug>( g_firstPlugIndex + 23 );
+	return getChild<ObjectPlug>( g_firstPlugIndex + 24 );
 }
 
 const Gaffer::ObjectPlug *Instancer::enginePlug() const
 {
-	return getChild<ObjectPlug>( g_firstPlugIndex + 23 );
+	return getChild<ObjectPlug>( g_firstPlugIndex + 24 );
 }
 
 Gaffer::ObjectPlug *Instancer::engineSplitPrototypesPlug()
 {
-	return getChild<ObjectPlug>( g_firstPlugIndex + 24 );
+	return getChild<ObjectPlug>( g_firstPlugIndex + 25 );
 }
 
 const Gaffer::ObjectPlug *Instancer::engineSplitPrototypesPlug() const
 {
-	return getChild<ObjectPlug>( g_firstPlugIndex + 24 );
+	return getChild<ObjectPlug>( g_firstPlugIndex + 25 );
 }
 
 GafferScene::ScenePlug *Instancer::capsuleScenePlug()
 {
-	return getChild<ScenePlug>( g_firstPlugIndex + 25 );
+	return getChild<ScenePlug>( g_firstPlugIndex + 26 );
 }
 
 const GafferScene::ScenePlug *Instancer::capsuleScenePlug() const
 {
-	return getChild<ScenePlug>( g_firstPlugIndex + 25 );
+	return getChild<ScenePlug>( g_firstPlugIndex + 26 );
 }
 
 Gaffer::PathMatcherDataPlug *Instancer::setCollaboratePlug()
 {
-	return getChild<PathMatcherDataPlug>( g_firstPlugIndex + 26 );
+	return getChild<PathMatcherDataPlug>( g_firstPlugIndex + 27 );
 }
 
 const Gaffer::PathMatcherDataPlug *Instancer::setCollaboratePlug() const
 {
-	return getChild<PathMatcherDataPlug>( g_firstPlugIndex + 26 );
+	return getChild<PathMatcherDataPlug>( g_firstPlugIndex + 27 );
 }
 
 Gaffer::Int64VectorDataPlug *Instancer::capsuleComputedHashPlug()
 {
-	return getChild<Int64VectorDataPlug>( g_firstPlugIndex + 27 );
+	return getChild<Int64VectorDataPlug>( g_firstPlugIndex + 28 );
 }
 
 const Gaffer::Int64VectorDataPlug *Instancer::capsuleComputedHashPlug() const
 {
-	return getChild<Int64VectorDataPlug>( g_firstPlugIndex + 27 );
+	return getChild<Int64VectorDataPlug>( g_firstPlugIndex + 28 );
 }
 
 Gaffer::IntPlug *Instancer::nodeIdPlug()
 {
-	return getChild<IntPlug>( g_firstPlugIndex + 28 );
+	return getChild<IntPlug>( g_firstPlugIndex + 29 );
 }
 
 const Gaffer::IntPlug *Instancer::nodeIdPlug() const
 {
-	return getChild<IntPlug>( g_firstPlugIndex + 28 );
+	return getChild<IntPlug>( g_firstPlugIndex + 29 );
 }
 
 void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
@@ -1774,6 +1965,7 @@ void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) co
 		input == inactiveIdsPlug() ||
 		input == attributesPlug() ||
 		input == attributePrefixPlug() ||
+		input == chunkSizePlug() ||
 		input == seedEnabledPlug() ||
 		input == seedVariablePlug() ||
 		input == seedsPlug() ||
@@ -1888,6 +2080,7 @@ void Instancer::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *co
 		attributesPlug()->hash( h );
 		attributePrefixPlug()->hash( h );
 		encapsulatePlug()->hash( h );
+		chunkSizePlug()->hash( h );
 
 		seedEnabledPlug()->hash( h );
 		seedVariablePlug()->hash( h );
@@ -1960,6 +2153,9 @@ void Instancer::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *co
 			return;
 		}
 
+		// Chunking doesn't affect the instance hashes below, but it does affect the paths in the set.
+		h.append( engine->chunkSize() );
+
 		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
 
 		for( const auto &prototypeName : engine->prototypeNames()->readable() )
@@ -2135,6 +2331,7 @@ void Instancer::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 				inactiveIdsPlug()->getValue(),
 				attributesPlug()->getValue(),
 				attributePrefixPlug()->getValue(),
+				chunkSizePlug()->getValue(),
 				prototypeContextVariables
 			)
 		);
@@ -2226,44 +2423,61 @@ void Instancer::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 		PathMatcherDataPtr outputSetData = new PathMatcherData;
 		PathMatcher &outputSet = outputSetData->writable();
 
-		vector<InternedString> branchPath( { namePlug()->getValue() } );
+		vector<InternedString> branchPath( engine->instanceDepth() );
+		branchPath[0] = namePlug()->getValue();
 
 		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
 
 		for( const auto &prototypeName : engine->prototypeNames()->readable() )
 		{
-			branchPath.resize( 2 );
-			branchPath.back() = prototypeName;
+			branchPath[1] = prototypeName;
 			ScenePlug::ScenePath prototypeRootStorage;
 			const ScenePlug::ScenePath *prototypeRoot = engine->prototypeRoot( prototypeName, sourcePath, prototypeRootStorage );
 
-			const std::vector<size_t> &pointIndicesForPrototype = esp->pointIndicesForPrototype( prototypeName );
-
 			tbb::spin_mutex instanceMutex;
-			branchPath.emplace_back( InternedString() );
 			const ThreadState &threadState = ThreadState::current();
-			tbb::parallel_for( tbb::blocked_range<size_t>( 0, pointIndicesForPrototype.size() ), [&]( const tbb::blocked_range<size_t> &r )
-				{
-					Context::EditableScope scope( threadState );
-					// As part of the setCollaborate plug machinery, we put the sourcePath in the context.
-					// Need to remove it before evaluating the prototype sets
-					scope.remove( ScenePlug::scenePathContextName );
-
-					for( size_t i = r.begin(); i != r.end(); ++i )
+			auto addInstances = [&] ( const std::vector<size_t> &pointIndices ) {
+				tbb::parallel_for( tbb::blocked_range<size_t>( 0, pointIndices.size() ), [&]( const tbb::blocked_range<size_t> &r )
 					{
-						const size_t pointIndex = pointIndicesForPrototype[i];
-						int64_t instanceId = engine->instanceId( pointIndex );
-						engine->setPrototypeContextVariables( pointIndex, scope );
-						ConstPathMatcherDataPtr instanceSet = prototypesPlug()->setPlug()->getValue();
-						PathMatcher pointInstanceSet = instanceSet->readable().subTree( *prototypeRoot );
+						Context::EditableScope scope( threadState );
+						// As part of the setCollaborate plug machinery, we put the sourcePath in the context.
+						// Need to remove it before evaluating the prototype sets
+						scope.remove( ScenePlug::scenePathContextName );
 
-						tbb::spin_mutex::scoped_lock lock( instanceMutex );
-						branchPath.back() = instanceId;
-						outputSet.addPaths( pointInstanceSet, branchPath );
-					}
-				},
-				taskGroupContext
-			);
+						for( size_t i = r.begin(); i != r.end(); ++i )
+						{
+							const size_t pointIndex = pointIndices[i];
+							int64_t instanceId = engine->instanceId( pointIndex );
+							engine->setPrototypeContextVariables( pointIndex, scope );
+							ConstPathMatcherDataPtr instanceSet = prototypesPlug()->setPlug()->getValue();
+							PathMatcher pointInstanceSet = instanceSet->readable().subTree( *prototypeRoot );
+							if( pointInstanceSet.isEmpty() )
+							{
+								// Avoid contention on the lock for instances that don't contribute.
+								continue;
+							}
+
+							tbb::spin_mutex::scoped_lock lock( instanceMutex );
+							branchPath.back() = instanceId;
+							outputSet.addPaths( pointInstanceSet, branchPath );
+						}
+					},
+					taskGroupContext
+				);
+			};
+
+			if( engine->instanceDepth() > 3 )
+			{
+				for( const auto &chunkName : esp->chunkNames( prototypeName )->readable() )
+				{
+					branchPath[2] = chunkName;
+					addInstances( esp->pointIndicesForChunk( prototypeName, chunkName ) );
+				}
+			}
+			else
+			{
+				addInstances( esp->pointIndicesForPrototype( prototypeName ) );
+			}
 		}
 
 		static_cast<PathMatcherDataPlug *>( output )->setValue( outputSetData );
@@ -2418,6 +2632,7 @@ bool Instancer::affectsBranchBound( const Gaffer::Plug *input ) const
 	return
 		input == engineSplitPrototypesPlug() ||
 		input == namePlug() ||
+		input == chunkSizePlug() ||
 		input == prototypesPlug()->boundPlug() ||
 		input == prototypesPlug()->transformPlug() ||
 		input == outPlug()->childBoundsPlug()
@@ -2431,13 +2646,13 @@ void Instancer::hashBranchBound( const ScenePath &sourcePath, const ScenePath &b
 		// "/" or "/instances"
 		h = outPlug()->childBoundsPlug()->hash();
 	}
-	else if( branchPath.size() == 2 )
+	else if( branchPath.size() < instanceDepth( sourcePath, context ) )
 	{
-		// "/instances/<prototypeName>"
+		// "/instances/<prototypeName>" or "/instances/<prototypeName>/<chunkName>"
 		BranchCreator::hashBranchBound( sourcePath, branchPath, context, h );
 
 		engineHash( sourcePath, context, h );
-		h.append( branchPath.back() );
+		h.append( branchPath.data() + 1, branchPath.size() - 1 );
 
 		{
 			PrototypeScope scope( enginePlug(), context, &sourcePath, &branchPath );
@@ -2461,9 +2676,9 @@ Imath::Box3f Instancer::computeBranchBound( const ScenePath &sourcePath, const S
 		// "/" or "/instances"
 		return outPlug()->childBoundsPlug()->getValue();
 	}
-	else if( branchPath.size() == 2 )
+	else if( branchPath.size() < instanceDepth( sourcePath, context ) )
 	{
-		// "/instances/<prototypeName>"
+		// "/instances/<prototypeName>" or "/instances/<prototypeName>/<chunkName>"
 		//
 		// We need to return the union of all the transformed children, but
 		// because we have direct access to the engine, we can implement this
@@ -2480,36 +2695,12 @@ Imath::Box3f Instancer::computeBranchBound( const ScenePath &sourcePath, const S
 			childBound = prototypesPlug()->boundPlug()->getValue();
 		}
 
-		const std::vector<size_t> &pointIndicesForPrototype = esp->pointIndicesForPrototype( branchPath.back() );
+		const std::vector<size_t> &pointIndices = branchPath.size() == 2 ?
+			esp->pointIndicesForPrototype( branchPath[1] ) :
+			esp->pointIndicesForChunk( branchPath[1], branchPath[2] )
+		;
 
-		// TODO - might be worth using a looser approximation - expand point cloud bound by largest diagonal of
-		// prototype bound x largest scale. Especially since this isn't fully accurate anyway: we are getting a
-		// single bound for the prototype with no context variables set, which may have nothing to do with actual
-		// prototype we get once the context variables are set.
-		task_group_context taskGroupContext( task_group_context::isolated );
-		return parallel_reduce(
-			tbb::blocked_range<size_t>( 0, pointIndicesForPrototype.size() ),
-			Box3f(),
-			[ pointIndicesForPrototype, &e, &childBound, &childTransform ] ( const tbb::blocked_range<size_t> &r, Box3f u ) {
-				for( size_t i = r.begin(); i != r.end(); ++i )
-				{
-					const size_t pointIndex = pointIndicesForPrototype[i];
-					const M44f m = childTransform * e->instanceTransform( pointIndex );
-					const Box3f b = transform( childBound, m );
-					u.extendBy( b );
-				}
-				return u;
-			},
-			// Union
-			[] ( const Box3f &b0, const Box3f &b1 ) {
-				Box3f u( b0 );
-				u.extendBy( b1 );
-				return u;
-			},
-			tbb::auto_partitioner(),
-			// Prevents outer tasks silently cancelling our tasks
-			taskGroupContext
-		);
+		return e->instancesBound( pointIndices, childTransform, childBound );
 	}
 	else
 	{
@@ -2523,18 +2714,20 @@ bool Instancer::affectsBranchTransform( const Gaffer::Plug *input ) const
 {
 	return
 		input == enginePlug() ||
+		input == chunkSizePlug() ||
 		input == prototypesPlug()->transformPlug()
 	;
 }
 
 void Instancer::hashBranchTransform( const ScenePath &sourcePath, const ScenePath &branchPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	if( branchPath.size() <= 2 )
+	const size_t instanceDepth = this->instanceDepth( sourcePath, context );
+	if( branchPath.size() < instanceDepth )
 	{
-		// "/" or "/instances" or "/instances/<prototypeName>"
+		// "/" or "/instances" or "/instances/<prototypeName>" or "/instances/<prototypeName>/<chunkName>"
 		BranchCreator::hashBranchTransform( sourcePath, branchPath, context, h );
 	}
-	else if( branchPath.size() == 3 )
+	else if( branchPath.size() == instanceDepth )
 	{
 		// "/instances/<prototypeName>/<id>"
 		BranchCreator::hashBranchTransform( sourcePath, branchPath, context, h );
@@ -2543,7 +2736,7 @@ void Instancer::hashBranchTransform( const ScenePath &sourcePath, const ScenePat
 			prototypesPlug()->transformPlug()->hash( h );
 		}
 		engineHash( sourcePath, context, h );
-		h.append( branchPath[2] );
+		h.append( branchPath.back() );
 	}
 	else
 	{
@@ -2555,28 +2748,35 @@ void Instancer::hashBranchTransform( const ScenePath &sourcePath, const ScenePat
 
 Imath::M44f Instancer::computeBranchTransform( const ScenePath &sourcePath, const ScenePath &branchPath, const Gaffer::Context *context ) const
 {
-	if( branchPath.size() <= 2 )
+	if( branchPath.size() < 3 )
 	{
 		// "/" or "/instances" or "/instances/<prototypeName>"
 		return M44f();
 	}
-	else if( branchPath.size() == 3 )
+
+	ConstEngineDataPtr e = engine( sourcePath, context );
+	const size_t instanceDepth = e->instanceDepth();
+	if( branchPath.size() < instanceDepth )
+	{
+		// "/instances/<prototypeName>/<chunkName>"
+		return M44f();
+	}
+	else if( branchPath.size() == instanceDepth )
 	{
 		// "/instances/<prototypeName>/<id>"
 		M44f result;
-		ConstEngineDataPtr e = engine( sourcePath, context );
 		{
 			PrototypeScope scope( e.get(), context, &sourcePath, &branchPath );
 			result = prototypesPlug()->transformPlug()->getValue();
 		}
-		const size_t pointIndex = e->pointIndex( branchPath[2] );
+		const size_t pointIndex = e->pointIndex( branchPath.back() );
 		result = result * e->instanceTransform( pointIndex );
 		return result;
 	}
 	else
 	{
 		// "/instances/<prototypeName>/<id>/..."
-		PrototypeScope scope( enginePlug(), context, &sourcePath, &branchPath );
+		PrototypeScope scope( e.get(), context, &sourcePath, &branchPath );
 		return prototypesPlug()->transformPlug()->getValue();
 	}
 }
@@ -2585,25 +2785,34 @@ bool Instancer::affectsBranchAttributes( const Gaffer::Plug *input ) const
 {
 	return
 		input == prototypesPlug()->attributesPlug() ||
+		input == chunkSizePlug() ||
 		input == enginePlug()
 	;
 }
 
 void Instancer::hashBranchAttributes( const ScenePath &sourcePath, const ScenePath &branchPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	if( branchPath.size() <= 2 )
+	if( branchPath.size() < 3 )
 	{
 		// "/" or "/instances" or "/instances/<prototypeName>"
 		h = outPlug()->attributesPlug()->defaultValue()->Object::hash();
+		return;
 	}
-	else if( branchPath.size() == 3 )
+
+	ConstEngineDataPtr e = engine( sourcePath, context );
+	const size_t instanceDepth = e->instanceDepth();
+	if( branchPath.size() < instanceDepth )
+	{
+		// "/instances/<prototypeName>/<chunkName>"
+		h = outPlug()->attributesPlug()->defaultValue()->Object::hash();
+	}
+	else if( branchPath.size() == instanceDepth )
 	{
 		// "/instances/<prototypeName>/<id>"
 		BranchCreator::hashBranchAttributes( sourcePath, branchPath, context, h );
-		ConstEngineDataPtr e = engine( sourcePath, context );
 		if( e->numInstanceAttributes() )
 		{
-			e->instanceAttributesHash( e->pointIndex( branchPath[2] ), h );
+			e->instanceAttributesHash( e->pointIndex( branchPath.back() ), h );
 		}
 		PrototypeScope scope( e.get(), context, &sourcePath, &branchPath );
 		prototypesPlug()->attributesPlug()->hash( h );
@@ -2611,22 +2820,29 @@ void Instancer::hashBranchAttributes( const ScenePath &sourcePath, const ScenePa
 	else
 	{
 		// "/instances/<prototypeName>/<id>/...
-		PrototypeScope scope( enginePlug(), context, &sourcePath, &branchPath );
+		PrototypeScope scope( e.get(), context, &sourcePath, &branchPath );
 		h = prototypesPlug()->attributesPlug()->hash();
 	}
 }
 
 IECore::ConstCompoundObjectPtr Instancer::computeBranchAttributes( const ScenePath &sourcePath, const ScenePath &branchPath, const Gaffer::Context *context ) const
 {
-	if( branchPath.size() <= 2 )
+	if( branchPath.size() < 3 )
 	{
 		// "/" or "/instances" or "/instances/<prototypeName>"
 		return outPlug()->attributesPlug()->defaultValue();
 	}
-	else if( branchPath.size() == 3 )
+
+	ConstEngineDataPtr e = engine( sourcePath, context );
+	const size_t instanceDepth = e->instanceDepth();
+	if( branchPath.size() < instanceDepth )
+	{
+		// "/instances/<prototypeName>/<chunkName>"
+		return outPlug()->attributesPlug()->defaultValue();
+	}
+	else if( branchPath.size() == instanceDepth )
 	{
 		// "/instances/<prototypeName>/<id>"
-		ConstEngineDataPtr e = engine( sourcePath, context );
 		PrototypeScope scope( e.get(), context, &sourcePath, &branchPath );
 		ConstCompoundObjectPtr prototypeAttrs = prototypesPlug()->attributesPlug()->getValue();
 		if( e->numInstanceAttributes() )
@@ -2634,7 +2850,7 @@ IECore::ConstCompoundObjectPtr Instancer::computeBranchAttributes( const ScenePa
 			CompoundObjectPtr result = new CompoundObject;
 			result->members() = prototypeAttrs->members();
 
-			e->instanceAttributes( e->pointIndex( branchPath[2] ), *result );
+			e->instanceAttributes( e->pointIndex( branchPath.back() ), *result );
 			return result;
 		}
 		else
@@ -2645,7 +2861,7 @@ IECore::ConstCompoundObjectPtr Instancer::computeBranchAttributes( const ScenePa
 	else
 	{
 		// "/instances/<prototypeName>/<id>/...
-		PrototypeScope scope( enginePlug(), context, &sourcePath, &branchPath );
+		PrototypeScope scope( e.get(), context, &sourcePath, &branchPath );
 		return prototypesPlug()->attributesPlug()->getValue();
 	}
 }
@@ -2659,15 +2875,16 @@ bool Instancer::affectsBranchObject( const Gaffer::Plug *input ) const
 {
 	return
 		input == prototypesPlug()->objectPlug() ||
+		input == chunkSizePlug() ||
 		input == enginePlug()
 	;
 }
 
 void Instancer::hashBranchObject( const ScenePath &sourcePath, const ScenePath &branchPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	if( branchPath.size() <= 2 )
+	if( branchPath.size() < instanceDepth( sourcePath, context ) )
 	{
-		// "/" or "/instances" or "/instances/<prototypeName>"
+		// "/" or "/instances" or "/instances/<prototypeName>" or "/instances/<prototypeName>/<chunkName>"
 		h = outPlug()->objectPlug()->defaultValue()->Object::hash();
 	}
 	else
@@ -2680,9 +2897,9 @@ void Instancer::hashBranchObject( const ScenePath &sourcePath, const ScenePath &
 
 IECore::ConstObjectPtr Instancer::computeBranchObject( const ScenePath &sourcePath, const ScenePath &branchPath, const Gaffer::Context *context ) const
 {
-	if( branchPath.size() <= 2 )
+	if( branchPath.size() < instanceDepth( sourcePath, context ) )
 	{
-		// "/" or "/instances" or "/instances/<prototypeName>"
+		// "/" or "/instances" or "/instances/<prototypeName>" or "/instances/<prototypeName>/<chunkName>"
 		return outPlug()->objectPlug()->defaultValue();
 	}
 	else
@@ -2755,6 +2972,7 @@ bool Instancer::affectsBranchChildNames( const Gaffer::Plug *input ) const
 {
 	return
 		input == namePlug() ||
+		input == chunkSizePlug() ||
 		input == engineSplitPrototypesPlug()
 	;
 }
@@ -2783,6 +3001,13 @@ void Instancer::hashBranchChildNames( const ScenePath &sourcePath, const ScenePa
 		PrototypeScope scope( enginePlug(), context, &sourcePath, &branchPath );
 		h.append( prototypesPlug()->existsPlug()->hash() );
 	}
+	else if( branchPath.size() < instanceDepth( sourcePath, context ) )
+	{
+		// "/instances/<prototypeName>/<chunkName>"
+		BranchCreator::hashBranchChildNames( sourcePath, branchPath, context, h );
+		engineSplitPrototypesHash( sourcePath, context, h );
+		h.append( branchPath.data() + 1, branchPath.size() - 1 );
+	}
 	else
 	{
 		// "/instances/<prototypeName>/<id>/..."
@@ -2815,17 +3040,6 @@ IECore::ConstInternedStringVectorDataPtr Instancer::computeBranchChildNames( con
 		// "/instances/<prototypeName>"
 
 		ConstEngineSplitPrototypesDataPtr esp = engineSplitPrototypes( sourcePath, context );
-
-		const std::vector<size_t> &pointIndicesForPrototype = esp->pointIndicesForPrototype( branchPath.back() );
-
-		// The children of the prototypeName are all the instances which use this prototype,
-		// which we can query from the engine - however the names we output under use
-		// the ids, not the point indices, and must be sorted. So we need to allocate a
-		// temp buffer of integer ids, before converting to strings.
-
-		std::vector<int64_t> ids;
-		ids.reserve( pointIndicesForPrototype.size() );
-
 		const EngineData *engineData = esp->engine();
 
 		PrototypeScope scope( engineData, context, &sourcePath, &branchPath );
@@ -2840,24 +3054,21 @@ IECore::ConstInternedStringVectorDataPtr Instancer::computeBranchChildNames( con
 			);
 		}
 
-		for( size_t q : pointIndicesForPrototype )
+		if( engineData->instanceDepth() > 3 )
 		{
-			ids.push_back( engineData->instanceId( q ) );
+			// The children of the prototypeName are the chunks containing its instances.
+			return esp->chunkNames( branchPath.back() );
 		}
 
-		// Sort ids before converting to string ( they have already been uniquified but not sorted by
-		// the EngineData which uses a hash table )
-		std::sort( ids.begin(), ids.end() );
-
-		InternedStringVectorDataPtr childNamesData = new InternedStringVectorData;
-		std::vector<InternedString> &childNames = childNamesData->writable();
-		childNames.reserve( ids.size() );
-		for( int64_t id : ids )
-		{
-			childNames.emplace_back( id );
-		}
-
-		return childNamesData;
+		// The children of the prototypeName are all the instances which use this prototype,
+		// which we can query from the engine.
+		return engineData->instanceNames( esp->pointIndicesForPrototype( branchPath.back() ) );
+	}
+	else if( branchPath.size() < instanceDepth( sourcePath, context ) )
+	{
+		// "/instances/<prototypeName>/<chunkName>"
+		ConstEngineSplitPrototypesDataPtr esp = engineSplitPrototypes( sourcePath, context );
+		return esp->engine()->instanceNames( esp->pointIndicesForChunk( branchPath[1], branchPath[2] ) );
 	}
 	else
 	{
@@ -2985,20 +3196,41 @@ IECore::ConstPathMatcherDataPtr Instancer::computeBranchSet( const ScenePath &so
 	PathMatcherDataPtr outputSetData = new PathMatcherData;
 	PathMatcher &outputSet = outputSetData->writable();
 
-	vector<InternedString> branchPath( { namePlug()->getValue(), InternedString(), InternedString() } );
+	vector<InternedString> branchPath( engine->instanceDepth() );
+	branchPath[0] = namePlug()->getValue();
 
 	for( const auto &prototypeName : engine->prototypeNames()->readable() )
 	{
-		const std::vector<size_t> &pointIndicesForPrototype = esp->pointIndicesForPrototype( prototypeName );
-
 		ScenePlug::ScenePath prototypeRootStorage;
 		PathMatcher instanceSet = inputSet->readable().subTree( *engine->prototypeRoot( prototypeName, sourcePath, prototypeRootStorage ) );
+		if( instanceSet.isEmpty() )
+		{
+			// None of the instances of this prototype are in the set, so there's
+			// no need to visit them. This is common when sets are only defined on
+			// some of the prototypes, and saves a lot of time with many instances.
+			continue;
+		}
 		branchPath[1] = prototypeName;
 
-		for( const size_t &index : pointIndicesForPrototype )
+		auto addInstances = [&] ( const std::vector<size_t> &pointIndices ) {
+			for( const size_t &index : pointIndices )
+			{
+				branchPath.back() = engine->instanceId( index );
+				outputSet.addPaths( instanceSet, branchPath );
+			}
+		};
+
+		if( engine->instanceDepth() > 3 )
+		{
+			for( const auto &chunkName : esp->chunkNames( prototypeName )->readable() )
+			{
+				branchPath[2] = chunkName;
+				addInstances( esp->pointIndicesForChunk( prototypeName, chunkName ) );
+			}
+		}
+		else
 		{
-			branchPath[2] = engine->instanceId( index );
-			outputSet.addPaths( instanceSet, branchPath );
+			addInstances( esp->pointIndicesForPrototype( prototypeName ) );
 		}
 	}
 
@@ -3050,6 +3282,21 @@ void Instancer::engineSplitPrototypesHash( const ScenePath &sourcePath, const Ga
 	engineSplitPrototypesPlug()->hash( h );
 }
 
+size_t Instancer::instanceDepth( const ScenePath &sourcePath, const Gaffer::Context *context ) const
+{
+	if( !chunkSizePlug()->getInput() )
+	{
+		// Common case. Without an input the value can't vary with context,
+		// so we don't need to pay for a PathScope at every location.
+		return chunkSizePlug()->getValue() > 0.0f ? 4 : 3;
+	}
+
+	// Evaluated in the same context as the engine, so that we always agree with
+	// `EngineData::instanceDepth()`.
+	ScenePlug::PathScope scope( context, &sourcePath );
+	return chunkSizePlug()->getValue() > 0.0f ? 4 : 3;
+}
+
 const std::type_info &Instancer::instancerCapsuleTypeInfo()
 {
 	return typeid( InstancerCapsule );
@@ -3081,13 +3328,14 @@ void Instancer::PrototypeScope::setPrototype( const EngineData *engine, const Sc
 	m_prototypePath.resize( 0 );
 	const ScenePlug::ScenePath *prototypeRoot = engine->prototypeRoot( (*branchPath)[1], *sourcePath, m_prototypePath );
 
-	if( branchPath->size() >= 3 && engine->hasContextVariables() )
+	const size_t instanceDepth = engine->instanceDepth();
+	if( branchPath->size() >= instanceDepth && engine->hasContextVariables() )
 	{
-		const size_t pointIndex = engine->pointIndex( (*branchPath)[2] );
+		const size_t pointIndex = engine->pointIndex( (*branchPath)[instanceDepth - 1] );
 		engine->setPrototypeContextVariables( pointIndex, *this );
 	}
 
-	if( branchPath->size() > 3 )
+	if( branchPath->size() > instanceDepth )
 	{
 		if( !m_prototypePath.size() )
 		{
@@ -3095,8 +3343,8 @@ void Instancer::PrototypeScope::setPrototype( const EngineData *engine, const Sc
 			// m_prototypePath.
 			m_prototypePath = *prototypeRoot;
 		}
-		m_prototypePath.reserve( prototypeRoot->size() + branchPath->size() - 3 );
-		m_prototypePath.insert( m_prototypePath.end(), branchPath->begin() + 3, branchPath->end() );
+		m_prototypePath.reserve( prototypeRoot->size() + branchPath->size() - instanceDepth );
+		m_prototypePath.insert( m_prototypePath.end(), branchPath->begin() + instanceDepth, branchPath->end() );
 		set( ScenePlug::scenePathContextName, &m_prototypePath );
 	}
 	else
@@ -100,6 +100,15 @@ const FilterPlug *PathFilter::rootsPlug() const
 	return getChild<FilterPlug>( g_firstPlugIndex + 1 );
 }
 
+IECore::ConstPathMatcherDataPtr PathFilter::constantPathMatcher() const
+{
+	if( rootsPlug()->getInput() )
+	{
+		return nullptr;
+	}
+	return m_pathMatcher;
+}
+
 Gaffer::PathMatcherDataPlug *PathFilter::pathMatcherPlug()
 {
 	return getChild<PathMatcherDataPlug>( g_firstPlugIndex + 2 );
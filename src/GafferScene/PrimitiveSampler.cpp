@@ -42,6 +42,8 @@
 #include "IECoreScene/MeshPrimitive.h"
 #include "IECoreScene/PrimitiveEvaluator.h"
 
+#include "IECore/NullObject.h"
+
 #include "tbb/parallel_for.h"
 
 using namespace std;
@@ -61,6 +63,46 @@ namespace
 
 using OutputVariableFunction = std::function<void ( size_t, const PrimitiveEvaluator::Result & )>;
 
+// Wraps a PrimitiveEvaluator so that it can be stored in the compute cache,
+// with its memory usage accounted for.
+class EvaluatorData : public IECore::Data
+{
+
+	public :
+
+		EvaluatorData( const PrimitiveEvaluatorPtr &evaluator )
+			:	m_evaluator( evaluator )
+		{
+		}
+
+		const PrimitiveEvaluator *evaluator() const
+		{
+			return m_evaluator.get();
+		}
+
+	protected :
+
+		void memoryUsage( Object::MemoryAccumulator &accumulator ) const override
+		{
+			Data::memoryUsage( accumulator );
+			if( m_evaluator )
+			{
+				// We don't have any way of querying the size of the acceleration
+				// structures, so this is an underestimate.
+				accumulator.accumulate( m_evaluator->primitive().get() );
+			}
+		}
+
+	private :
+
+		PrimitiveEvaluatorPtr m_evaluator;
+
+};
+
+IE_CORE_DECLAREPTR( EvaluatorData );
+
+const InternedString g_evaluatorHashSeed( "PrimitiveSampler:evaluator" );
+
 M44f matrix( const M44f &transform, GeometricData::Interpretation interpretation )
 {
 	switch( interpretation )
@@ -169,6 +211,7 @@ PrimitiveSampler::PrimitiveSampler( const std::string &name )
 	addChild( new StringPlug( "primitiveVariables" ) );
 	addChild( new StringPlug( "prefix" ) );
 	addChild( new StringPlug( "status" ) );
+	addChild( new ObjectPlug( "__sourceEvaluator", Plug::Out, NullObject::defaultNullObject() ) );
 }
 
 PrimitiveSampler::~PrimitiveSampler()
@@ -225,6 +268,73 @@ const Gaffer::StringPlug *PrimitiveSampler::statusPlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 4 );
 }
 
+Gaffer::ObjectPlug *PrimitiveSampler::sourceEvaluatorPlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::ObjectPlug *PrimitiveSampler::sourceEvaluatorPlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
+void PrimitiveSampler::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
+{
+	Deformer::affects( input, outputs );
+
+	if( input == sourcePlug()->objectPlug() )
+	{
+		outputs.push_back( sourceEvaluatorPlug() );
+	}
+}
+
+void PrimitiveSampler::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	if( output == sourceEvaluatorPlug() )
+	{
+		// Deliberately not calling the base class, so that the hash doesn't
+		// depend on our type or on the node we belong to.
+		h = sourcePlug()->objectPlug()->hash();
+		h.append( g_evaluatorHashSeed );
+		return;
+	}
+
+	Deformer::hash( output, context, h );
+}
+
+void PrimitiveSampler::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const
+{
+	if( output == sourceEvaluatorPlug() )
+	{
+		ConstObjectPtr sourceObject = sourcePlug()->objectPlug()->getValue();
+		ConstPrimitivePtr sourcePrimitive = runTimeCast<const Primitive>( sourceObject.get() );
+		PrimitiveEvaluatorPtr evaluator;
+		if( sourcePrimitive )
+		{
+			if( auto mesh = runTimeCast<const MeshPrimitive>( sourcePrimitive.get() ) )
+			{
+				sourcePrimitive = MeshAlgo::triangulate( mesh, context->canceller() );
+			}
+			evaluator = PrimitiveEvaluator::create( sourcePrimitive );
+		}
+		static_cast<ObjectPlug *>( output )->setValue( new EvaluatorData( evaluator ) );
+		return;
+	}
+
+	Deformer::compute( output, context );
+}
+
+Gaffer::ValuePlug::CachePolicy PrimitiveSampler::computeCachePolicy( const Gaffer::ValuePlug *output ) const
+{
+	if( output == sourceEvaluatorPlug() )
+	{
+		// Building acceleration structures can be expensive, and many
+		// locations may request the same evaluator at once.
+		return ValuePlug::CachePolicy::TaskCollaboration;
+	}
+	return Deformer::computeCachePolicy( output );
+}
+
 bool PrimitiveSampler::affectsProcessedObject( const Gaffer::Plug *input ) const
 {
 	return
@@ -299,23 +409,17 @@ IECore::ConstObjectPtr PrimitiveSampler::computeProcessedObject( const ScenePath
 		return inputObject;
 	}
 
-	ConstObjectPtr sourceObject = sourcePlug()->object( sourcePath );
-	const Primitive *sourcePrimitive = runTimeCast<const Primitive>( sourceObject.get() );
-	if( !sourcePrimitive )
-	{
-		return inputObject;
-	}
-
-	ConstPrimitivePtr preprocessedSourcePrimitive = sourcePrimitive;
-	if( auto mesh = runTimeCast<const MeshPrimitive>( preprocessedSourcePrimitive.get() ) )
+	ConstEvaluatorDataPtr evaluatorData;
 	{
-		preprocessedSourcePrimitive = MeshAlgo::triangulate( mesh, context->canceller() );
+		ScenePlug::PathScope pathScope( context, &sourcePath );
+		evaluatorData = boost::static_pointer_cast<const EvaluatorData>( sourceEvaluatorPlug()->getValue() );
 	}
-	PrimitiveEvaluatorPtr evaluator = PrimitiveEvaluator::create( preprocessedSourcePrimitive );
+	const PrimitiveEvaluator *evaluator = evaluatorData->evaluator();
 	if( !evaluator )
 	{
 		return inputObject;
 	}
+	ConstPrimitivePtr preprocessedSourcePrimitive = evaluator->primitive();
 
 	PrimitivePtr outputPrimitive = inputPrimitive->copy();
 	const size_t size = outputPrimitive->variableSize( outputInterpolation );
@@ -182,6 +182,32 @@ IECore::InternedString g_computeProcessType( ValuePlug::computeProcessType() );
 
 } // namespace
 
+IECore::ConstPathMatcherDataPtr GafferScene::Detail::constantPathMatcher( const FilterPlug *filterPlug )
+{
+	const FilterPlug *source = filterPlug->source<FilterPlug>();
+	auto pathFilter = source ? runTimeCast<const PathFilter>( source->node() ) : nullptr;
+	if( !pathFilter || source != pathFilter->outPlug() )
+	{
+		return nullptr;
+	}
+
+	ConstPathMatcherDataPtr result = pathFilter->constantPathMatcher();
+	if( !result )
+	{
+		return nullptr;
+	}
+
+	// Matches the logic in `Filter::enabled()`, which evaluates
+	// `enabledPlug()` in a global scope.
+	ScenePlug::GlobalScope globalScope( Context::current() );
+	if( !pathFilter->enabledPlug()->getValue() )
+	{
+		return new PathMatcherData;
+	}
+
+	return result;
+}
+
 std::unordered_set<FilteredSceneProcessor *> GafferScene::SceneAlgo::filteredNodes( Filter *filter )
 {
 	std::unordered_set<FilteredSceneProcessor *> result;
@@ -261,6 +287,126 @@ IECore::PathMatcher GafferScene::SceneAlgo::findAllWithAttribute( const ScenePlu
 	);
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Hierarchy
+//////////////////////////////////////////////////////////////////////////
+
+ScenePlug::ScenePath GafferScene::SceneAlgo::Hierarchy::path( size_t index ) const
+{
+	if( index >= names.size() )
+	{
+		throw IECore::Exception( fmt::format( "Index {} out of range", index ) );
+	}
+
+	ScenePlug::ScenePath result;
+	for( int64_t i = index; i > 0; i = parents[i] )
+	{
+		result.push_back( names[i] );
+	}
+	result.insert( result.end(), root.rbegin(), root.rend() );
+	std::reverse( result.begin(), result.end() );
+	return result;
+}
+
+int64_t GafferScene::SceneAlgo::Hierarchy::find( const ScenePlug::ScenePath &path ) const
+{
+	if( names.empty() || path.size() < root.size() || !std::equal( root.begin(), root.end(), path.begin() ) )
+	{
+		return -1;
+	}
+
+	int64_t index = 0;
+	for( auto it = path.begin() + root.size(); it != path.end(); ++it )
+	{
+		auto first = names.begin() + childOffsets[index];
+		auto last = names.begin() + childOffsets[index+1];
+		auto child = std::find( first, last, *it );
+		if( child == last )
+		{
+			return -1;
+		}
+		index = child - names.begin();
+	}
+
+	return index;
+}
+
+namespace
+{
+
+// Bounds the memory used for the `childNames` results which are pending
+// appending to the Hierarchy, while still providing plenty of parallelism.
+const size_t g_hierarchyBatchSize = 16384;
+
+} // namespace
+
+SceneAlgo::Hierarchy::Ptr GafferScene::SceneAlgo::hierarchy( const ScenePlug *scene, const ScenePlug::ScenePath &root )
+{
+	Hierarchy::Ptr result = new Hierarchy;
+	result->root = root;
+	result->names.push_back( root.size() ? root.back() : InternedString() );
+	result->parents.push_back( -1 );
+	result->childOffsets.push_back( 1 );
+
+	const ThreadState &threadState = ThreadState::current();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated ); // Prevents outer tasks silently cancelling our tasks
+
+	// We visit the locations in breadth-first order, in batches, fetching
+	// `childNames` for all the locations in a batch in parallel. This avoids
+	// the overhead of spawning tasks and constructing functors for every
+	// location, and allows the results to be appended serially in a
+	// deterministic order. Because the children are appended after the batch,
+	// the locations yet to be visited are always those beyond the end of the
+	// batch. Rather than storing a path per location, each task rebuilds the
+	// path from the parent path plus the name, which only requires a walk up
+	// the hierarchy when moving on to the children of a new parent.
+
+	size_t batchBegin = 0;
+	while( batchBegin < result->size() )
+	{
+		const size_t batchEnd = std::min( batchBegin + g_hierarchyBatchSize, result->size() );
+		vector<ConstInternedStringVectorDataPtr> batchChildNames( batchEnd - batchBegin );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( batchBegin, batchEnd ),
+			[&] ( const tbb::blocked_range<size_t> &range ) {
+				ScenePlug::PathScope pathScope( threadState );
+				ScenePlug::ScenePath path;
+				int64_t pathParent = -2;
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					const int64_t parent = result->parents[i];
+					if( parent == pathParent )
+					{
+						path.back() = result->names[i];
+					}
+					else
+					{
+						path = result->path( i );
+						pathParent = parent;
+					}
+					pathScope.setPath( &path );
+					batchChildNames[i-batchBegin] = scene->childNamesPlug()->getValue();
+				}
+			},
+			taskGroupContext
+		);
+
+		for( size_t i = batchBegin; i < batchEnd; ++i )
+		{
+			for( const auto &childName : batchChildNames[i-batchBegin]->readable() )
+			{
+				result->names.push_back( childName );
+				result->parents.push_back( i );
+			}
+			result->childOffsets.push_back( result->names.size() );
+		}
+
+		batchBegin = batchEnd;
+	}
+
+	return result;
+}
+
 //////////////////////////////////////////////////////////////////////////
 // Globals
 //////////////////////////////////////////////////////////////////////////
@@ -40,6 +40,7 @@
 #include "Gaffer/StringPlug.h"
 #include "Gaffer/TransformPlug.h"
 
+#include "IECoreScene/MeshPrimitive.h"
 #include "IECoreScene/SceneCache.h"
 #include "IECoreScene/SharedSceneInterfaces.h"
 
@@ -67,13 +68,17 @@ GAFFER_NODE_DEFINE_TYPE( SceneReader );
 //////////////////////////////////////////////////////////////////////////
 
 size_t SceneReader::g_firstPlugIndex = 0;
+const IECore::InternedString SceneReader::g_sceneWriterHashAttributeName( "gaffer:sceneWriter:hash" );
 
 namespace
 {
 
 IECore::ConstBoolDataPtr g_trueBoolData = new IECore::BoolData( true );
 const InternedString g_lights( "__lights" );
+const InternedString g_cameras( "__cameras" );
 const InternedString g_defaultLights( "defaultLights" );
+const InternedString g_rendererContextName( "scene:renderer" );
+const std::string g_openGLRendererName( "OpenGL" );
 
 bool shouldEmulateDefaultLightsSet( const IECoreScene::SceneInterface *scene, const vector<InternedString> &setNames )
 {
@@ -165,6 +170,7 @@ SceneReader::SceneReader( const std::string &name )
 	addChild( new IntPlug( "refreshCount" ) );
 	addChild( new StringPlug( "tags" ) );
 	addChild( new TransformPlug( "transform" ) );
+	addChild( new IntPlug( "objectMode", Plug::In, Full, Full, BoundInViewer ) );
 
 	outPlug()->childBoundsPlug()->setFlags( Plug::AcceptsDependencyCycles, true );
 	plugSetSignal().connect( boost::bind( &SceneReader::plugSet, this, ::_1 ) );
@@ -214,6 +220,16 @@ const Gaffer::TransformPlug *SceneReader::transformPlug() const
 	return getChild<TransformPlug>( g_firstPlugIndex + 3 );
 }
 
+Gaffer::IntPlug *SceneReader::objectModePlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::IntPlug *SceneReader::objectModePlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 4 );
+}
+
 void SceneReader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneNode::affects( input, outputs );
@@ -244,10 +260,14 @@ void SceneReader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &ou
 		outputs.push_back( outPlug()->setPlug() );
 	}
 
+	if( affectsScene || input == objectModePlug() )
+	{
+		outputs.push_back( outPlug()->objectPlug() );
+	}
+
 	if( affectsScene )
 	{
 		outputs.push_back( outPlug()->attributesPlug() );
-		outputs.push_back( outPlug()->objectPlug() );
 		outputs.push_back( outPlug()->setNamesPlug() );
 	}
 }
@@ -433,6 +453,10 @@ IECore::ConstCompoundObjectPtr SceneReader::computeAttributes( const ScenePath &
 		{
 			continue;
 		}
+		if( *it == g_sceneWriterHashAttributeName && path.empty() )
+		{
+			continue;
+		}
 
 		ConstObjectPtr attribute = s->readAttribute( *it, timeAsDouble( context ) );
 		if( attribute )
@@ -470,7 +494,15 @@ void SceneReader::hashObject( const ScenePath &path, const Gaffer::Context *cont
 	SceneNode::hashObject( path, context, parent, h );
 
 	h.append( refreshCount );
-	s->hash( SceneInterface::ObjectHash, timeAsDouble( context ), h );
+	if( boundPlaceholder( path, s.get(), context, parent ) )
+	{
+		h.append( "boundPlaceholder" );
+		s->hash( SceneInterface::BoundHash, timeAsDouble( context ), h );
+	}
+	else
+	{
+		s->hash( SceneInterface::ObjectHash, timeAsDouble( context ), h );
+	}
 }
 
 IECore::ConstObjectPtr SceneReader::computeObject( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const
@@ -481,6 +513,16 @@ IECore::ConstObjectPtr SceneReader::computeObject( const ScenePath &path, const
 		return parent->objectPlug()->defaultValue();
 	}
 
+	if( boundPlaceholder( path, s.get(), context, parent ) )
+	{
+		const Box3d bound = s->readBound( timeAsDouble( context ) );
+		if( bound.isEmpty() )
+		{
+			return parent->objectPlug()->defaultValue();
+		}
+		return IECoreScene::MeshPrimitive::createBox( Box3f( bound.min, bound.max ) );
+	}
+
 	ConstObjectPtr o = s->readObject( timeAsDouble( context ), context->canceller() );
 	// We checked `hasObject()` already, so we shouldn't _really_ get a nullptr
 	// here. But it can currently happen in at least one circumstance : when a
@@ -715,6 +757,57 @@ void SceneReader::plugSet( Gaffer::Plug *plug )
 	}
 }
 
+bool SceneReader::boundPlaceholder( const ScenePath &path, const IECoreScene::SceneInterface *s, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	ObjectMode objectMode;
+	{
+		ScenePlug::GlobalScope globalScope( context );
+		objectMode = (ObjectMode)objectModePlug()->getValue();
+	}
+
+	switch( objectMode )
+	{
+		case Bound :
+			break;
+		case BoundInViewer :
+			if( context->get<std::string>( g_rendererContextName, "" ) != g_openGLRendererName )
+			{
+				return false;
+			}
+			break;
+		default :
+			return false;
+	}
+
+	// Files without stored bounds fall back to a full load, because
+	// we'd need to load the object to compute the bound anyway.
+	if( !s->hasBound() )
+	{
+		return false;
+	}
+
+	// The stored bound includes the bounds of any descendants, so
+	// is only a faithful placeholder for leaf locations.
+	SceneInterface::NameList childNames;
+	s->childNames( childNames );
+	if( !childNames.empty() )
+	{
+		return false;
+	}
+
+	// Cameras and lights are cheap to load, and are not meaningfully
+	// represented by a box.
+	for( const auto &setName : { g_cameras, g_lights } )
+	{
+		if( parent->set( setName )->readable().match( path ) & PathMatcher::ExactMatch )
+		{
+			return false;
+		}
+	}
+
+	return true;
+}
+
 ConstSceneInterfacePtr SceneReader::scene( const ScenePath &path, const Gaffer::Context *context, int *refreshCount, std::string *tags ) const
 {
 	ScenePlug::GlobalScope globalScope( context );
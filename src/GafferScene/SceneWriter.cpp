@@ -44,7 +44,13 @@
 
 #include "IECoreScene/SceneInterface.h"
 
+#include "IECore/MessageHandler.h"
+#include "IECore/SimpleTypedData.h"
+
+#include "fmt/format.h"
+
 #include <filesystem>
+#include <map>
 #include <unordered_map>
 
 using namespace std;
@@ -62,10 +68,24 @@ struct LocationData
 		:	m_path( path ),
 			m_attributes( scene->attributesPlug()->getValue() ),
 			m_object( scene->objectPlug()->getValue() ),
-			m_bound( scene->boundPlug()->getValue() ),
-			m_transform( scene->transformPlug()->getValue() ),
 			m_childNames( scene->childNamesPlug()->getValue() )
 	{
+		// Convert bound and transform here rather than in `write()`,
+		// so that the work is done in parallel.
+		const Imath::Box3f bound = scene->boundPlug()->getValue();
+		m_bound = Imath::Box3d( Imath::V3d( bound.min ), Imath::V3d( bound.max ) );
+
+		if( m_path.size() )
+		{
+			const Imath::M44f m = scene->transformPlug()->getValue();
+			m_transform = new IECore::M44dData( Imath::M44d (
+				m[0][0], m[0][1], m[0][2], m[0][3],
+				m[1][0], m[1][1], m[1][2], m[1][3],
+				m[2][0], m[2][1], m[2][2], m[2][3],
+				m[3][0], m[3][1], m[3][2], m[3][3]
+			) );
+		}
+
 		if( setsForTags )
 		{
 			const CompoundDataMap &setsMap = setsForTags->readable();
@@ -82,30 +102,27 @@ struct LocationData
 		}
 	}
 
-	void write( IECoreScene::SceneInterface *root, float time ) const
+	const ScenePlug::ScenePath &path() const
 	{
-		SceneInterfacePtr scene = root;
-		for( auto &p : m_path )
-		{
-			scene = scene->child( p, SceneInterface::CreateIfMissing );
-		}
+		return m_path;
+	}
 
+	// Writes to `scene`, which must be the SceneInterface for `path()`. The
+	// SceneInterfaces for the children are created here, and passed to
+	// `childFunctor( childName, childScene )`.
+	template<typename ChildFunctor>
+	void write( IECoreScene::SceneInterface *scene, float time, ChildFunctor &&childFunctor ) const
+	{
 		if( m_object->typeId() != IECore::NullObjectTypeId && m_path.size() > 0 )
 		{
 			scene->writeObject( m_object.get(), time );
 		}
 
-		scene->writeBound( Imath::Box3d( Imath::V3f( m_bound.min ), Imath::V3f( m_bound.max ) ), time );
+		scene->writeBound( m_bound, time );
 
-		if( m_path.size() )
+		if( m_transform )
 		{
-			M44dDataPtr td = new IECore::M44dData( Imath::M44d (
-				m_transform[0][0], m_transform[0][1], m_transform[0][2], m_transform[0][3],
-				m_transform[1][0], m_transform[1][1], m_transform[1][2], m_transform[1][3],
-				m_transform[2][0], m_transform[2][1], m_transform[2][2], m_transform[2][3],
-				m_transform[3][0], m_transform[3][1], m_transform[3][2], m_transform[3][3]
-			) );
-			scene->writeTransform( td.get(), time );
+			scene->writeTransform( m_transform.get(), time );
 		}
 
 		for( const auto &[name, value] : m_attributes->members() )
@@ -123,7 +140,7 @@ struct LocationData
 			// `SceneAlgo::parallelGatherLocations()` may visit children in any
 			// order. Pre-create SceneInterface children here so that they are
 			// created in the correct order.
-			scene->child( childName, SceneInterface::CreateIfMissing );
+			childFunctor( childName, scene->child( childName, SceneInterface::CreateIfMissing ) );
 		}
 	}
 
@@ -132,13 +149,72 @@ struct LocationData
 		ScenePlug::ScenePath m_path;
 		ConstCompoundObjectPtr m_attributes;
 		ConstObjectPtr m_object;
-		Imath::Box3f m_bound;
-		Imath::M44f m_transform;
+		Imath::Box3d m_bound;
+		ConstM44dDataPtr m_transform;
 		ConstInternedStringVectorDataPtr m_childNames;
 		SceneInterface::NameList m_tags;
 
 };
 
+// Hash of everything written to a file for `frames`. Note that this is
+// only as good as the hashes of the upstream nodes, which don't account for
+// the contents of external files, and in some cases are specific to the
+// current process.
+IECore::MurmurHash outputHash( const ScenePlug *scene, const std::vector<float> &frames )
+{
+	IECore::MurmurHash h;
+	Context::EditableScope scope( Context::current() );
+	for( auto frame : frames )
+	{
+		scope.setFrame( frame );
+		h.append( frame );
+		h.append( SceneAlgo::hierarchyHash( scene, ScenePlug::ScenePath() ) );
+		h.append( scene->globalsHash() );
+	}
+
+	// Sets are only written for the first frame.
+	scope.setFrame( frames.front() );
+	ConstInternedStringVectorDataPtr setNames = scene->setNames();
+	for( const auto &setName : setNames->readable() )
+	{
+		h.append( setName );
+		h.append( scene->setHash( setName ) );
+	}
+
+	return h;
+}
+
+// Returns the hash stored by a previous execution, or an empty
+// string if there isn't one.
+std::string storedHash( const std::string &fileName, float frame, const InternedString &attributeName )
+{
+	if( !std::filesystem::exists( fileName ) )
+	{
+		return "";
+	}
+
+	Context::EditableScope scope( Context::current() );
+	scope.setFrame( frame );
+
+	try
+	{
+		ConstSceneInterfacePtr file = SceneInterface::create( fileName, IndexedIO::Read );
+		if( !file->hasAttribute( attributeName ) )
+		{
+			return "";
+		}
+		ConstStringDataPtr hash = runTimeCast<const StringData>(
+			file->readAttribute( attributeName, scope.context()->getTime() )
+		);
+		return hash ? hash->readable() : "";
+	}
+	catch( ... )
+	{
+		// Unreadable files are simply rewritten.
+		return "";
+	}
+}
+
 } // namespace
 
 GAFFER_NODE_DEFINE_TYPE( SceneWriter );
@@ -152,6 +228,7 @@ SceneWriter::SceneWriter( const std::string &name )
 	addChild( new ScenePlug( "in", Plug::In ) );
 	addChild( new StringPlug( "fileName" ) );
 	addChild( new ScenePlug( "out", Plug::Out, Plug::Default & ~Plug::Serialisable ) );
+	addChild( new BoolPlug( "skipUnchanged" ) );
 	outPlug()->setInput( inPlug() );
 }
 
@@ -189,6 +266,16 @@ const ScenePlug *SceneWriter::outPlug() const
 	return getChild<ScenePlug>( g_firstPlugIndex + 2 );
 }
 
+BoolPlug *SceneWriter::skipUnchangedPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 3 );
+}
+
+const BoolPlug *SceneWriter::skipUnchangedPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 3 );
+}
+
 IECore::MurmurHash SceneWriter::hash( const Gaffer::Context *context ) const
 {
 	const ScenePlug *scenePlug = inPlug()->source<ScenePlug>();
@@ -199,6 +286,7 @@ IECore::MurmurHash SceneWriter::hash( const Gaffer::Context *context ) const
 
 	IECore::MurmurHash h = TaskNode::hash( context );
 	h.append( fileNamePlug()->hash() );
+	h.append( skipUnchangedPlug()->hash() );
 	/// \todo hash the actual scene when we have a hierarchyHash
 	h.append( (uint64_t)scenePlug );
 	h.append( context->hash() );
@@ -220,24 +308,71 @@ void SceneWriter::executeSequence( const std::vector<float> &frames ) const
 		throw IECore::Exception( "No input scene" );
 	}
 
-	SceneInterfacePtr output;
+	// Group frames by the file they are written to.
+
+	std::vector<std::pair<std::string, std::vector<float>>> files;
+	bool skipUnchanged;
+	{
+		Context::EditableScope scope( Context::current() );
+		for( auto frame : frames )
+		{
+			scope.setFrame( frame );
+			const std::string fileName = fileNamePlug()->getValue();
+			if( files.empty() || files.back().first != fileName )
+			{
+				files.push_back( { fileName, {} } );
+			}
+			files.back().second.push_back( frame );
+		}
+
+		skipUnchanged = skipUnchangedPlug()->getValue();
+	}
+
+	for( const auto &[fileName, fileFrames] : files )
+	{
+		MurmurHash fileHash;
+		if( skipUnchanged )
+		{
+			fileHash = outputHash( scene, fileFrames );
+			if( storedHash( fileName, fileFrames.front(), SceneReader::g_sceneWriterHashAttributeName ) == fileHash.toString() )
+			{
+				continue;
+			}
+		}
+
+		writeFile( scene, fileName, fileFrames, fileHash );
+	}
+}
+
+void SceneWriter::writeFile( const ScenePlug *scene, const std::string &fileName, const std::vector<float> &frames, const IECore::MurmurHash &fileHash ) const
+{
+	createDirectories( fileName );
+	SceneInterfacePtr output = SceneInterface::create( fileName, IndexedIO::Write );
+	const bool useSetsAPI = SceneReader::useSetsAPI( output.get() );
+
 	Context::EditableScope scope( Context::current() );
+	ConstCompoundDataPtr sets;
 
 	for( auto frame : frames )
 	{
 		scope.setFrame( frame );
 
-		ConstCompoundDataPtr sets;
-		bool useSetsAPI = true;
-		const std::string fileName = fileNamePlug()->getValue();
-		if( !output || output->fileName() != fileName )
+		if( frame == frames.front() )
 		{
-			createDirectories( fileName );
-			output = SceneInterface::create( fileName, IndexedIO::Write );
 			sets = SceneAlgo::sets( scene );
-			useSetsAPI = SceneReader::useSetsAPI( output.get() );
+		}
+		else
+		{
+			sets = nullptr;
 		}
 
+		// SceneInterfaces for locations that are yet to be written, created
+		// in advance by their parents. Writing is serial, so this is worthwhile
+		// because it saves walking down the output hierarchy from the root for
+		// every single location. Entries are removed as they are used.
+		std::map<ScenePlug::ScenePath, SceneInterfacePtr> pendingScenes;
+		const float time = scope.context()->getTime();
+
 		SceneAlgo::parallelGatherLocations(
 
 			scene,
@@ -252,7 +387,31 @@ void SceneWriter::executeSequence( const std::vector<float> &frames ) const
 			// thread-safe for writing.
 
 			[&] ( const LocationData &locationData ) {
-				locationData.write( output.get(), scope.context()->getTime() );
+				const ScenePlug::ScenePath &path = locationData.path();
+				SceneInterfacePtr locationScene;
+				auto it = pendingScenes.find( path );
+				if( it != pendingScenes.end() )
+				{
+					locationScene = it->second;
+					pendingScenes.erase( it );
+				}
+				else
+				{
+					locationScene = output;
+					for( const auto &name : path )
+					{
+						locationScene = locationScene->child( name, SceneInterface::CreateIfMissing );
+					}
+				}
+
+				locationData.write(
+					locationScene.get(), time,
+					[&] ( const InternedString &childName, SceneInterfacePtr &&childScene ) {
+						ScenePlug::ScenePath childPath = path;
+						childPath.push_back( childName );
+						pendingScenes[childPath] = std::move( childScene );
+					}
+				);
 			}
 
 		);
@@ -270,7 +429,26 @@ void SceneWriter::executeSequence( const std::vector<float> &frames ) const
 		{
 			output->writeAttribute( "gaffer:globals", globals.get(), scope.context()->getTime() );
 		}
+	}
 
+	if( fileHash != MurmurHash() )
+	{
+		scope.setFrame( frames.front() );
+		try
+		{
+			output->writeAttribute(
+				SceneReader::g_sceneWriterHashAttributeName, new StringData( fileHash.toString() ), scope.context()->getTime()
+			);
+		}
+		catch( const std::exception &e )
+		{
+			// Not all formats support attributes at the root. The file is
+			// still valid, it just can't be skipped next time.
+			IECore::msg(
+				IECore::Msg::Warning, "SceneWriter",
+				fmt::format( "Unable to store hash in \"{}\" : {}", fileName, e.what() )
+			);
+		}
 	}
 }
 
@@ -40,6 +40,8 @@
 
 #include "GafferScene/SetAlgo.h"
 
+#include "Gaffer/Private/IECorePreview/LRUCache.h"
+
 #include "IECore/MessageHandler.h"
 
 #include "boost/algorithm/string/predicate.hpp"
@@ -53,6 +55,8 @@
 
 #include "fmt/format.h"
 
+#include <memory>
+
 using namespace IECore;
 using namespace Gaffer;
 using namespace GafferScene;
@@ -239,13 +243,14 @@ struct AstEvaluator
 		PathMatcher left = boost::apply_visitor( *this, expr.left );
 		PathMatcher right = boost::apply_visitor( *this, expr.right );
 
+		// `left` is our own copy, so where possible we modify it in place
+		// rather than making another copy for the result.
 		switch( expr.op )
 		{
 			case Union :
 			{
-				PathMatcher result = PathMatcher( left );
-				result.addPaths( right );
-				return result;
+				left.addPaths( right );
+				return left;
 			}
 			case Intersection :
 			{
@@ -253,9 +258,8 @@ struct AstEvaluator
 			}
 			case Difference :
 			{
-				PathMatcher result = PathMatcher( left );
-				result.removePaths( right );
-				return result;
+				left.removePaths( right );
+				return left;
 			}
 			case In :
 			{
@@ -482,6 +486,32 @@ void expressionToAST( const std::string &setExpression, ExpressionAst &ast)
 	}
 }
 
+// Parsing Cache
+// -------------
+//
+// The same expressions are typically evaluated and hashed many times over,
+// so we cache the results of parsing rather than constructing a grammar
+// and reparsing every time. Syntax errors are cached by the LRUCache too,
+// and are rethrown on subsequent lookups.
+
+using ConstExpressionAstPtr = std::shared_ptr<const ExpressionAst>;
+
+ConstExpressionAstPtr expressionAstGetter( const std::string &setExpression, size_t &cost, const IECore::Canceller *canceller )
+{
+	auto ast = std::make_shared<ExpressionAst>();
+	expressionToAST( setExpression, *ast );
+	cost = 1;
+	return ast;
+}
+
+using ExpressionAstCache = IECorePreview::LRUCache<std::string, ConstExpressionAstPtr>;
+
+ExpressionAstCache &expressionAstCache()
+{
+	static ExpressionAstCache *c = new ExpressionAstCache( expressionAstGetter, 1000 );
+	return *c;
+}
+
 } // namespace
 
 namespace GafferScene
@@ -492,18 +522,16 @@ namespace SetAlgo
 
 PathMatcher evaluateSetExpression( const std::string &setExpression, const ScenePlug *scene )
 {
-	ExpressionAst ast;
-	expressionToAST( setExpression, ast );
-	return boost::apply_visitor( AstEvaluator( scene ), ast );
+	ConstExpressionAstPtr ast = expressionAstCache().get( setExpression );
+	return boost::apply_visitor( AstEvaluator( scene ), *ast );
 }
 
 void setExpressionHash( const std::string &setExpression, const ScenePlug* scene, IECore::MurmurHash &h )
 {
-	ExpressionAst ast;
-	expressionToAST( setExpression, ast );
+	ConstExpressionAstPtr ast = expressionAstCache().get( setExpression );
 
 	AstHasher hasher = AstHasher( scene, h );
-	boost::apply_visitor( hasher, ast );
+	boost::apply_visitor( hasher, *ast );
 }
 
 IECore::MurmurHash setExpressionHash( const std::string &setExpression, const ScenePlug* scene)
@@ -69,6 +69,11 @@ int match( const FilterPlug &plug, const ScenePlug &scene )
 	return plug.match( &scene );
 }
 
+IECore::PathMatcherDataPtr constantPathMatcher( const PathFilter &filter )
+{
+	IECore::ConstPathMatcherDataPtr result = filter.constantPathMatcher();
+	return result ? result->copy() : nullptr;
+}
 
 } // namespace
 
@@ -105,7 +110,9 @@ void GafferSceneModule::bindFilter()
 		.def( "match", &match )
 	;
 
-	GafferBindings::DependencyNodeClass<PathFilter>();
+	GafferBindings::DependencyNodeClass<PathFilter>()
+		.def( "constantPathMatcher", &constantPathMatcher )
+	;
 	GafferBindings::DependencyNodeClass<FilterProcessor>();
 	GafferBindings::DependencyNodeClass<UnionFilter>();
 	GafferBindings::DependencyNodeClass<SetFilter>();
@@ -45,6 +45,7 @@
 
 #include "GafferBindings/DependencyNodeBinding.h"
 
+using namespace boost::python;
 using namespace GafferScene;
 
 namespace
@@ -69,10 +70,18 @@ boost::python::list supportedExtensions()
 void GafferSceneModule::bindIO()
 {
 
-	GafferBindings::DependencyNodeClass<SceneReader>()
-		.def( "supportedExtensions", &supportedExtensions )
-		.staticmethod( "supportedExtensions" )
-	;
+	{
+		scope s = GafferBindings::DependencyNodeClass<SceneReader>()
+			.def( "supportedExtensions", &supportedExtensions )
+			.staticmethod( "supportedExtensions" )
+		;
+
+		enum_<SceneReader::ObjectMode>( "ObjectMode" )
+			.value( "Full", SceneReader::Full )
+			.value( "Bound", SceneReader::Bound )
+			.value( "BoundInViewer", SceneReader::BoundInViewer )
+		;
+	}
 
 	using SceneWriterWrapper = GafferDispatchBindings::TaskNodeWrapper<SceneWriter>;
 	GafferDispatchBindings::TaskNodeClass<SceneWriter, SceneWriterWrapper>();
@@ -198,6 +198,48 @@ Imath::V2f shutterWrapper( const IECore::CompoundObject &globals, const ScenePlu
 	return SceneAlgo::shutter( &globals, &scene );
 }
 
+SceneAlgo::Hierarchy::Ptr hierarchyWrapper( const ScenePlug &scene, const ScenePlug::ScenePath &root )
+{
+	IECorePython::ScopedGILRelease r;
+	return SceneAlgo::hierarchy( &scene, root );
+}
+
+size_t hierarchyIndex( const SceneAlgo::Hierarchy &h, int64_t index )
+{
+	if( index < 0 || index >= (int64_t)h.size() )
+	{
+		PyErr_SetString( PyExc_IndexError, "Index out of range" );
+		throw_error_already_set();
+	}
+	return index;
+}
+
+std::string hierarchyName( const SceneAlgo::Hierarchy &h, int64_t index )
+{
+	return h.names[hierarchyIndex( h, index )].string();
+}
+
+int64_t hierarchyParent( const SceneAlgo::Hierarchy &h, int64_t index )
+{
+	return h.parents[hierarchyIndex( h, index )];
+}
+
+list hierarchyChildren( const SceneAlgo::Hierarchy &h, int64_t index )
+{
+	const size_t i = hierarchyIndex( h, index );
+	list result;
+	for( size_t c = h.childOffsets[i]; c < h.childOffsets[i+1]; ++c )
+	{
+		result.append( c );
+	}
+	return result;
+}
+
+std::string hierarchyPath( const SceneAlgo::Hierarchy &h, int64_t index )
+{
+	return ScenePlug::pathToString( h.path( hierarchyIndex( h, index ) ) );
+}
+
 bool setExistsWrapper( const ScenePlug &scene, const IECore::InternedString &setName )
 {
 	IECorePython::ScopedGILRelease r;
@@ -437,6 +479,17 @@ void bindSceneAlgo()
 	def( "findAll", &findAllWrapper, ( arg( "scene" ), arg( "predicate" ), arg( "root" ) = "/" ) );
 	def( "findAllWithAttribute", &findAllWithAttributeWrapper, ( arg( "scene" ), arg( "name" ), arg( "value" ) = object(), arg( "root" ) = "/" ) );
 
+	IECorePython::RefCountedClass<SceneAlgo::Hierarchy, IECore::RefCounted>( "Hierarchy" )
+		.def( "__len__", &SceneAlgo::Hierarchy::size )
+		.def( "name", &hierarchyName )
+		.def( "parent", &hierarchyParent )
+		.def( "children", &hierarchyChildren )
+		.def( "path", &hierarchyPath )
+		.def( "find", &SceneAlgo::Hierarchy::find )
+	;
+
+	def( "hierarchy", &hierarchyWrapper, ( arg( "scene" ), arg( "root" ) = "/" ) );
+
 	def( "shutter", &shutterWrapper );
 	def( "setExists", &setExistsWrapper );
 	def(